@@ -1,6 +1,10 @@
 from rest_framework import serializers
 
-from apps.products.models import Product, ProductImage
+from apps.products.models import Product
+from apps.products.serializers.product.like_state import (
+    LikeStateListSerializer,
+    LikeStateMixin,
+)
 from apps.stores.models import Store
 from apps.stores.serializers import StoreSerializer
 
@@ -8,25 +12,22 @@ from .models import CartItem
 from .services import CartService
 
 
-class _CartProductSerializer(serializers.ModelSerializer):
+class _CartProductSerializer(LikeStateMixin, serializers.ModelSerializer):
     """
     장바구니 내부에 표시될 상품 정보를 위한 내부 시리얼라이저.
     Product가 drink인지 package인지에 따라 이름과 이미지를 가져옵니다.
     """
 
     main_image = serializers.SerializerMethodField()
+    is_liked = serializers.SerializerMethodField()
 
     class Meta:
         model = Product
-        fields = ["id", "name", "price", "main_image"]
+        fields = ["id", "name", "price", "main_image", "is_liked"]
 
     def get_main_image(self, obj):
         """상품의 메인 이미지를 반환합니다."""
-        try:
-            image = ProductImage.objects.filter(product=obj, is_main=True).first()
-            return image.image_url if image else None
-        except Exception:
-            return None
+        return obj.main_image_url
 
 
 class CartItemSerializer(serializers.ModelSerializer):
@@ -49,8 +50,12 @@ class CartItemSerializer(serializers.ModelSerializer):
     pickup_store_name = serializers.CharField(source="pickup_store.name", read_only=True)
     pickup_store_contact = serializers.CharField(source="pickup_store.contact", read_only=True)
 
+    # 목록 조회 시 상품 좋아요 여부를 한 번에 조회할 중첩 상품 필드
+    like_state_product_field = "product"
+
     class Meta:
         model = CartItem
+        list_serializer_class = LikeStateListSerializer
         fields = [
             "id",
             "product",
@@ -6,6 +6,8 @@ from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
+from core.utils.write_behind_counter import WriteBehindCounter
+
 # 태그 선택지 정의
 TASTE_TAG_CHOICES = [
     ("과일향", "과일향"),
@@ -207,12 +209,12 @@ class Feedback(models.Model):
         return bool(self.image_url)
 
     def increment_view_count(self):
-        """조회수 증가"""
+        """조회수 증가 (Redis에 누적, DB 반영 전 증가분을 더한 값으로 갱신)"""
         from django.utils import timezone
 
-        self.view_count += 1
+        FEEDBACK_VIEW_COUNTER.increment(self.pk)
+        FEEDBACK_VIEW_COUNTER.overlay(self)
         self.last_viewed_at = timezone.now()
-        self.save(update_fields=["view_count", "last_viewed_at"])
 
     def clean(self):
         """태그 검증"""
@@ -263,3 +265,9 @@ class Feedback(models.Model):
         product.save(update_fields=["review_count"])
 
         super().delete(*args, **kwargs)
+
+
+# 피드백 조회수 (Redis에 누적 후 주기적으로 DB 반영, 반영 시 last_viewed_at 갱신)
+FEEDBACK_VIEW_COUNTER = WriteBehindCounter(
+    "feedback_view_count", Feedback, "view_count", extra_assignments=["last_viewed_at = NOW()"]
+)
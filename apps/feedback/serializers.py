@@ -2,6 +2,8 @@
 
 from rest_framework import serializers
 
+from core.utils.streaming_export import EXPORT_FORMATS
+
 from .models import TASTE_TAG_CHOICES, Feedback
 
 
@@ -185,3 +187,18 @@ class FeedbackListSerializer(serializers.ModelSerializer):
             "view_count",
             "created_at",
         ]
+
+
+class FeedbackExportQuerySerializer(serializers.Serializer):
+    """피드백 내보내기 쿼리 파라미터 시리얼라이저"""
+
+    output = serializers.ChoiceField(choices=EXPORT_FORMATS, default="csv", help_text="파일 형식 (csv/jsonl)")
+    rating = serializers.IntegerField(min_value=1, max_value=5, required=False, help_text="평점")
+    created_from = serializers.DateField(required=False, help_text="작성일 시작 (YYYY-MM-DD, 포함)")
+    created_to = serializers.DateField(required=False, help_text="작성일 끝 (YYYY-MM-DD, 포함)")
+
+    def validate(self, attrs):
+        """작성일 범위 검사"""
+        if "created_from" in attrs and "created_to" in attrs and attrs["created_from"] > attrs["created_to"]:
+            raise serializers.ValidationError({"created_to": "종료일은 시작일 이후여야 합니다."})
+        return attrs
@@ -0,0 +1,83 @@
+# apps/feedback/services.py
+
+from django.db.models.functions import Coalesce
+
+from core.utils.streaming_export import EXPORT_CHUNK_SIZE
+
+from .models import Feedback
+
+
+class FeedbackExportService:
+    """피드백 내보내기 (관리자용 - 서버 측 커서로 한 번에 EXPORT_CHUNK_SIZE행씩 조회)"""
+
+    COLUMNS = [
+        "id",
+        "created_at",
+        "user_id",
+        "user_nickname",
+        "order_number",
+        "product_id",
+        "product_name",
+        "rating",
+        "sweetness",
+        "acidity",
+        "body",
+        "carbonation",
+        "bitterness",
+        "aroma",
+        "confidence",
+        "selected_tags",
+        "comment",
+        "image_url",
+        "view_count",
+    ]
+
+    @staticmethod
+    def iter_rows(rating=None, created_from=None, created_to=None):
+        """
+        내보낼 피드백 행 (COLUMNS 순서의 값 튜플)
+
+        Args:
+            rating: 평점 필터
+            created_from: 작성일 시작 (date, 포함)
+            created_to: 작성일 끝 (date, 포함)
+
+        Returns:
+            Iterator: 행 튜플 (모델 객체 생성 없음)
+        """
+        queryset = Feedback.objects.all()
+        if rating:
+            queryset = queryset.filter(rating=rating)
+        if created_from:
+            queryset = queryset.filter(created_at__date__gte=created_from)
+        if created_to:
+            queryset = queryset.filter(created_at__date__lte=created_to)
+
+        queryset = queryset.annotate(
+            product_name=Coalesce("order_item__product__drink__name", "order_item__product__package__name")
+        )
+        return (
+            queryset.order_by("created_at", "id")
+            .values_list(
+                "id",
+                "created_at",
+                "user_id",
+                "user__nickname",
+                "order_item__order__order_number",
+                "order_item__product_id",
+                "product_name",
+                "rating",
+                "sweetness",
+                "acidity",
+                "body",
+                "carbonation",
+                "bitterness",
+                "aroma",
+                "confidence",
+                "selected_tags",
+                "comment",
+                "image_url",
+                "view_count",
+            )
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
@@ -0,0 +1,20 @@
+# apps/feedback/signals.py
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.feedback.models import Feedback
+from core.utils.response_cache import ResponseCache
+
+# ============================================================================
+# 익명 응답 캐시 무효화 (실시간/인기 후기)
+# ============================================================================
+
+
+@receiver(post_save, sender=Feedback)
+@receiver(post_delete, sender=Feedback)
+def purge_feedback_response_cache(sender, instance, raw=False, **kwargs):
+    """피드백 작성/수정/삭제 시 후기 목록 응답 캐시 삭제"""
+    if raw:
+        return
+    ResponseCache.purge_on_commit("feedback")
@@ -10,7 +10,7 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from apps.feedback.models import TASTE_TAG_CHOICES, Feedback
+from apps.feedback.models import FEEDBACK_VIEW_COUNTER, TASTE_TAG_CHOICES, Feedback
 from apps.orders.models import Order, OrderItem
 from apps.products.models import Brewery, Drink, Product
 from apps.stores.models import Store
@@ -107,9 +107,15 @@ class FeedbackModelTest(TestCase):
         self.assertEqual(feedback.product, self.product)
 
     def test_increment_view_count(self):
+        # 이전 테스트에서 남은 누적분 정리
+        FEEDBACK_VIEW_COUNTER.flush()
         feedback = Feedback.objects.create(user=self.user, order_item=self.order_item, rating=4)
         initial_count = feedback.view_count
         feedback.increment_view_count()
+        self.assertEqual(feedback.view_count, initial_count + 1)
+
+        # DB 반영 후 확인
+        FEEDBACK_VIEW_COUNTER.flush()
         feedback.refresh_from_db()
         self.assertEqual(feedback.view_count, initial_count + 1)
         self.assertIsNotNone(feedback.last_viewed_at)
@@ -374,16 +380,21 @@ class FeedbackAPITest(APITestCase):
 
     def test_retrieve_feedback_increments_view_count(self):
         """상세 조회 시 자동으로 조회수 증가 테스트"""
+        FEEDBACK_VIEW_COUNTER.flush()
         feedback = Feedback.objects.create(user=self.user, order_item=self.order_item, rating=4)
         initial_count = feedback.view_count
         url = reverse("feedback:v1:feedbacks-detail", kwargs={"pk": feedback.id})
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["view_count"], initial_count + 1)
+        FEEDBACK_VIEW_COUNTER.flush()
         feedback.refresh_from_db()
         self.assertEqual(feedback.view_count, initial_count + 1)
 
     def test_list_recent_feedbacks(self):
-        Feedback.objects.create(user=self.user, order_item=self.order_item, rating=5)
+        # 커밋 후 후기 목록 응답 캐시 삭제
+        with self.captureOnCommitCallbacks(execute=True):
+            Feedback.objects.create(user=self.user, order_item=self.order_item, rating=5)
         url = reverse("feedback:v1:feedbacks-recent")
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -1,7 +1,7 @@
 # apps/feedback/urls.py
 from django.urls import include, path
 
-from apps.feedback.views import FeedbackViewSet
+from apps.feedback.views import FeedbackExportView, FeedbackViewSet
 
 app_name = "feedback"
 
@@ -28,6 +28,8 @@ v1_patterns = [
         FeedbackViewSet.as_view({"get": "personalized_reviews"}),
         name="feedbacks-personalized",
     ),
+    # 관리자용 피드백 내보내기 (CSV/JSONL 스트리밍)
+    path("feedbacks/export/", FeedbackExportView.as_view(), name="feedbacks-export"),
     # 사용자별 피드백
     path("user/feedbacks/", FeedbackViewSet.as_view({"get": "my_reviews"}), name="feedbacks-my"),
 ]
@@ -6,11 +6,20 @@ from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.utils.response_cache import AnonymousResponseCacheMixin
+from core.utils.streaming_export import streaming_export_response
 
 from .models import Feedback
-from .serializers import FeedbackListSerializer, FeedbackSerializer
+from .serializers import (
+    FeedbackExportQuerySerializer,
+    FeedbackListSerializer,
+    FeedbackSerializer,
+)
+from .services import FeedbackExportService
 
 
 @extend_schema_view(
@@ -21,7 +30,7 @@ from .serializers import FeedbackListSerializer, FeedbackSerializer
     partial_update=extend_schema(summary="피드백 부분 수정", tags=["피드백"]),
     destroy=extend_schema(summary="피드백 삭제 (이미지 포함)", tags=["피드백"]),
 )
-class FeedbackViewSet(viewsets.ModelViewSet):
+class FeedbackViewSet(AnonymousResponseCacheMixin, viewsets.ModelViewSet):
     """피드백 ViewSet - 이미지 업로드 지원"""
 
     queryset = Feedback.objects.select_related(
@@ -34,6 +43,16 @@ class FeedbackViewSet(viewsets.ModelViewSet):
     ordering_fields = ["created_at", "rating", "view_count"]
     ordering = ["-created_at"]
 
+    # 비로그인 응답 캐시 대상 액션 (모든 방문자에게 같은 응답)
+    cached_actions = {"recent_reviews", "popular_reviews"}
+
+    def is_response_cacheable(self, request, *args, **kwargs):
+        # dispatch 전이라 self.action이 없으므로 action_map으로 판별
+        return self.action_map.get(request.method.lower()) in self.cached_actions
+
+    def get_surrogate_keys(self, request, *args, **kwargs):
+        return ["feedback"]
+
     def get_serializer_class(self):
         """액션별 시리얼라이저 선택"""
         if self.action == "list":
@@ -144,3 +163,26 @@ class FeedbackViewSet(viewsets.ModelViewSet):
         queryset = Feedback.objects.select_related("order_item__product").filter(user=request.user)
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
+
+
+class FeedbackExportView(APIView):
+    """피드백 내보내기 (관리자용 - CSV/JSONL 스트리밍)"""
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="피드백 내보내기",
+        description="전체 피드백을 CSV/JSONL 파일로 스트리밍합니다. (관리자용)",
+        parameters=[FeedbackExportQuerySerializer],
+        responses={(200, "text/csv"): bytes, (200, "application/x-ndjson"): bytes},
+        tags=["관리자 - 피드백"],
+    )
+    def get(self, request, *args, **kwargs):
+        serializer = FeedbackExportQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        filters = dict(serializer.validated_data)
+        file_format = filters.pop("output")
+
+        return streaming_export_response(
+            "feedbacks", FeedbackExportService.COLUMNS, FeedbackExportService.iter_rows(**filters), file_format
+        )
@@ -2,26 +2,22 @@ from rest_framework import serializers
 
 from apps.orders.models import Order, OrderItem
 from apps.products.models import Product  # Product 모델 직접 임포트
+from apps.products.serializers.product.like_state import (
+    LikeStateListSerializer,
+    LikeStateMixin,
+)
 from apps.stores.serializers import StoreSerializer
+from core.utils.streaming_export import EXPORT_FORMATS
 
 
-class SimpleProductSerializer(serializers.ModelSerializer):
+class SimpleProductSerializer(LikeStateMixin, serializers.ModelSerializer):
     """주문 내역에 필요한 최소한의 상품 정보 시리얼라이저"""
 
-    main_image_url = serializers.SerializerMethodField()
+    is_liked = serializers.SerializerMethodField()
 
     class Meta:
         model = Product
-        fields = ["id", "name", "main_image_url"]
-
-    def get_main_image_url(self, obj):
-        # Product 모델에 main_image_url property가 있다고 가정
-        # 없다면, obj.images.filter(is_main=True).first().image_url 등으로 구현 필요
-        if hasattr(obj, "main_image_url"):
-            return obj.main_image_url
-        # ProductImage 모델을 직접 참조해야 할 경우
-        main_image = obj.images.filter(is_main=True).first()
-        return main_image.image_url if main_image else None
+        fields = ["id", "name", "main_image_url", "is_liked"]
 
 
 class OrderItemSerializer(serializers.ModelSerializer):
@@ -29,8 +25,12 @@ class OrderItemSerializer(serializers.ModelSerializer):
     pickup_store = StoreSerializer(read_only=True)
     feedback_id = serializers.SerializerMethodField()
 
+    # 목록 조회 시 상품 좋아요 여부를 한 번에 조회할 중첩 상품 필드
+    like_state_product_field = "product"
+
     class Meta:
         model = OrderItem
+        list_serializer_class = LikeStateListSerializer
         fields = [
             "id",
             "product",
@@ -74,8 +74,12 @@ class FlatOrderItemSerializer(serializers.ModelSerializer):
     feedback_id = serializers.SerializerMethodField()
     order_date = serializers.SerializerMethodField()
 
+    # 목록 조회 시 상품 좋아요 여부를 한 번에 조회할 중첩 상품 필드
+    like_state_product_field = "product"
+
     class Meta:
         model = OrderItem
+        list_serializer_class = LikeStateListSerializer
         fields = [
             "id",
             "order_date",
@@ -96,3 +100,18 @@ class FlatOrderItemSerializer(serializers.ModelSerializer):
 
     def get_order_date(self, obj):
         return obj.order.created_at.date()
+
+
+class OrderExportQuerySerializer(serializers.Serializer):
+    """주문 내역 내보내기 쿼리 파라미터 시리얼라이저"""
+
+    output = serializers.ChoiceField(choices=EXPORT_FORMATS, default="csv", help_text="파일 형식 (csv/jsonl)")
+    status = serializers.ChoiceField(choices=Order.Status.choices, required=False, help_text="주문 상태")
+    created_from = serializers.DateField(required=False, help_text="주문일 시작 (YYYY-MM-DD, 포함)")
+    created_to = serializers.DateField(required=False, help_text="주문일 끝 (YYYY-MM-DD, 포함)")
+
+    def validate(self, attrs):
+        """주문일 범위 검사"""
+        if "created_from" in attrs and "created_to" in attrs and attrs["created_from"] > attrs["created_to"]:
+            raise serializers.ValidationError({"created_to": "종료일은 시작일 이후여야 합니다."})
+        return attrs
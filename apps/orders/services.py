@@ -1,7 +1,13 @@
+from functools import partial
+
 from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Coalesce
 
 from apps.cart.models import CartItem
 from apps.orders.models import Order, OrderItem
+from apps.products.services.recommendation_service import RecommendationService
+from core.utils.streaming_export import EXPORT_CHUNK_SIZE
 
 
 class OrderCreationError(Exception):
@@ -57,4 +63,74 @@ class OrderService:
         # 3. 장바구니 비우기
         cart_items.delete()
 
+        # 4. 주문한 상품이 추천에서 빠지도록 커밋 후 추천 캐시 삭제 (bulk_create는 저장 시그널 없음)
+        transaction.on_commit(partial(RecommendationService.invalidate, user.pk))
+
         return order
+
+
+class OrderExportService:
+    """주문 내역 내보내기 (정산용 - 주문 아이템 단위 평면 행, 서버 측 커서로 조회)"""
+
+    COLUMNS = [
+        "order_number",
+        "order_status",
+        "ordered_at",
+        "user_id",
+        "user_nickname",
+        "order_total_price",
+        "product_id",
+        "product_name",
+        "price",
+        "quantity",
+        "subtotal",
+        "pickup_store",
+        "pickup_day",
+        "pickup_status",
+    ]
+
+    @staticmethod
+    def iter_rows(status=None, created_from=None, created_to=None):
+        """
+        내보낼 주문 아이템 행 (COLUMNS 순서의 값 튜플)
+
+        Args:
+            status: 주문 상태 필터
+            created_from: 주문일 시작 (date, 포함)
+            created_to: 주문일 끝 (date, 포함)
+
+        Returns:
+            Iterator: 행 튜플 (모델 객체 생성 없음)
+        """
+        queryset = OrderItem.objects.all()
+        if status:
+            queryset = queryset.filter(order__status=status)
+        if created_from:
+            queryset = queryset.filter(order__created_at__date__gte=created_from)
+        if created_to:
+            queryset = queryset.filter(order__created_at__date__lte=created_to)
+
+        queryset = queryset.annotate(
+            product_name=Coalesce("product__drink__name", "product__package__name"),
+            subtotal=F("price") * F("quantity"),
+        )
+        return (
+            queryset.order_by("order__created_at", "order_id", "id")
+            .values_list(
+                "order__order_number",
+                "order__status",
+                "order__created_at",
+                "order__user_id",
+                "order__user__nickname",
+                "order__total_price",
+                "product_id",
+                "product_name",
+                "price",
+                "quantity",
+                "subtotal",
+                "pickup_store__name",
+                "pickup_day",
+                "pickup_status",
+            )
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
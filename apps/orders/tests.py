@@ -112,3 +112,32 @@ class OrderFromCartAPITest(APITestCase):
 
         # Then: 403 Forbidden 에러를 반환
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_admin_can_export_orders_csv(self):
+        """관리자 주문 내역 내보내기 (CSV 스트리밍) 테스트"""
+        # Given: 장바구니에서 주문 생성
+        CartItem.objects.create(
+            user=self.user, product=self.product1, quantity=2, pickup_store=self.store1, pickup_date=date.today()
+        )
+        CartItem.objects.create(
+            user=self.user, product=self.product2, quantity=1, pickup_store=self.store2, pickup_date=date.today()
+        )
+        self.client.post(self.create_order_url)
+        export_url = "/api/v1/orders/export/"
+
+        # When & Then: 일반 사용자는 내보낼 수 없음
+        self.assertEqual(self.client.get(export_url).status_code, status.HTTP_403_FORBIDDEN)
+
+        # When: 관리자가 내보내기 API 호출
+        admin = User.objects.create_user(nickname="testadmin", role="ADMIN")
+        self.client.force_authenticate(user=admin)
+        response = self.client.get(export_url, {"created_from": date.today().isoformat()})
+
+        # Then: 주문 아이템 단위 행이 스트리밍됨
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        lines = b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+        self.assertEqual(len(lines), 3)  # 헤더 + 주문 아이템 2개
+        self.assertTrue(lines[0].startswith("order_number,order_status"))
+        self.assertIn("Test Drink 1", "".join(lines[1:]))
+        self.assertIn("20000", "".join(lines[1:]))  # 10000 * 2
@@ -1,7 +1,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from apps.orders.views import OrderItemListViewSet, OrderViewSet
+from apps.orders.views import OrderExportView, OrderItemListViewSet, OrderViewSet
 
 app_name = "orders"
 
@@ -14,4 +14,6 @@ urlpatterns = [
     path("create_from_cart/", OrderViewSet.as_view({"post": "create_from_cart"}), name="order-create-from-cart"),
     path("", OrderViewSet.as_view({"get": "list"}), name="order-list"),
     path("<int:pk>/", OrderViewSet.as_view({"get": "retrieve"}), name="order-detail"),
+    # 관리자용 전체 주문 내역 내보내기 (CSV/JSONL 스트리밍)
+    path("export/", OrderExportView.as_view(), name="order-export"),
 ]
@@ -2,17 +2,24 @@ from datetime import date
 
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from apps.orders.models import Order, OrderItem
-from apps.orders.serializers import FlatOrderItemSerializer, OrderSerializer
+from apps.orders.serializers import (
+    FlatOrderItemSerializer,
+    OrderExportQuerySerializer,
+    OrderSerializer,
+)
 from apps.orders.services import (
     CartIsEmptyError,
     MissingPickupInfoError,
     OrderCreationError,
+    OrderExportService,
     OrderService,
 )
+from core.utils.streaming_export import streaming_export_response
 
 
 class OrderViewSet(viewsets.ModelViewSet):
@@ -52,3 +59,24 @@ class OrderItemListViewSet(viewsets.ReadOnlyModelViewSet):
             .select_related("order", "product", "pickup_store")
             .order_by("-order__created_at", "-id")
         )
+
+
+class OrderExportView(APIView):
+    """
+    전체 주문 내역 내보내기 (관리자/정산용)
+
+    주문 아이템 단위 CSV/JSONL 파일을 스트리밍합니다.
+    서버 측 커서로 나누어 읽으므로 주문 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        serializer = OrderExportQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        filters = dict(serializer.validated_data)
+        file_format = filters.pop("output")
+
+        return streaming_export_response(
+            "orders", OrderExportService.COLUMNS, OrderExportService.iter_rows(**filters), file_format
+        )
@@ -0,0 +1,158 @@
+# apps/products/management/commands/benchmark_product_search.py
+
+import random
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+
+from apps.products.models import Brewery, Drink, Product
+from apps.products.services.search_index_service import SearchIndexService
+
+NAME_PREFIXES = ["우리", "한잔", "산들", "달빛", "청명", "솔향", "들꽃", "고운", "해담", "별빛", "은하", "가온"]
+NAME_SUFFIXES = ["막걸리", "탁주", "약주", "청주", "소주", "과실주", "생막걸리", "증류주"]
+DESCRIPTION_WORDS = [
+    "깊은",
+    "부드러운",
+    "달콤한",
+    "상큼한",
+    "쌀",
+    "누룩",
+    "전통",
+    "양조",
+    "숙성",
+    "향긋한",
+    "과일향",
+    "목넘김",
+    "깔끔한",
+    "선물",
+    "프리미엄",
+    "지역",
+    "특산",
+    "복분자",
+    "유자",
+    "탄산",
+]
+DEFAULT_QUERIES = ["막걸리", "달빛 약주", "양조장", "복분자", "프리미엄 선물", "유자"]
+# 트라이그램 인덱스를 쓸 수 없는 짧은 검색어 (search_grams 인덱스 사용)
+SHORT_QUERIES = ["소주", "약주", "유자", "쌀"]
+
+
+class Command(BaseCommand):
+    help = (
+        "상품 검색 벤치마크 - 기존 ILIKE 조인 검색과 search_document 트라이그램 검색의 p95 지연시간 비교 "
+        "(3글자 미만 검색어는 search_grams 인덱스 검색을 따로 측정)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=100_000, help="생성할 상품 수 (기본 100,000)")
+        parser.add_argument("--iterations", type=int, default=30, help="검색어별 반복 횟수")
+        parser.add_argument("--query", action="append", dest="queries", help="검색어 (여러 번 지정 가능)")
+        parser.add_argument("--seed", type=int, default=42, help="랜덤 시드")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        queries = options["queries"] or DEFAULT_QUERIES
+
+        # 벤치마크 데이터는 트랜잭션 롤백으로 정리
+        with transaction.atomic():
+            self.stdout.write(f"상품 {options['products']:,}개 생성 중...")
+            self._seed(options["products"], rng)
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE breweries, drinks, packages, products")
+
+            legacy = self._measure(self._legacy_search, queries, options["iterations"])
+            indexed = self._measure(self._indexed_search, queries, options["iterations"])
+            self._report(legacy, indexed)
+
+            if not options["queries"]:
+                self.stdout.write(f"짧은 검색어: {', '.join(SHORT_QUERIES)}")
+                legacy = self._measure(self._legacy_search, SHORT_QUERIES, options["iterations"])
+                indexed = self._measure(self._indexed_search, SHORT_QUERIES, options["iterations"])
+                self._report(legacy, indexed)
+
+            transaction.set_rollback(True)
+
+    def _seed(self, count, rng):
+        breweries = Brewery.objects.bulk_create(
+            [Brewery(name=f"{rng.choice(NAME_PREFIXES)}양조장 {i}", region="경기") for i in range(200)]
+        )
+
+        batch_size = 2000
+        for start in range(0, count, batch_size):
+            size = min(batch_size, count - start)
+            drinks = Drink.objects.bulk_create(
+                [
+                    Drink(
+                        name=f"{rng.choice(NAME_PREFIXES)}{rng.choice(NAME_SUFFIXES)} {start + i}",
+                        brewery=rng.choice(breweries),
+                        ingredients="쌀, 누룩, 정제수",
+                        alcohol_type=rng.choice(Drink.AlcoholType.values),
+                        abv=Decimal("6.0"),
+                        volume_ml=750,
+                    )
+                    for i in range(size)
+                ]
+            )
+            products = []
+            for drink in drinks:
+                description = " ".join(rng.choices(DESCRIPTION_WORDS, k=40))
+                document = SearchIndexService.compose_document(
+                    [drink.name, drink.brewery.name, drink.get_alcohol_type_display(), description]
+                )
+                products.append(
+                    Product(
+                        drink=drink,
+                        price=rng.randrange(5000, 100000, 500),
+                        description=description,
+                        description_image_url="https://example.com/description.jpg",
+                        search_document=document,
+                        search_grams=SearchIndexService.extract_grams(document),
+                    )
+                )
+            Product.objects.bulk_create(products)
+
+    @staticmethod
+    def _legacy_search(query):
+        """기존 SearchFilter 방식 (drink__name, package__name, description ILIKE)"""
+        queryset = Product.objects.filter(status=Product.Status.ACTIVE)
+        for term in query.split():
+            queryset = queryset.filter(
+                Q(drink__name__icontains=term) | Q(package__name__icontains=term) | Q(description__icontains=term)
+            )
+        queryset = queryset.order_by("-created_at")
+        return queryset.count(), list(queryset.values_list("id", flat=True)[:16])
+
+    @staticmethod
+    def _indexed_search(query):
+        """search_document 트라이그램 인덱스 + 관련도 정렬"""
+        queryset = SearchIndexService.apply_search(Product.objects.filter(status=Product.Status.ACTIVE), query.split())
+        queryset = queryset.order_by("-search_rank", "-created_at")
+        return queryset.count(), list(queryset.values_list("id", flat=True)[:16])
+
+    @staticmethod
+    def _measure(search, queries, iterations):
+        samples = []
+        for query in queries:
+            search(query)  # 워밍업
+            for _ in range(iterations):
+                started = time.perf_counter()
+                search(query)
+                samples.append((time.perf_counter() - started) * 1000)
+        return samples
+
+    def _report(self, legacy, indexed):
+        def summary(samples):
+            p95 = statistics.quantiles(samples, n=20)[-1]
+            return statistics.median(samples), p95
+
+        legacy_p50, legacy_p95 = summary(legacy)
+        indexed_p50, indexed_p95 = summary(indexed)
+
+        self.stdout.write(f"{'':<12}{'p50 (ms)':>12}{'p95 (ms)':>12}")
+        self.stdout.write(f"{'before':<12}{legacy_p50:>12.2f}{legacy_p95:>12.2f}")
+        self.stdout.write(f"{'after':<12}{indexed_p50:>12.2f}{indexed_p95:>12.2f}")
+        self.stdout.write(self.style.SUCCESS(f"p95 개선: {legacy_p95 / max(indexed_p95, 0.001):.1f}x"))
@@ -0,0 +1,112 @@
+# apps/products/management/commands/benchmark_product_serializer.py
+
+import statistics
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.products.models import Brewery, Drink, Package, Product
+from apps.products.serializers.product.fast import ProductCardFastSerializer
+from apps.products.serializers.product.list import ProductListSerializer
+
+
+class Command(BaseCommand):
+    help = "상품 카드 직렬화 벤치마크 - ProductListSerializer와 ProductCardFastSerializer의 1,000행당 직렬화 시간 비교 (DB 불필요)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="직렬화할 행 수 (기본 1,000)")
+        parser.add_argument("--iterations", type=int, default=20, help="반복 횟수")
+
+    def handle(self, *args, **options):
+        products = self._build_products(options["rows"])
+        rows = [self._to_row(product) for product in products]
+
+        # 두 직렬화 결과가 같은지 먼저 확인
+        renderer = JSONRenderer()
+        if renderer.render(ProductListSerializer(products, many=True).data) != renderer.render(
+            ProductCardFastSerializer.serialize_rows(rows)
+        ):
+            self.stderr.write(self.style.ERROR("직렬화 결과가 다릅니다."))
+            return
+
+        drf = self._measure(lambda: ProductListSerializer(products, many=True).data, options["iterations"])
+        fast = self._measure(lambda: ProductCardFastSerializer.serialize_rows(rows), options["iterations"])
+
+        scale = 1000 / options["rows"]
+        self.stdout.write(f"{'':<24}{'ms / 1,000행 (p50)':>20}")
+        self.stdout.write(f"{'ProductListSerializer':<24}{statistics.median(drf) * scale:>20.2f}")
+        self.stdout.write(f"{'ProductCardFast':<24}{statistics.median(fast) * scale:>20.2f}")
+        self.stdout.write(
+            self.style.SUCCESS(f"개선: {statistics.median(drf) / max(statistics.median(fast), 0.001):.1f}x")
+        )
+
+    @staticmethod
+    def _build_products(count):
+        """DB 저장 없이 메모리에서 상품 객체 생성 (개별/패키지 반반)"""
+        brewery = Brewery(id=1, name="벤치마크양조장")
+        now = timezone.now()
+        products = []
+        for i in range(count):
+            product = Product(
+                id=uuid.uuid4(),
+                price=10000 + i,
+                original_price=12000 + i if i % 3 else None,
+                discount=2000 if i % 3 else None,
+                main_image_url=f"https://example.com/{i}.jpg" if i % 4 else None,
+                is_premium=bool(i % 2),
+                view_count=i,
+                like_count=i // 2,
+                status=Product.Status.ACTIVE,
+                created_at=now - timedelta(minutes=i),
+            )
+            if i % 2:
+                product.drink = Drink(
+                    id=i, name=f"벤치마크막걸리 {i}", brewery=brewery, alcohol_type="MAKGEOLLI", abv=Decimal("6.0")
+                )
+            else:
+                product.package = Package(id=i, name=f"벤치마크패키지 {i}")
+            products.append(product)
+        return products
+
+    @staticmethod
+    def _to_row(product):
+        """상품 객체를 ProductCardFastSerializer.project()와 같은 형태의 행으로 변환"""
+        drink = product.drink
+        package = product.package
+        return {
+            "id": product.id,
+            "drink_id": drink.id if drink else None,
+            "package_id": package.id if package else None,
+            "drink__name": drink.name if drink else None,
+            "package__name": package.name if package else None,
+            "drink__brewery__name": drink.brewery.name if drink else None,
+            "drink__alcohol_type": drink.alcohol_type if drink else None,
+            "price": product.price,
+            "original_price": product.original_price,
+            "discount": product.discount,
+            "main_image_url": product.main_image_url,
+            "is_gift_suitable": product.is_gift_suitable,
+            "is_regional_specialty": product.is_regional_specialty,
+            "is_limited_edition": product.is_limited_edition,
+            "is_premium": product.is_premium,
+            "is_award_winning": product.is_award_winning,
+            "view_count": product.view_count,
+            "like_count": product.like_count,
+            "status": product.status,
+            "created_at": product.created_at,
+        }
+
+    @staticmethod
+    def _measure(serialize, iterations):
+        serialize()  # 워밍업
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            serialize()
+            samples.append((time.perf_counter() - started) * 1000)
+        return samples
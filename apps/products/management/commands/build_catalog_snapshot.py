@@ -0,0 +1,18 @@
+# apps/products/management/commands/build_catalog_snapshot.py
+
+from django.core.management.base import BaseCommand
+
+from apps.products.services.catalog_snapshot_service import (
+    CatalogSnapshot,
+    CatalogSnapshotService,
+)
+
+
+class Command(BaseCommand):
+    help = "워커 간 공유 카탈로그 스냅샷(mmap 파일) 재생성 - 배포 직후 실행하면 첫 요청의 생성 대기를 없앰"
+
+    def handle(self, *args, **options):
+        path = CatalogSnapshotService.rebuild()
+        snapshot = CatalogSnapshot(path)
+        size_kb = path.stat().st_size / 1024
+        self.stdout.write(f"버전 {snapshot.version}: 상품 {len(snapshot)}개, {size_kb:.1f}KB ({path})")
@@ -0,0 +1,56 @@
+# apps/products/management/commands/export_data.py
+
+from datetime import date
+from typing import Any, Dict
+
+from django.core.management.base import BaseCommand
+
+from apps.feedback.services import FeedbackExportService
+from apps.orders.services import OrderExportService
+from apps.products.services.product_export_service import ProductExportService
+from core.utils.streaming_export import EXPORT_FORMATS, UTF8_BOM, iter_export_lines
+
+EXPORTERS: Dict[str, Any] = {
+    "products": ProductExportService,
+    "orders": OrderExportService,
+    "feedback": FeedbackExportService,
+}
+
+
+class Command(BaseCommand):
+    help = "상품/주문/피드백 전체를 CSV/JSONL 파일로 내보내기 (서버 측 커서로 나누어 읽음)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("target", choices=list(EXPORTERS), help="내보낼 데이터")
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv", help="파일 형식 (기본값: csv)")
+        parser.add_argument("--output", help="저장할 파일 경로 (생략 시 표준 출력)")
+        parser.add_argument("--status", help="상태 필터 (products/orders)")
+        parser.add_argument("--rating", type=int, help="평점 필터 (feedback)")
+        parser.add_argument(
+            "--from", dest="created_from", type=date.fromisoformat, help="시작일 YYYY-MM-DD (orders/feedback)"
+        )
+        parser.add_argument(
+            "--to", dest="created_to", type=date.fromisoformat, help="종료일 YYYY-MM-DD (orders/feedback)"
+        )
+
+    def handle(self, *args, **options):
+        target = options["target"]
+        filters = {"status": options["status"]}
+        if target != "products":
+            filters = {"created_from": options["created_from"], "created_to": options["created_to"]}
+            if target == "orders":
+                filters["status"] = options["status"]
+            else:
+                filters["rating"] = options["rating"]
+
+        exporter = EXPORTERS[target]
+        lines = iter_export_lines(exporter.COLUMNS, exporter.iter_rows(**filters), options["format"])
+        if not options["output"]:
+            # 표준 출력에는 BOM 없이 기록
+            for line in lines:
+                self.stdout.write(line.removeprefix(UTF8_BOM), ending="")
+            return
+
+        with open(options["output"], "w", encoding="utf-8", newline="") as output:
+            output.writelines(lines)
+        self.stderr.write(self.style.SUCCESS(f"{target} 내보내기 완료: {options['output']}"))
@@ -0,0 +1,16 @@
+# apps/products/management/commands/flush_view_counters.py
+
+from django.core.management.base import BaseCommand
+
+# 카운터 등록을 위해 정의된 모듈을 불러옴
+from apps.feedback.models import FEEDBACK_VIEW_COUNTER  # noqa: F401
+from apps.products.services.product_service import ProductService  # noqa: F401
+from core.utils.write_behind_counter import WriteBehindCounter
+
+
+class Command(BaseCommand):
+    help = "Redis에 누적된 조회수(상품/피드백)를 DB에 일괄 반영 - 운영에서는 counter-flusher 컨테이너가 주기 실행"
+
+    def handle(self, *args, **options):
+        for name, flushed in WriteBehindCounter.flush_all().items():
+            self.stdout.write(f"{name}: {flushed}건 반영")
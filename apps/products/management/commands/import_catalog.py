@@ -0,0 +1,31 @@
+# apps/products/management/commands/import_catalog.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.products.services.catalog_import_service import CatalogImportService
+
+
+class Command(BaseCommand):
+    help = "CSV/JSONL 파일로 양조장/술/패키지/상품/이미지 일괄 등록"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV 또는 JSONL 파일 경로 (UTF-8)")
+        parser.add_argument("--format", choices=CatalogImportService.FORMATS, help="생략 시 파일 확장자로 판단")
+        parser.add_argument("--dry-run", action="store_true", help="검증만 수행 (저장하지 않음)")
+
+    def handle(self, *args, **options):
+        file_format = options["format"] or CatalogImportService.detect_format(options["path"])
+        if file_format is None:
+            raise CommandError("파일 형식을 알 수 없습니다. --format csv|jsonl 을 지정해주세요.")
+
+        with open(options["path"], encoding="utf-8-sig", newline="") as lines:
+            result = CatalogImportService.import_file(lines, file_format, dry_run=options["dry_run"])
+
+        for error in result["errors"]:
+            self.stderr.write(f"{error['row']}행: {json.dumps(error['errors'], ensure_ascii=False)}")
+
+        created = ", ".join(f"{name} {count}개" for name, count in result["created"].items())
+        prefix = "[검증] " if result["dry_run"] else ""
+        self.stdout.write(f"{prefix}전체 {result['total_rows']}행, 오류 {result['error_count']}행 / 생성: {created}")
@@ -0,0 +1,17 @@
+# apps/products/management/commands/publish_catalog.py
+
+from django.core.management.base import BaseCommand
+
+from apps.products.services.catalog_publish_service import CatalogPublishService
+
+
+class Command(BaseCommand):
+    help = "활성 카탈로그 정적 배포본(STATIC_ROOT/catalog) 생성 - 운영에서는 catalog-publisher 컨테이너가 주기 실행 (카탈로그 변경이 없으면 건너뜀)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="카탈로그 버전이 같아도 다시 생성")
+
+    def handle(self, *args, **options):
+        result = CatalogPublishService.publish(force=options["force"])
+        status = "manifest 교체" if result["published"] else "변경 없음"
+        self.stdout.write(f"{status}: 버전 {result['version']}, 상품 {result['product_count']}개")
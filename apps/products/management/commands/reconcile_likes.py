@@ -0,0 +1,16 @@
+# apps/products/management/commands/reconcile_likes.py
+
+from django.core.management.base import BaseCommand
+
+from apps.products.services.like_service import LikeService
+
+
+class Command(BaseCommand):
+    help = "상품 좋아요 수와 사용자 좋아요 집합(Redis)을 ProductLike 기준으로 보정"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--product", action="append", dest="product_ids", help="보정할 상품 ID (여러 번 지정 가능)")
+
+    def handle(self, *args, **options):
+        updated, cleared = LikeService.reconcile(options["product_ids"])
+        self.stdout.write(f"좋아요 수 보정: {updated}개 상품, 사용자 좋아요 집합 초기화: {cleared}개")
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.4 on 2026-10-17 00:26
+
+import re
+import unicodedata
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+ALCOHOL_TYPE_DISPLAY = {
+    "MAKGEOLLI": "막걸리",
+    "YAKJU": "약주",
+    "CHEONGJU": "청주",
+    "SOJU": "소주",
+    "FRUIT_WINE": "과실주",
+}
+
+
+def _normalize(text):
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", str(text)).lower()
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _compose(parts):
+    seen = set()
+    result = []
+    for part in parts:
+        normalized = _normalize(part)
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            result.append(normalized)
+    return " ".join(result)
+
+
+def populate_search_documents(apps, schema_editor):
+    Product = apps.get_model("products", "Product")
+
+    products = Product.objects.select_related("drink__brewery", "package").prefetch_related("package__drinks__brewery")
+    changed = []
+    for product in products:
+        if product.drink_id:
+            drink = product.drink
+            parts = [drink.name, drink.brewery.name, ALCOHOL_TYPE_DISPLAY.get(drink.alcohol_type)]
+        elif product.package_id:
+            parts = [product.package.name]
+            for drink in product.package.drinks.all():
+                parts.extend([drink.name, drink.brewery.name, ALCOHOL_TYPE_DISPLAY.get(drink.alcohol_type)])
+        else:
+            parts = []
+        parts.append(product.description)
+        product.search_document = _compose(parts)
+        changed.append(product)
+
+    Product.objects.bulk_update(changed, ["search_document"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0005_auto_20250812_0724"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="product",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False, help_text="검색 문서"),
+        ),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"], name="products_search_doc_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
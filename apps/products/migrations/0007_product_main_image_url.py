@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-17 00:36
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_main_image_url(apps, schema_editor):
+    Product = apps.get_model("products", "Product")
+    ProductImage = apps.get_model("products", "ProductImage")
+
+    main_images = ProductImage.objects.filter(product_id=OuterRef("pk"), is_main=True).values("image_url")[:1]
+    Product.objects.update(main_image_url=Subquery(main_images))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0006_product_search_document"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="main_image_url",
+            field=models.URLField(blank=True, editable=False, help_text="메인 이미지 URL", max_length=255, null=True),
+        ),
+        migrations.RunPython(populate_main_image_url, migrations.RunPython.noop),
+    ]
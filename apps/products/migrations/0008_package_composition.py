@@ -0,0 +1,171 @@
+# Generated by Django 5.2.4 on 2026-10-17 00:53
+
+from decimal import ROUND_HALF_UP, Decimal
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db import migrations, models
+from django.db.models import Avg, Count, Max, Min, StdDev
+
+TASTE_LEVEL_FIELDS = [
+    "sweetness_level",
+    "acidity_level",
+    "body_level",
+    "carbonation_level",
+    "bitterness_level",
+    "aroma_level",
+]
+
+
+def _round(value):
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def populate_package_composition(apps, schema_editor):
+    Package = apps.get_model("products", "Package")
+    PackageItem = apps.get_model("products", "PackageItem")
+
+    rows = (
+        PackageItem.objects.order_by()
+        .values("package_id")
+        .annotate(
+            types=ArrayAgg("drink__alcohol_type", distinct=True),
+            count=Count("drink_id"),
+            low_abv=Min("drink__abv"),
+            high_abv=Max("drink__abv"),
+            **{f"{field}_mean": Avg(f"drink__{field}") for field in TASTE_LEVEL_FIELDS},
+            **{f"{field}_stddev": StdDev(f"drink__{field}") for field in TASTE_LEVEL_FIELDS},
+        )
+    )
+    summaries = {row["package_id"]: row for row in rows}
+
+    changed = []
+    for package in Package.objects.filter(pk__in=summaries.keys()):
+        row = summaries[package.pk]
+        package.alcohol_types = sorted(row["types"])
+        package.drink_count = row["count"]
+        package.min_abv = row["low_abv"]
+        package.max_abv = row["high_abv"]
+        for field in TASTE_LEVEL_FIELDS:
+            setattr(package, field, _round(row[f"{field}_mean"]))
+        spreads = [Decimal(str(row[f"{field}_stddev"] or 0)) for field in TASTE_LEVEL_FIELDS]
+        package.taste_spread = _round(sum(spreads) / len(spreads))
+        changed.append(package)
+
+    Package.objects.bulk_update(
+        changed,
+        ["alcohol_types", "drink_count", "min_abv", "max_abv", *TASTE_LEVEL_FIELDS, "taste_spread"],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0007_product_main_image_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="package",
+            name="acidity_level",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, editable=False, help_text="평균 산미", max_digits=3, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="package",
+            name="alcohol_types",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(
+                    choices=[
+                        ("MAKGEOLLI", "막걸리"),
+                        ("YAKJU", "약주"),
+                        ("CHEONGJU", "청주"),
+                        ("SOJU", "소주"),
+                        ("FRUIT_WINE", "과실주"),
+                    ],
+                    max_length=20,
+                ),
+                blank=True,
+                default=list,
+                editable=False,
+                help_text="구성 술 주종 목록",
+                size=None,
+            ),
+        ),
+        migrations.AddField(
+            model_name="package",
+            name="aroma_level",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, editable=False, help_text="평균 풍미", max_digits=3, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="package",
+            name="bitterness_level",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, editable=False, help_text="평균 쓴맛", max_digits=3, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="package",
+            name="body_level",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, editable=False, help_text="평균 바디감", max_digits=3, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="package",
+            name="carbonation_level",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, editable=False, help_text="평균 탄산감", max_digits=3, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="package",
+            name="drink_count",
+            field=models.PositiveSmallIntegerField(default=0, editable=False, help_text="구성 술 개수"),
+        ),
+        migrations.AddField(
+            model_name="package",
+            name="max_abv",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, editable=False, help_text="최고 도수(%)", max_digits=5, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="package",
+            name="min_abv",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, editable=False, help_text="최저 도수(%)", max_digits=5, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="package",
+            name="sweetness_level",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, editable=False, help_text="평균 단맛", max_digits=3, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="package",
+            name="taste_spread",
+            field=models.DecimalField(
+                blank=True,
+                decimal_places=2,
+                editable=False,
+                help_text="구성 술 맛 편차 (맛 차원별 표준편차의 평균)",
+                max_digits=3,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(populate_package_composition, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="package",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["alcohol_types"], name="packages_alcohol_types_gin"),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.4 on 2026-10-17 01:56
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+def _extract_grams(document):
+    grams = set()
+    for word in document.split():
+        grams.update(word)
+        grams.update(word[index : index + 2] for index in range(len(word) - 1))
+    return sorted(grams)
+
+
+def populate_search_grams(apps, schema_editor):
+    Product = apps.get_model("products", "Product")
+
+    changed = []
+    for product in Product.objects.only("id", "search_document").iterator(chunk_size=500):
+        product.search_grams = _extract_grams(product.search_document)
+        changed.append(product)
+        if len(changed) >= 500:
+            Product.objects.bulk_update(changed, ["search_grams"])
+            changed = []
+    Product.objects.bulk_update(changed, ["search_grams"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0008_package_composition"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_grams",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=2),
+                blank=True,
+                default=list,
+                editable=False,
+                help_text="검색 문서 1~2글자 조각",
+                size=None,
+            ),
+        ),
+        migrations.RunPython(populate_search_grams, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_grams"], name="products_search_grams_gin"),
+        ),
+    ]
@@ -3,9 +3,51 @@
 import uuid
 from decimal import Decimal
 
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models.functions import Coalesce
+
+
+class BreweryQuerySet(models.QuerySet):
+    """양조장 QuerySet"""
+
+    def with_counts(self):
+        """
+        술 개수(drink_count)/활성 상품 수(active_product_count) 어노테이션
+
+        양조장별 COUNT 쿼리 대신 상관 서브쿼리로 한 번에 계산합니다. (JOIN 중복 집계 없음)
+        """
+        drink_count = (
+            Drink.objects.filter(brewery=models.OuterRef("pk"))
+            .order_by()
+            .values("brewery")
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        active_product_count = (
+            Product.objects.filter(drink__brewery=models.OuterRef("pk"), status=Product.Status.ACTIVE)
+            .order_by()
+            .values("drink__brewery")
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        return self.annotate(
+            drink_count=Coalesce(models.Subquery(drink_count), 0),
+            active_product_count=Coalesce(models.Subquery(active_product_count), 0),
+        )
+
+
+class BreweryManager(models.Manager):
+    """양조장 Manager"""
+
+    def get_queryset(self):
+        return BreweryQuerySet(self.model, using=self._db)
+
+    def with_counts(self):
+        return self.get_queryset().with_counts()
 
 
 class Brewery(models.Model):
@@ -20,6 +62,8 @@ class Brewery(models.Model):
     is_active = models.BooleanField(default=True, help_text="활성 상태")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = BreweryManager()
+
     class Meta:
         db_table = "breweries"
         indexes = [
@@ -129,6 +173,51 @@ class Package(models.Model):
         max_length=10, choices=PackageType.choices, default=PackageType.CURATED, help_text="패키지 타입"
     )
     drinks = models.ManyToManyField(Drink, through="PackageItem", related_name="packages")
+
+    # 구성 요약 (PackageItem/구성 술 변경 시 PackageCompositionService가 갱신 - 조회 시 JOIN 생략용)
+    alcohol_types = ArrayField(
+        models.CharField(max_length=20, choices=Drink.AlcoholType.choices),
+        default=list,
+        blank=True,
+        editable=False,
+        help_text="구성 술 주종 목록",
+    )
+    drink_count = models.PositiveSmallIntegerField(default=0, editable=False, help_text="구성 술 개수")
+    min_abv = models.DecimalField(
+        max_digits=5, decimal_places=2, null=True, blank=True, editable=False, help_text="최저 도수(%)"
+    )
+    max_abv = models.DecimalField(
+        max_digits=5, decimal_places=2, null=True, blank=True, editable=False, help_text="최고 도수(%)"
+    )
+
+    # 구성 술 맛 프로필 평균 (0.0 ~ 5.0, 구성 술이 없으면 null)
+    sweetness_level = models.DecimalField(
+        max_digits=3, decimal_places=2, null=True, blank=True, editable=False, help_text="평균 단맛"
+    )
+    acidity_level = models.DecimalField(
+        max_digits=3, decimal_places=2, null=True, blank=True, editable=False, help_text="평균 산미"
+    )
+    body_level = models.DecimalField(
+        max_digits=3, decimal_places=2, null=True, blank=True, editable=False, help_text="평균 바디감"
+    )
+    carbonation_level = models.DecimalField(
+        max_digits=3, decimal_places=2, null=True, blank=True, editable=False, help_text="평균 탄산감"
+    )
+    bitterness_level = models.DecimalField(
+        max_digits=3, decimal_places=2, null=True, blank=True, editable=False, help_text="평균 쓴맛"
+    )
+    aroma_level = models.DecimalField(
+        max_digits=3, decimal_places=2, null=True, blank=True, editable=False, help_text="평균 풍미"
+    )
+    taste_spread = models.DecimalField(
+        max_digits=3,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="구성 술 맛 편차 (맛 차원별 표준편차의 평균)",
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -137,6 +226,7 @@ class Package(models.Model):
         indexes = [
             models.Index(fields=["type"]),
             models.Index(fields=["name"]),
+            GinIndex(fields=["alcohol_types"], name="packages_alcohol_types_gin"),
         ]
 
     def __str__(self):
@@ -202,9 +292,22 @@ class Product(models.Model):
 
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.ACTIVE, help_text="상태")
 
+    # 메인 이미지 URL (ProductImage 저장/삭제 시 동기화 - 목록 조회 시 이미지 조회 생략용)
+    main_image_url = models.URLField(max_length=255, null=True, blank=True, editable=False, help_text="메인 이미지 URL")
+
+    # 검색 문서 (상품명, 양조장, 주종, 설명을 정규화해서 저장 - 트라이그램 인덱스 대상)
+    search_document = models.TextField(blank=True, default="", editable=False, help_text="검색 문서")
+    # 검색 문서의 1~2글자 조각 (트라이그램 인덱스를 쓸 수 없는 짧은 검색어용 - GIN 인덱스 대상)
+    search_grams = ArrayField(
+        models.CharField(max_length=2), blank=True, default=list, editable=False, help_text="검색 문서 1~2글자 조각"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # search_document 재생성이 필요한 필드들
+    SEARCH_DOCUMENT_SOURCE_FIELDS = {"drink", "package", "description", "search_document"}
+
     class Meta:
         db_table = "products"
         indexes = [
@@ -213,6 +316,8 @@ class Product(models.Model):
             models.Index(fields=["-created_at"]),
             models.Index(fields=["-view_count"]),
             models.Index(fields=["-order_count"]),
+            GinIndex(fields=["search_document"], name="products_search_doc_trgm", opclasses=["gin_trgm_ops"]),
+            GinIndex(fields=["search_grams"], name="products_search_grams_gin"),
         ]
 
     def clean(self):
@@ -224,6 +329,17 @@ class Product(models.Model):
 
     def save(self, *args, **kwargs):
         self.clean()
+
+        # 검색 문서 갱신 (통계 필드만 저장하는 경우는 제외)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or self.SEARCH_DOCUMENT_SOURCE_FIELDS.intersection(update_fields):
+            from apps.products.services.search_index_service import SearchIndexService
+
+            self.search_document = SearchIndexService.build_document(self)
+            self.search_grams = SearchIndexService.extract_grams(self.search_document)
+            if update_fields is not None:
+                kwargs["update_fields"] = set(update_fields) | {"search_document", "search_grams"}
+
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -300,6 +416,25 @@ class ProductImage(models.Model):
     def save(self, *args, **kwargs):
         self.clean()
         super().save(*args, **kwargs)
+        self.sync_main_image_url()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.sync_main_image_url()
+        return result
+
+    def sync_main_image_url(self):
+        """상품의 main_image_url을 현재 메인 이미지로 동기화"""
+        main_image_url = (
+            ProductImage.objects.filter(product_id=self.product_id, is_main=True)
+            .values_list("image_url", flat=True)
+            .first()
+        )
+        Product.objects.filter(pk=self.product_id).update(main_image_url=main_image_url)
+
+        # 메모리에 로드된 상품 객체도 함께 갱신
+        if ProductImage.product.is_cached(self):
+            self.product.main_image_url = main_image_url
 
     def __str__(self):
         return f"{self.product.name} - {'메인' if self.is_main else '서브'} 이미지"
@@ -6,6 +6,14 @@ from rest_framework import serializers
 from apps.products.models import Brewery, Product
 
 
+def get_active_product_count(brewery: Brewery) -> int:
+    """양조장의 활성 상품 수 (어노테이션이 없는 인스턴스는 직접 계산)"""
+    count = getattr(brewery, "active_product_count", None)
+    if count is None:
+        count = Product.objects.filter(drink__brewery=brewery, status=Product.Status.ACTIVE).count()
+    return count
+
+
 class BrewerySimpleSerializer(serializers.ModelSerializer):
     """양조장 간단 정보 시리얼라이저 - 다른 모델에서 참조용"""
 
@@ -25,8 +33,8 @@ class BreweryListSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(serializers.IntegerField)
     def get_product_count(self, obj) -> int:
-        """양조장의 활성 상품 수 계산"""
-        return Product.objects.filter(drink__brewery=obj, status="ACTIVE").count()
+        """양조장의 활성 상품 수 (with_counts() 어노테이션 우선)"""
+        return get_active_product_count(obj)
 
 
 class BrewerySerializer(serializers.ModelSerializer):
@@ -54,10 +62,13 @@ class BrewerySerializer(serializers.ModelSerializer):
 
     @extend_schema_field(serializers.IntegerField)
     def get_product_count(self, obj) -> int:
-        """양조장의 활성 상품 수 계산"""
-        return Product.objects.filter(drink__brewery=obj, status="ACTIVE").count()
+        """양조장의 활성 상품 수 (with_counts() 어노테이션 우선)"""
+        return get_active_product_count(obj)
 
     @extend_schema_field(serializers.IntegerField)
     def get_drink_count(self, obj) -> int:
-        """양조장의 술 개수"""
-        return obj.drinks.count()
+        """양조장의 술 개수 (with_counts() 어노테이션 우선)"""
+        drink_count = getattr(obj, "drink_count", None)
+        if drink_count is None:
+            drink_count = obj.drinks.count()
+        return drink_count
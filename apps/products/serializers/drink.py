@@ -93,9 +93,7 @@ class DrinkForPackageSerializer(serializers.ModelSerializer):
         """술의 메인 이미지 URL 반환"""
         try:
             if hasattr(obj, "product") and obj.product:
-                main_image = obj.product.images.filter(is_main=True).first()
-                if main_image:
-                    return main_image.image_url
+                return obj.product.main_image_url
         except:
             pass
         return None
@@ -4,6 +4,9 @@
 Product 관련 시리얼라이저들
 """
 
+# 상품 카드 고속 직렬화 (ProductListSerializer와 동일 출력)
+from .fast import ProductCardFastSerializer
+
 # 이미지 관련
 from .image import (
     ProductImageCreateSerializer,
@@ -22,6 +25,7 @@ __all__ = [
     "ProductImageCreateSerializer",
     # TODO: 나중에 추가
     "ProductListSerializer",
+    "ProductCardFastSerializer",
     # 'ProductDetailSerializer',
     # 'IndividualProductCreateSerializer',
     # 'PackageProductCreateSerializer',
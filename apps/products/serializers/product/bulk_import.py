@@ -0,0 +1,106 @@
+# apps/products/serializers/product/bulk_import.py
+
+from decimal import Decimal
+
+from rest_framework import serializers
+
+from apps.products.models import Drink, Package
+
+from .create import ProductBaseCreateSerializer
+
+TASTE_LEVEL_OPTIONS = {
+    "max_digits": 3,
+    "decimal_places": 1,
+    "min_value": Decimal("0.0"),
+    "max_value": Decimal("5.0"),
+    "default": Decimal("0.0"),
+}
+
+
+class CatalogImportRowSerializer(ProductBaseCreateSerializer):
+    """
+    카탈로그 일괄 등록 행 시리얼라이저 (DB 조회 없이 형식만 검사)
+
+    양조장 존재 여부/술 중복/패키지 구성 술 확인은 CatalogImportService가 묶음 단위로 처리합니다.
+    """
+
+    DRINK_REF_SEPARATOR = "/"
+
+    type = serializers.ChoiceField(choices=["individual", "package"])
+    name = serializers.CharField(max_length=100)
+
+    # 개별 상품 (술 정보)
+    brewery = serializers.CharField(max_length=100, required=False)
+    brewery_region = serializers.CharField(max_length=30, required=False, allow_blank=True)
+    ingredients = serializers.CharField(required=False)
+    alcohol_type = serializers.ChoiceField(choices=Drink.AlcoholType.choices, required=False)
+    abv = serializers.DecimalField(
+        max_digits=5, decimal_places=2, min_value=Decimal("0"), max_value=Decimal("100"), required=False
+    )
+    volume_ml = serializers.IntegerField(min_value=0, required=False)
+    sweetness_level = serializers.DecimalField(**TASTE_LEVEL_OPTIONS)
+    acidity_level = serializers.DecimalField(**TASTE_LEVEL_OPTIONS)
+    body_level = serializers.DecimalField(**TASTE_LEVEL_OPTIONS)
+    carbonation_level = serializers.DecimalField(**TASTE_LEVEL_OPTIONS)
+    bitterness_level = serializers.DecimalField(**TASTE_LEVEL_OPTIONS)
+    aroma_level = serializers.DecimalField(**TASTE_LEVEL_OPTIONS)
+
+    # 패키지 상품 (구성 술: "양조장명/술이름")
+    package_type = serializers.ChoiceField(choices=Package.PackageType.choices, default=Package.PackageType.CURATED)
+    drinks = serializers.ListField(child=serializers.CharField(), required=False, min_length=2, max_length=5)
+
+    # 이미지 URL 목록 (첫 번째가 메인 이미지)
+    images = serializers.ListField(child=serializers.URLField(max_length=255), min_length=1, max_length=5)
+
+    INDIVIDUAL_REQUIRED_FIELDS = ["brewery", "ingredients", "alcohol_type", "abv", "volume_ml"]
+
+    def validate_name(self, value):
+        """상품(술/패키지) 이름 유효성 검사"""
+        if not value.strip():
+            raise serializers.ValidationError("이름은 필수입니다.")
+        return value.strip()
+
+    def validate_images(self, value):
+        """이미지 URL 목록 유효성 검사"""
+        if len(value) != len(set(value)):
+            raise serializers.ValidationError("중복된 이미지 URL이 있습니다.")
+        return value
+
+    def validate_drinks(self, value):
+        """패키지 구성 술 참조 형식 검사 ("양조장명/술이름") 후 (양조장명, 술이름) 목록으로 변환"""
+        refs = []
+        for ref in value:
+            brewery_name, separator, drink_name = ref.partition(self.DRINK_REF_SEPARATOR)
+            if not separator or not brewery_name.strip() or not drink_name.strip():
+                raise serializers.ValidationError(f"구성 술은 '양조장명/술이름' 형식이어야 합니다: {ref}")
+            refs.append((brewery_name.strip(), drink_name.strip()))
+
+        if len(refs) != len(set(refs)):
+            raise serializers.ValidationError("중복된 술은 선택할 수 없습니다.")
+        return refs
+
+    def validate(self, attrs):
+        """상품 타입별 필수 항목 검사"""
+        attrs = super().validate(attrs)
+
+        if attrs["type"] == "individual":
+            missing = {
+                field: "개별 상품은 필수입니다." for field in self.INDIVIDUAL_REQUIRED_FIELDS if field not in attrs
+            }
+            if missing:
+                raise serializers.ValidationError(missing)
+        else:
+            if "drinks" not in attrs:
+                raise serializers.ValidationError({"drinks": "패키지 상품은 구성 술이 필수입니다."})
+            if len(attrs["name"]) > Package._meta.get_field("name").max_length:
+                raise serializers.ValidationError({"name": "패키지 이름은 30자 이하여야 합니다."})
+
+        return attrs
+
+
+class CatalogImportRequestSerializer(serializers.Serializer):
+    """카탈로그 일괄 등록 요청 시리얼라이저"""
+
+    file = serializers.FileField(help_text="CSV 또는 JSONL 파일 (UTF-8)")
+    format = serializers.ChoiceField(choices=["csv", "jsonl"], required=False, help_text="생략 시 파일 확장자로 판단")
+    dry_run = serializers.BooleanField(default=False, help_text="검증만 수행 (저장하지 않음)")
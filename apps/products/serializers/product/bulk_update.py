@@ -0,0 +1,68 @@
+# apps/products/serializers/product/bulk_update.py
+
+from rest_framework import serializers
+
+from apps.products.models import Drink, Product
+
+FLAG_FIELDS = [
+    "is_gift_suitable",
+    "is_award_winning",
+    "is_regional_specialty",
+    "is_limited_edition",
+    "is_premium",
+    "is_organic",
+]
+
+
+class ProductBulkSelectorSerializer(serializers.Serializer):
+    """일괄 변경 대상 선택 조건 (지정한 조건을 모두 만족하는 상품)"""
+
+    ids = serializers.ListField(child=serializers.UUIDField(), required=False, allow_empty=False, max_length=1000)
+    brewery_id = serializers.IntegerField(required=False, help_text="양조장의 개별 상품")
+    alcohol_type = serializers.ChoiceField(
+        choices=Drink.AlcoholType.choices, required=False, help_text="해당 주종 개별 상품 및 해당 주종이 포함된 패키지"
+    )
+    flag = serializers.ChoiceField(choices=FLAG_FIELDS, required=False, help_text="해당 특성이 설정된 상품")
+    status = serializers.ChoiceField(choices=Product.Status.choices, required=False, help_text="현재 상태")
+
+    def validate(self, attrs):
+        """전체 상품이 실수로 변경되지 않도록 조건 하나 이상 필수"""
+        if not attrs:
+            raise serializers.ValidationError("대상 선택 조건을 하나 이상 지정해야 합니다.")
+        return attrs
+
+
+class ProductBulkChangesSerializer(serializers.Serializer):
+    """일괄 변경 내용"""
+
+    status = serializers.ChoiceField(choices=Product.Status.choices, required=False)
+    price = serializers.IntegerField(min_value=0, required=False, help_text="판매가격 (지정 금액)")
+    price_change_percent = serializers.IntegerField(
+        min_value=-90, max_value=100, required=False, help_text="판매가격 증감률 (%) - 예: -10이면 10% 인하"
+    )
+    discount = serializers.IntegerField(
+        min_value=0, required=False, allow_null=True, help_text="할인금액 (정가보다 큰 상품은 제외)"
+    )
+    flags = serializers.DictField(child=serializers.BooleanField(), required=False, help_text="상품 특성 설정")
+
+    def validate_flags(self, value):
+        """상품 특성 이름 검사"""
+        invalid = [flag for flag in value if flag not in FLAG_FIELDS]
+        if invalid:
+            raise serializers.ValidationError(f"허용되지 않은 상품 특성: {invalid}")
+        return value
+
+    def validate(self, attrs):
+        """변경 내용 검사"""
+        if not attrs or attrs == {"flags": {}}:
+            raise serializers.ValidationError("변경할 내용을 하나 이상 지정해야 합니다.")
+        if "price" in attrs and "price_change_percent" in attrs:
+            raise serializers.ValidationError({"price": "price와 price_change_percent는 함께 지정할 수 없습니다."})
+        return attrs
+
+
+class ProductBulkUpdateSerializer(serializers.Serializer):
+    """상품 일괄 변경 요청 시리얼라이저"""
+
+    selector = ProductBulkSelectorSerializer()
+    changes = ProductBulkChangesSerializer()
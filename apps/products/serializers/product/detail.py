@@ -6,9 +6,10 @@ from rest_framework import serializers
 from apps.products.models import Product
 
 from .image import ProductImageSerializer
+from .like_state import LikeStateMixin
 
 
-class ProductDetailSerializer(serializers.ModelSerializer):
+class ProductDetailSerializer(LikeStateMixin, serializers.ModelSerializer):
     """상품 상세 시리얼라이저"""
 
     name = serializers.SerializerMethodField()
@@ -24,6 +25,9 @@ class ProductDetailSerializer(serializers.ModelSerializer):
     final_price = serializers.SerializerMethodField()
     is_on_sale = serializers.SerializerMethodField()
 
+    # 현재 사용자의 좋아요 여부
+    is_liked = serializers.SerializerMethodField()
+
     class Meta:
         model = Product
         fields = [
@@ -49,6 +53,7 @@ class ProductDetailSerializer(serializers.ModelSerializer):
             "view_count",
             "order_count",
             "like_count",
+            "is_liked",
             "review_count",
             "status",
             "images",
@@ -128,7 +133,7 @@ class ProductDetailSerializer(serializers.ModelSerializer):
             "type": package.type,
             "type_display": package.get_type_display(),
             "drinks": drinks_data,
-            "drink_count": package.drinks.count(),
+            "drink_count": len(drinks_data),
             "created_at": package.created_at,
             "updated_at": package.updated_at,
         }
@@ -0,0 +1,13 @@
+# apps/products/serializers/product/export.py
+
+from rest_framework import serializers
+
+from apps.products.models import Product
+from core.utils.streaming_export import EXPORT_FORMATS
+
+
+class ProductExportQuerySerializer(serializers.Serializer):
+    """상품 내보내기 쿼리 파라미터 시리얼라이저"""
+
+    output = serializers.ChoiceField(choices=EXPORT_FORMATS, default="csv", help_text="파일 형식 (csv/jsonl)")
+    status = serializers.ChoiceField(choices=Product.Status.choices, required=False, help_text="상품 상태")
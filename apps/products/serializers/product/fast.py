@@ -0,0 +1,130 @@
+# apps/products/serializers/product/fast.py
+
+from typing import Any, Dict, Iterable, List
+
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+
+class ProductCardFastSerializer:
+    """
+    상품 카드(목록)용 고속 직렬화
+
+    ProductListSerializer와 같은 키/값(렌더링 결과 바이트 단위 동일)을
+    .values() 조회 결과에서 바로 만들어 필드별 SerializerMethodField 호출과 모델 객체 생성을 생략합니다.
+    출력 필드를 바꿀 때는 ProductListSerializer와 함께 수정해야 합니다.
+    """
+
+    # .values() 조회 컬럼
+    VALUES_FIELDS = [
+        "id",
+        "drink_id",
+        "package_id",
+        "drink__name",
+        "package__name",
+        "drink__brewery__name",
+        "drink__alcohol_type",
+        "price",
+        "original_price",
+        "discount",
+        "main_image_url",
+        "is_gift_suitable",
+        "is_regional_specialty",
+        "is_limited_edition",
+        "is_premium",
+        "is_award_winning",
+        "view_count",
+        "like_count",
+        "status",
+        "created_at",
+    ]
+
+    # created_at 표현은 DRF DateTimeField와 동일해야 하므로 필드 인스턴스를 재사용
+    _created_at_field = serializers.DateTimeField()
+
+    @classmethod
+    def project(cls, queryset: QuerySet) -> QuerySet:
+        """
+        직렬화에 필요한 컬럼만 조회하는 .values() 쿼리셋 반환
+
+        기존 어노테이션(관련도 등)은 정렬/키셋 페이지네이션에 쓰이므로 함께 조회합니다.
+
+        Args:
+            queryset: 상품 쿼리셋
+
+        Returns:
+            QuerySet: dict 행을 반환하는 쿼리셋
+        """
+        annotations = [name for name in queryset.query.annotations if name not in cls.VALUES_FIELDS]
+        return queryset.prefetch_related(None).values(*cls.VALUES_FIELDS, *annotations)
+
+    @classmethod
+    def to_representation(cls, row: Dict[str, Any]) -> Dict[str, Any]:
+        """.values() 행 하나를 ProductListSerializer와 같은 형태로 변환"""
+        is_drink = row["drink_id"] is not None
+        if is_drink:
+            name = row["drink__name"]
+            product_type = "individual"
+        elif row["package_id"] is not None:
+            name = row["package__name"]
+            product_type = "package"
+        else:
+            name = "Unknown Product"
+            product_type = "unknown"
+
+        price = row["price"]
+        original_price = row["original_price"]
+        discount = row["discount"]
+
+        return {
+            "id": str(row["id"]),
+            "name": name,
+            "product_type": product_type,
+            "price": price,
+            "original_price": original_price,
+            "discount": discount,
+            # Product.get_discount_rate와 동일 (할인 없으면 정수 0)
+            "discount_rate": round((discount / original_price) * 100, 1) if original_price and discount else 0,
+            "final_price": price,
+            "is_on_sale": bool(discount and discount > 0),
+            "main_image_url": row["main_image_url"],
+            "brewery_name": row["drink__brewery__name"] if is_drink else None,
+            "alcohol_type": row["drink__alcohol_type"] if is_drink else None,
+            "is_gift_suitable": row["is_gift_suitable"],
+            "is_regional_specialty": row["is_regional_specialty"],
+            "is_limited_edition": row["is_limited_edition"],
+            "is_premium": row["is_premium"],
+            "is_award_winning": row["is_award_winning"],
+            "view_count": row["view_count"],
+            "like_count": row["like_count"],
+            # 사용자별 값은 attach_like_state()로 설정 (스냅샷은 사용자 무관하게 저장)
+            "is_liked": False,
+            "status": row["status"],
+            "created_at": cls._created_at_field.to_representation(row["created_at"]),
+        }
+
+    @classmethod
+    def serialize_rows(cls, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        .values() 행 목록 직렬화
+
+        Args:
+            rows: project()로 조회한 행들
+
+        Returns:
+            List[Dict]: 직렬화된 상품 카드 목록
+        """
+        return [cls.to_representation(row) for row in rows]
+
+    @classmethod
+    def serialize(cls, queryset: QuerySet) -> List[Dict[str, Any]]:
+        """
+        상품 쿼리셋 직렬화 (조회 + 변환)
+
+        Args:
+            queryset: 상품 쿼리셋 (슬라이스 가능)
+
+        Returns:
+            List[Dict]: 직렬화된 상품 카드 목록
+        """
+        return cls.serialize_rows(cls.project(queryset))
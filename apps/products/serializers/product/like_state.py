@@ -0,0 +1,53 @@
+# apps/products/serializers/product/like_state.py
+
+from typing import Any, Dict
+
+from django.db import models
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+
+from apps.products.services.like_service import LikeService
+
+
+class LikeStateMixin:
+    """
+    상품 시리얼라이저에 현재 사용자의 좋아요 여부(is_liked) 제공
+
+    목록(many=True)에서는 LikeStateListSerializer가 페이지 전체를 한 번에 조회한 결과를 사용하고,
+    단건 직렬화일 때만 상품별로 조회합니다.
+    """
+
+    context: Dict[str, Any]
+
+    @extend_schema_field(serializers.BooleanField)
+    def get_is_liked(self, obj) -> bool:
+        liked_product_ids = getattr(self, "_liked_product_ids", None)
+        if liked_product_ids is not None:
+            return str(obj.pk) in liked_product_ids
+
+        request = self.context.get("request")
+        return LikeService.check_user_liked_product(getattr(request, "user", None), str(obj.pk))
+
+
+class LikeStateListSerializer(serializers.ListSerializer):
+    """
+    목록 직렬화 전에 항목들의 좋아요 여부를 한 번(SMISMEMBER)에 조회
+
+    - 상품 시리얼라이저: child가 LikeStateMixin을 사용
+    - 상품을 중첩으로 포함하는 시리얼라이저(장바구니/주문 항목): child에 like_state_product_field 지정
+    """
+
+    def to_representation(self, data):
+        iterable = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+
+        product_field = getattr(self.child, "like_state_product_field", None)
+        if product_field:
+            target = self.child.fields[product_field]
+            product_ids = [getattr(item, f"{product_field}_id") for item in iterable]
+        else:
+            target = self.child
+            product_ids = [item.pk for item in iterable]
+
+        request = self.context.get("request")
+        target._liked_product_ids = LikeService.get_liked_product_ids(getattr(request, "user", None), product_ids)
+        return super().to_representation(iterable)
@@ -5,13 +5,14 @@ from rest_framework import serializers
 
 from apps.products.models import Product
 
+from .like_state import LikeStateListSerializer, LikeStateMixin
 
-class ProductListSerializer(serializers.ModelSerializer):
+
+class ProductListSerializer(LikeStateMixin, serializers.ModelSerializer):
     """상품 목록용 시리얼라이저"""
 
     name = serializers.SerializerMethodField()
     product_type = serializers.SerializerMethodField()
-    main_image_url = serializers.SerializerMethodField()
     brewery_name = serializers.SerializerMethodField()
     alcohol_type = serializers.SerializerMethodField()
 
@@ -20,8 +21,12 @@ class ProductListSerializer(serializers.ModelSerializer):
     final_price = serializers.SerializerMethodField()
     is_on_sale = serializers.SerializerMethodField()
 
+    # 현재 사용자의 좋아요 여부 (목록은 한 번에 조회)
+    is_liked = serializers.SerializerMethodField()
+
     class Meta:
         model = Product
+        list_serializer_class = LikeStateListSerializer
         fields = [
             "id",
             "name",
@@ -42,6 +47,7 @@ class ProductListSerializer(serializers.ModelSerializer):
             "is_award_winning",
             "view_count",
             "like_count",
+            "is_liked",
             "status",
             "created_at",
         ]
@@ -54,12 +60,6 @@ class ProductListSerializer(serializers.ModelSerializer):
     def get_product_type(self, obj) -> str:
         return obj.product_type
 
-    @extend_schema_field(serializers.URLField(allow_null=True))
-    def get_main_image_url(self, obj) -> Optional[str]:
-        """메인 이미지 URL 반환"""
-        main_image = obj.images.filter(is_main=True).first()
-        return main_image.image_url if main_image else None
-
     @extend_schema_field(serializers.CharField(allow_null=True))
     def get_brewery_name(self, obj) -> Optional[str]:
         """양조장명 반환"""
@@ -1,11 +1,43 @@
 # app/products/services/__init__.py
 
+from .autocomplete_service import AutocompleteService
+from .catalog_import_service import CatalogImportService
+from .catalog_publish_service import CatalogPublishService
+from .catalog_snapshot_service import CatalogSnapshotService
+from .catalog_version_service import CatalogVersionService
 from .like_service import LikeService
+from .package_composition_service import PackageCompositionService
+from .product_bulk_update_service import ProductBulkUpdateService
+from .product_detail_cache_service import ProductDetailCacheService
+from .product_export_service import ProductExportService
 from .product_service import ProductService
+from .recommendation_service import RecommendationService
+from .search_facet_service import SearchFacetService
+from .search_index_service import SearchIndexService
+from .search_result_cache_service import SearchResultCacheService
 from .search_service import SearchService
+from .search_term_service import SearchTermService
+from .section_snapshot_service import SectionSnapshotService
+from .taste_match_service import TasteMatchService
 
 __all__ = [
     "ProductService",
+    "ProductBulkUpdateService",
+    "ProductDetailCacheService",
+    "ProductExportService",
     "LikeService",
     "SearchService",
+    "SearchIndexService",
+    "SearchFacetService",
+    "SearchResultCacheService",
+    "SearchTermService",
+    "AutocompleteService",
+    "CatalogVersionService",
+    "CatalogImportService",
+    "CatalogPublishService",
+    "CatalogSnapshotService",
+    "PackageCompositionService",
+    "TasteMatchService",
+    "RecommendationService",
+    "SectionSnapshotService",
 ]
@@ -0,0 +1,353 @@
+# apps/products/services/autocomplete_service.py
+
+import bisect
+import json
+import logging
+import threading
+import time
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import connections, transaction
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from apps.products.models import Brewery, Drink, Package
+
+from .search_index_service import SearchIndexService
+
+logger = logging.getLogger(__name__)
+
+# 한글 초성 (호환용 자모) - 완성형 음절의 초성 순서와 동일
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+CHOSUNG_INDEX = {char: index for index, char in enumerate(CHOSUNG)}
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JONGSUNG_COUNT = 28
+SYLLABLES_PER_CHOSUNG = 21 * JONGSUNG_COUNT
+
+# NFKC 정규화는 호환용 자모(ㄱ, U+3131)를 첫가끝 초성(U+1100)으로 바꾸므로 다시 호환용 자모로 되돌림
+_CONJOINING_CHOSUNG = {0x1100 + index: char for index, char in enumerate(CHOSUNG)}
+
+# 순번 예약과 로그 기록을 한 번에 (KEYS: 순번, 변경 로그 / ARGV: 보관 개수, 변경 JSON...)
+# 각 변경의 순번은 스크립트 안에서 붙이므로 로그에는 항상 연속된 순번으로 기록됨
+_RECORD_CHANGES = """
+local count = #ARGV - 1
+local last_seq = redis.call('INCRBY', KEYS[1], count)
+for index = 2, #ARGV do
+    local seq = last_seq - count + index - 1
+    local change = cjson.decode(ARGV[index])
+    change['seq'] = seq
+    redis.call('ZADD', KEYS[2], seq, cjson.encode(change))
+end
+redis.call('ZREMRANGEBYRANK', KEYS[2], 0, -(tonumber(ARGV[1]) + 1))
+return last_seq
+"""
+
+
+def to_chosung(text: str) -> str:
+    """완성형 음절을 초성으로 변환 (공백 제거, 그 외 문자는 그대로)"""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSUNG[(code - HANGUL_BASE) // SYLLABLES_PER_CHOSUNG])
+        elif not char.isspace():
+            chars.append(char)
+    return "".join(chars)
+
+
+class AutocompleteIndex:
+    """
+    자동완성 접두어 색인 (프로세스 메모리, 변경 시 새 객체로 교체)
+
+    이름의 각 글자 위치부터 시작하는 접미어를 정렬해 두고 이분 탐색으로 접두어 범위를 찾습니다.
+    (이름 중간부터 입력해도 검색되도록 - 예: "막걸리" → "우리쌀막걸리")
+    """
+
+    def __init__(
+        self,
+        entries: Dict[str, Dict[str, Any]],
+        applied_seq: int,
+        keys: Optional[List[Tuple[str, int, str]]] = None,
+        chosung_keys: Optional[List[Tuple[str, int, str]]] = None,
+        added_entry_ids: Optional[Iterable[str]] = None,
+    ):
+        self.entries = entries
+        self.applied_seq = applied_seq
+        self.keys = keys if keys is not None else []
+        self.chosung_keys = chosung_keys if chosung_keys is not None else []
+        for entry_id in entries if added_entry_ids is None else added_entry_ids:
+            self._add_keys(entry_id, entries[entry_id]["name"])
+        self.keys.sort()
+        self.chosung_keys.sort()
+
+    def _add_keys(self, entry_id: str, name: str) -> None:
+        text = SearchIndexService.normalize(name)
+        for position, char in enumerate(text):
+            if not char.isspace():
+                self.keys.append((text[position:], position, entry_id))
+
+        chosung = to_chosung(text)
+        for position in range(len(chosung)):
+            self.chosung_keys.append((chosung[position:], position, entry_id))
+
+    @staticmethod
+    def _syllable_range(query: str) -> Tuple[str, str]:
+        """
+        입력 중인 마지막 글자를 고려한 접두어 범위
+
+        - 받침 없는 음절("막거"): 같은 초성+중성의 모든 음절 ("막걸" 포함)
+        - 초성만 입력("막ㄱ"): 해당 초성으로 시작하는 모든 음절
+        """
+        head, last = query[:-1], query[-1]
+        code = ord(last)
+        if last in CHOSUNG_INDEX:
+            start = HANGUL_BASE + CHOSUNG_INDEX[last] * SYLLABLES_PER_CHOSUNG
+            return head + chr(start), head + chr(start + SYLLABLES_PER_CHOSUNG)
+        if HANGUL_BASE <= code <= HANGUL_LAST and (code - HANGUL_BASE) % JONGSUNG_COUNT == 0:
+            return query, head + chr(code + JONGSUNG_COUNT)
+        return query, query + "\uffff"
+
+    def search(self, query: str, limit: int, max_candidates: int) -> List[Dict[str, Any]]:
+        compact = query.replace(" ", "")
+        if compact and all(char in CHOSUNG_INDEX for char in compact):
+            keys, (low, high) = self.chosung_keys, (compact, compact + "\uffff")
+        else:
+            keys, (low, high) = self.keys, self._syllable_range(query)
+
+        # 이름 앞부분 일치를 우선, 같은 위치면 짧은 이름 우선
+        best: Dict[str, int] = {}
+        start = bisect.bisect_left(keys, (low,))
+        end = min(bisect.bisect_left(keys, (high,)), start + max_candidates)
+        for _, position, entry_id in keys[start:end]:
+            if position < best.get(entry_id, position + 1):
+                best[entry_id] = position
+
+        ranked = sorted(best, key=lambda entry_id: (best[entry_id], len(self.entries[entry_id]["name"]), entry_id))
+        return [self.entries[entry_id] for entry_id in ranked[:limit]]
+
+    def apply_changes(self, changes: Iterable[Dict[str, Any]], applied_seq: int) -> "AutocompleteIndex":
+        """변경 목록을 반영한 새 색인 반환 (변경된 항목의 키만 교체, DB 조회 없음)"""
+        entries = dict(self.entries)
+        changed = set()
+        for change in changes:
+            entry_id = f"{change['type']}:{change['id']}"
+            changed.add(entry_id)
+            if change.get("name"):
+                entries[entry_id] = {"type": change["type"], "id": change["id"], "name": change["name"]}
+            else:
+                entries.pop(entry_id, None)
+
+        return AutocompleteIndex(
+            entries,
+            applied_seq,
+            keys=[key for key in self.keys if key[2] not in changed],
+            chosung_keys=[key for key in self.chosung_keys if key[2] not in changed],
+            added_entry_ids=[entry_id for entry_id in changed if entry_id in entries],
+        )
+
+
+class AutocompleteService:
+    """
+    검색창 자동완성 (술/패키지/양조장 이름)
+
+    색인은 프로세스 메모리에 두어 DB/Redis 조회 없이 응답합니다.
+    이름 변경은 커밋 후 Redis 변경 로그에 기록하고, 각 프로세스는 SYNC_INTERVAL마다
+    로그에서 새 변경분만 가져와 색인을 갱신합니다.
+
+    색인 전체 생성(DB 조회)은 요청 처리 중에 하지 않습니다. 프로세스 시작 시(asgi/wsgi) 백그라운드에서 만들고,
+    로그가 잘려 이어받을 수 없으면 백그라운드에서 다시 만드는 동안 이전 색인으로 응답합니다.
+    """
+
+    SEQ_KEY = "products:autocomplete:seq"
+    CHANGELOG_KEY = "products:autocomplete:changelog"
+
+    # 변경 로그 보관 개수
+    CHANGELOG_SIZE = 1000
+
+    # 변경 로그 확인 간격 (초)
+    SYNC_INTERVAL = 5
+
+    DEFAULT_LIMIT = 10
+    MAX_LIMIT = 20
+
+    # 접두어 범위에서 살펴볼 최대 후보 수 (짧은 입력의 응답 시간 제한)
+    MAX_CANDIDATES = 200
+
+    _index: Optional[AutocompleteIndex] = None
+    _last_sync = 0.0
+    _lock = threading.Lock()
+    _rebuilding = False
+
+    @staticmethod
+    def _redis():
+        return get_redis_connection("default")
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """검색어 정규화 (NFKC로 바뀐 초성을 호환용 자모로 복원)"""
+        return SearchIndexService.normalize(query).translate(_CONJOINING_CHOSUNG)
+
+    @staticmethod
+    def load_entries() -> Dict[str, Dict[str, Any]]:
+        """DB에서 자동완성 대상 이름 조회"""
+        entries = {}
+        for entry_type, model in (("drink", Drink), ("package", Package), ("brewery", Brewery)):
+            for pk, name in model.objects.values_list("id", "name"):
+                if name:
+                    entries[f"{entry_type}:{pk}"] = {"type": entry_type, "id": pk, "name": name}
+        return entries
+
+    @staticmethod
+    def rebuild() -> AutocompleteIndex:
+        """DB에서 색인 전체 재생성"""
+        # 조회 중 들어오는 변경은 다음 동기화 때 다시 반영되도록 조회 전 순번을 기록
+        try:
+            applied_seq = int(AutocompleteService._redis().get(AutocompleteService.SEQ_KEY) or 0)
+        except RedisError:
+            # 순번을 모르면 보관 중인 로그 전체를 다시 반영 (같은 변경은 여러 번 반영해도 결과가 같음)
+            logger.warning("자동완성 순번 조회 실패", exc_info=True)
+            applied_seq = 0
+        index = AutocompleteIndex(AutocompleteService.load_entries(), applied_seq)
+        with AutocompleteService._lock:
+            AutocompleteService._index = index
+            AutocompleteService._last_sync = time.monotonic()
+        return index
+
+    @staticmethod
+    def rebuild_in_background() -> None:
+        """색인 전체 재생성을 백그라운드 스레드에서 실행 (이미 실행 중이면 무시)"""
+        with AutocompleteService._lock:
+            if AutocompleteService._rebuilding:
+                return
+            AutocompleteService._rebuilding = True
+        threading.Thread(target=AutocompleteService._rebuild, daemon=True).start()
+
+    @staticmethod
+    def _rebuild() -> None:
+        try:
+            AutocompleteService.rebuild()
+        except Exception:
+            logger.exception("자동완성 색인 생성 실패")
+        finally:
+            AutocompleteService._rebuilding = False
+            connections.close_all()
+
+    @staticmethod
+    def sync(force: bool = False) -> Optional[AutocompleteIndex]:
+        """
+        변경 로그의 새 변경분을 색인에 반영 (SYNC_INTERVAL마다 한 번)
+
+        Args:
+            force: 간격과 무관하게 즉시 확인
+
+        Returns:
+            Optional[AutocompleteIndex]: 현재 색인 (아직 생성 전이면 None)
+        """
+        index = AutocompleteService._index
+        if index is None:
+            AutocompleteService.rebuild_in_background()
+            return None
+        if not force and time.monotonic() - AutocompleteService._last_sync < AutocompleteService.SYNC_INTERVAL:
+            return index
+
+        with AutocompleteService._lock:
+            index = AutocompleteService._index or index
+            AutocompleteService._last_sync = time.monotonic()
+            try:
+                pipeline = AutocompleteService._redis().pipeline()
+                pipeline.zrange(AutocompleteService.CHANGELOG_KEY, 0, 0, withscores=True)
+                pipeline.zrangebyscore(
+                    AutocompleteService.CHANGELOG_KEY, f"({index.applied_seq}", "+inf", withscores=True
+                )
+                oldest, changes = pipeline.execute()
+            except Exception:
+                logger.warning("자동완성 변경 로그 조회 실패", exc_info=True)
+                return index
+
+            if not changes:
+                return index
+
+            # 로그가 잘려 중간 변경분이 없으면 전체 재생성 (생성 중에는 현재 색인으로 응답)
+            if oldest and int(oldest[0][1]) > index.applied_seq + 1:
+                needs_rebuild = True
+            else:
+                needs_rebuild = False
+                # 연속된 순번까지만 반영 (빠진 순번 이후는 다음 동기화에서 다시 조회)
+                contiguous = []
+                for member, seq in changes:
+                    if int(seq) != index.applied_seq + len(contiguous) + 1:
+                        break
+                    contiguous.append(json.loads(member))
+                if contiguous:
+                    index = index.apply_changes(contiguous, applied_seq=index.applied_seq + len(contiguous))
+                    AutocompleteService._index = index
+
+        if needs_rebuild:
+            AutocompleteService.rebuild_in_background()
+        return index
+
+    @staticmethod
+    def record_change(entry_type: str, pk: Any, name: Optional[str]) -> None:
+        """
+        이름 추가/변경/삭제를 커밋 후 변경 로그에 기록 (시그널에서 호출)
+
+        Args:
+            entry_type: "drink" / "package" / "brewery"
+            pk: 객체 ID
+            name: 새 이름 (삭제 시 None)
+        """
+        AutocompleteService.record_changes([(entry_type, pk, name)])
+
+    @staticmethod
+    def record_changes(changes: Iterable[Tuple[str, Any, Optional[str]]]) -> None:
+        """
+        여러 변경을 커밋 후 한 번에 기록 (일괄 등록용, 롤백되면 기록하지 않음)
+
+        변경 수가 CHANGELOG_SIZE를 넘으면 로그가 잘려 각 프로세스가 DB에서 색인을 재생성합니다.
+
+        Args:
+            changes: (entry_type, pk, name) 목록
+        """
+        changes = list(changes)
+        if changes:
+            transaction.on_commit(partial(AutocompleteService._write_changes, changes))
+
+    @staticmethod
+    def _write_changes(changes: List[Tuple[str, Any, Optional[str]]]) -> None:
+        """순번 예약과 로그 기록을 스크립트 한 번으로 실행 (Redis 장애 시 로그만 남김)"""
+        members = [
+            json.dumps({"type": entry_type, "id": pk, "name": name}, ensure_ascii=False)
+            for entry_type, pk, name in changes
+        ]
+        try:
+            AutocompleteService._redis().register_script(_RECORD_CHANGES)(
+                keys=[AutocompleteService.SEQ_KEY, AutocompleteService.CHANGELOG_KEY],
+                args=[AutocompleteService.CHANGELOG_SIZE, *members],
+            )
+        except RedisError:
+            logger.warning("자동완성 변경 로그 기록 실패", exc_info=True)
+
+    @staticmethod
+    def suggest(query: str, limit: int = DEFAULT_LIMIT) -> List[Dict[str, Any]]:
+        """
+        자동완성 후보 조회 (메모리 색인, 이름 앞부분 일치 우선)
+
+        Args:
+            query: 입력 중인 검색어 (완성형 음절 또는 초성, 예: "막거", "ㅁㄱㄹ")
+            limit: 최대 개수
+
+        Returns:
+            List[Dict]: [{"type": "drink", "id": 1, "name": "우리쌀막걸리"}, ...]
+        """
+        query = AutocompleteService.normalize_query(query)
+        if not query:
+            return []
+        index = AutocompleteService.sync()
+        if index is None:
+            # 프로세스 시작 직후 색인 생성 중
+            return []
+        limit = max(1, min(limit, AutocompleteService.MAX_LIMIT))
+        return index.search(query, limit, AutocompleteService.MAX_CANDIDATES)
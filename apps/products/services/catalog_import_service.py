@@ -0,0 +1,425 @@
+# apps/products/services/catalog_import_service.py
+
+import csv
+import json
+import logging
+from contextlib import nullcontext
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from django.db import DatabaseError, transaction
+
+from apps.products.models import (
+    Brewery,
+    Drink,
+    Package,
+    PackageItem,
+    Product,
+    ProductImage,
+)
+from apps.products.serializers.product.bulk_import import CatalogImportRowSerializer
+
+from .catalog_version_service import CatalogVersionService
+from .package_composition_service import PackageCompositionService
+from .search_index_service import SearchIndexService
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_FIELDS = [
+    "price",
+    "original_price",
+    "discount",
+    "description",
+    "description_image_url",
+    "is_gift_suitable",
+    "is_award_winning",
+    "is_regional_specialty",
+    "is_limited_edition",
+    "is_premium",
+    "is_organic",
+]
+
+DRINK_FIELDS = [
+    "ingredients",
+    "alcohol_type",
+    "abv",
+    "volume_ml",
+    "sweetness_level",
+    "acidity_level",
+    "body_level",
+    "carbonation_level",
+    "bitterness_level",
+    "aroma_level",
+]
+
+# CSV에서 여러 값을 담는 컬럼 (LIST_SEPARATOR로 구분)
+LIST_COLUMNS = {"images", "drinks"}
+
+
+class CatalogImportService:
+    """
+    카탈로그 일괄 등록 (CSV/JSONL, 관리 명령 및 관리자 API 공용)
+
+    입력을 한 줄씩 읽어 CHUNK_SIZE 행 단위로 처리합니다.
+    - 행 형식 검사: CatalogImportRowSerializer (DB 조회 없음)
+    - 양조장 조회/술 중복/패키지 구성 술 확인: 묶음당 집합 쿼리 한 번씩
+    - 저장: 모델별 bulk_create (검색 문서/메인 이미지 URL은 메모리에서 계산해 함께 저장)
+
+    bulk_create는 모델 시그널을 발생시키지 않으므로 캐시 무효화는 등록이 끝난 뒤 한 번만 수행합니다.
+    """
+
+    CHUNK_SIZE = 500
+
+    # 응답에 포함할 최대 오류 행 수 (전체 오류 수는 error_count)
+    MAX_REPORTED_ERRORS = 1000
+
+    LIST_SEPARATOR = "|"
+
+    FORMATS = ("csv", "jsonl")
+
+    DUPLICATE_DRINK_MESSAGE = "같은 양조장에서 동일한 이름의 술이 이미 존재합니다."
+
+    CHUNK_FAILED_MESSAGE = "같은 묶음 저장 중 오류가 발생해 등록하지 못했습니다."
+
+    # ------------------------------------------------------------------------
+    # 입력 파싱
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def detect_format(filename: str) -> Optional[str]:
+        """파일 확장자로 입력 형식 판단 (csv / jsonl)"""
+        extension = filename.rsplit(".", 1)[-1].lower()
+        if extension in ("jsonl", "ndjson"):
+            return "jsonl"
+        if extension == "csv":
+            return "csv"
+        return None
+
+    @staticmethod
+    def iter_rows(lines: Iterable[str], file_format: str) -> Iterator[Tuple[int, Any]]:
+        """
+        입력 줄을 행 데이터로 변환 (스트리밍)
+
+        Args:
+            lines: 텍스트 줄 (파일 객체 등)
+            file_format: "csv" 또는 "jsonl"
+
+        Returns:
+            Iterator: (행 번호, 행 데이터) - JSON 파싱 실패 행은 ValueError를 행 데이터로 전달
+        """
+        if file_format == "csv":
+            reader = csv.DictReader(lines)
+            for row in reader:
+                yield reader.line_num, CatalogImportService._from_csv(row)
+            return
+
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as e:
+                yield line_number, ValueError(f"JSON 형식 오류: {e}")
+
+    @staticmethod
+    def _from_csv(row: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """CSV 행 변환 (빈 칸은 생략, 목록 컬럼은 LIST_SEPARATOR로 분리)"""
+        data: Dict[str, Any] = {}
+        for column, value in row.items():
+            if column is None or value is None or not value.strip():
+                continue
+            column = column.strip()
+            if column in LIST_COLUMNS:
+                data[column] = [
+                    item.strip() for item in value.split(CatalogImportService.LIST_SEPARATOR) if item.strip()
+                ]
+            else:
+                data[column] = value.strip()
+        return data
+
+    # ------------------------------------------------------------------------
+    # 일괄 등록
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def import_file(lines: Iterable[str], file_format: str, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        CSV/JSONL 입력 일괄 등록
+
+        Args:
+            lines: 텍스트 줄 (파일 객체 등)
+            file_format: "csv" 또는 "jsonl"
+            dry_run: True면 검증만 수행 (모든 변경 롤백)
+
+        Returns:
+            Dict: 등록 결과 (import_rows 참고)
+        """
+        return CatalogImportService.import_rows(CatalogImportService.iter_rows(lines, file_format), dry_run=dry_run)
+
+    @staticmethod
+    def import_rows(rows: Iterable[Tuple[int, Any]], dry_run: bool = False) -> Dict[str, Any]:
+        """
+        행 데이터 일괄 등록 (CHUNK_SIZE 행 단위, 묶음마다 트랜잭션)
+
+        오류가 있는 행만 건너뛰고 나머지 행은 등록합니다.
+
+        Args:
+            rows: (행 번호, 행 데이터) 목록
+            dry_run: True면 검증만 수행 (모든 변경 롤백)
+
+        Returns:
+            Dict: {
+                "dry_run": bool,
+                "total_rows": 전체 행 수,
+                "created": {"breweries": n, "drinks": n, "packages": n, "products": n, "images": n},
+                "error_count": 오류 행 수,
+                "errors": [{"row": 행 번호, "errors": {...}}, ...] (최대 MAX_REPORTED_ERRORS개),
+            }
+        """
+        state = _ImportState()
+
+        # 검증만 하는 경우 전체를 한 트랜잭션으로 묶어 마지막에 롤백
+        try:
+            with transaction.atomic() if dry_run else nullcontext():
+                chunk: List[Tuple[int, Any]] = []
+                for row in rows:
+                    chunk.append(row)
+                    if len(chunk) >= CatalogImportService.CHUNK_SIZE:
+                        CatalogImportService._import_chunk(chunk, state)
+                        chunk = []
+                if chunk:
+                    CatalogImportService._import_chunk(chunk, state)
+
+                if dry_run:
+                    transaction.set_rollback(True)
+        finally:
+            # 중간에 실패해도 이미 커밋된 묶음은 반영되도록 무효화
+            if not dry_run and any(state.counts.values()):
+                CatalogVersionService.invalidate_all(state.autocomplete_changes)
+
+        logger.info(
+            "카탈로그 일괄 등록%s: %d행, 생성 %s, 오류 %d행",
+            "(검증)" if dry_run else "",
+            state.total_rows,
+            state.counts,
+            state.error_count,
+        )
+
+        return {
+            "dry_run": dry_run,
+            "total_rows": state.total_rows,
+            "created": state.counts,
+            "error_count": state.error_count,
+            "errors": sorted(state.errors, key=lambda error: error["row"]),
+        }
+
+    @staticmethod
+    def _import_chunk(chunk: List[Tuple[int, Any]], state: "_ImportState") -> None:
+        """
+        묶음 하나 검증/저장 (트랜잭션 - 예기치 않은 DB 오류 시 묶음 전체 롤백)
+
+        저장 결과(생성 수, 양조장/술 목록, 자동완성 변경)는 묶음 상태에 모았다가 커밋된 뒤에만 전체 상태에 합칩니다.
+        롤백된 묶음은 저장하려던 행을 모두 오류로 보고하고 다음 묶음을 계속 처리합니다.
+        """
+        state.total_rows += len(chunk)
+
+        individual_rows: List[Tuple[int, Dict[str, Any]]] = []
+        package_rows: List[Tuple[int, Dict[str, Any]]] = []
+        for row_number, data in chunk:
+            if isinstance(data, ValueError):
+                state.add_error(row_number, {"non_field_errors": [str(data)]})
+                continue
+            if not isinstance(data, dict):
+                state.add_error(row_number, {"non_field_errors": ["행 데이터는 객체여야 합니다."]})
+                continue
+            serializer = CatalogImportRowSerializer(data=data)
+            if not serializer.is_valid():
+                state.add_error(row_number, serializer.errors)
+                continue
+            validated = serializer.validated_data
+            (individual_rows if validated["type"] == "individual" else package_rows).append((row_number, validated))
+
+        chunk_state = state.begin_chunk()
+        try:
+            with transaction.atomic():
+                CatalogImportService._create_individual_products(individual_rows, chunk_state)
+                CatalogImportService._create_package_products(package_rows, chunk_state)
+        except DatabaseError:
+            logger.exception("카탈로그 일괄 등록 묶음 롤백 (%d행)", len(individual_rows) + len(package_rows))
+            for row_number, _ in sorted(individual_rows + package_rows, key=lambda row: row[0]):
+                state.add_error(row_number, {"non_field_errors": [CatalogImportService.CHUNK_FAILED_MESSAGE]})
+            return
+        state.merge(chunk_state)
+
+    @staticmethod
+    def _resolve_breweries(rows: List[Tuple[int, Dict[str, Any]]], state: "_ImportState") -> None:
+        """행의 양조장 이름을 ID로 변환 (조회 한 번, 없는 양조장은 bulk_create)"""
+        names = {data["brewery"] for _, data in rows} - state.breweries.keys()
+        if not names:
+            return
+
+        # 같은 이름이 여러 개면 활성 양조장, 먼저 등록된 양조장 우선
+        for pk, name, is_active in (
+            Brewery.objects.filter(name__in=names).order_by("-is_active", "id").values_list("id", "name", "is_active")
+        ):
+            state.breweries.setdefault(name, (pk, is_active))
+
+        regions = {}
+        for _, data in rows:
+            regions.setdefault(data["brewery"], data.get("brewery_region") or None)
+        new_breweries = [Brewery(name=name, region=regions[name]) for name in sorted(names - state.breweries.keys())]
+        for brewery in Brewery.objects.bulk_create(new_breweries):
+            state.breweries[brewery.name] = (brewery.pk, True)
+            state.autocomplete_changes.append(("brewery", brewery.pk, brewery.name))
+        state.counts["breweries"] += len(new_breweries)
+
+    @staticmethod
+    def _create_individual_products(rows: List[Tuple[int, Dict[str, Any]]], state: "_ImportState") -> None:
+        if not rows:
+            return
+        CatalogImportService._resolve_breweries(rows, state)
+
+        # 기존 술 중복 확인 (조회 한 번)
+        brewery_ids = {state.breweries[data["brewery"]][0] for _, data in rows}
+        existing = set(
+            Drink.objects.filter(brewery_id__in=brewery_ids, name__in={data["name"] for _, data in rows}).values_list(
+                "brewery_id", "name"
+            )
+        )
+
+        drinks: List[Drink] = []
+        pending: List[Tuple[Drink, Dict[str, Any]]] = []
+        for row_number, data in rows:
+            brewery_id, is_active = state.breweries[data["brewery"]]
+            if not is_active:
+                state.add_error(row_number, {"brewery": ["비활성 상태인 양조장입니다."]})
+                continue
+            key = (brewery_id, data["name"])
+            if key in existing or key in state.drink_keys:
+                state.add_error(row_number, {"name": [CatalogImportService.DUPLICATE_DRINK_MESSAGE]})
+                continue
+            state.drink_keys.add(key)
+
+            drink = Drink(brewery_id=brewery_id, name=data["name"], **{field: data[field] for field in DRINK_FIELDS})
+            drinks.append(drink)
+            pending.append((drink, data))
+
+        Drink.objects.bulk_create(drinks)
+        state.counts["drinks"] += len(drinks)
+
+        products = []
+        for drink, data in pending:
+            document_parts = [drink.name, data["brewery"], drink.get_alcohol_type_display(), data["description"]]
+            products.append(CatalogImportService._build_product(data, document_parts, drink=drink))
+            state.autocomplete_changes.append(("drink", drink.pk, drink.name))
+        CatalogImportService._save_products(products, [data for _, data in pending], state)
+
+    @staticmethod
+    def _create_package_products(rows: List[Tuple[int, Dict[str, Any]]], state: "_ImportState") -> None:
+        if not rows:
+            return
+
+        # 구성 술 확인 (조회 한 번 - 앞선 묶음/같은 묶음에서 등록한 술 포함)
+        refs = {ref for _, data in rows for ref in data["drinks"]}
+        found: Dict[Tuple[str, str], Tuple[int, str]] = {}
+        for pk, brewery_name, name, alcohol_type in (
+            Drink.objects.filter(brewery__name__in={ref[0] for ref in refs}, name__in={ref[1] for ref in refs})
+            .order_by("id")
+            .values_list("id", "brewery__name", "name", "alcohol_type")
+        ):
+            found.setdefault((brewery_name, name), (pk, alcohol_type))
+
+        packages: List[Package] = []
+        pending: List[Tuple[Package, List[Tuple[str, str]], Dict[str, Any]]] = []
+        for row_number, data in rows:
+            missing = [
+                f"{brewery_name}/{name}" for brewery_name, name in data["drinks"] if (brewery_name, name) not in found
+            ]
+            if missing:
+                state.add_error(row_number, {"drinks": [f"존재하지 않는 술이 포함되어 있습니다: {', '.join(missing)}"]})
+                continue
+            package = Package(name=data["name"], type=data["package_type"])
+            packages.append(package)
+            pending.append((package, data["drinks"], data))
+
+        Package.objects.bulk_create(packages)
+        PackageItem.objects.bulk_create(
+            [
+                PackageItem(package=package, drink_id=found[ref][0])
+                for package, drink_refs, _ in pending
+                for ref in drink_refs
+            ]
+        )
+        PackageCompositionService.refresh([package.pk for package in packages])
+        state.counts["packages"] += len(packages)
+
+        products = []
+        for package, drink_refs, data in pending:
+            # SearchIndexService.build_document와 같은 구성 (구성 술은 ID 순)
+            document_parts = [package.name]
+            for ref in sorted(drink_refs, key=lambda ref: found[ref][0]):
+                document_parts.extend([ref[1], ref[0], Drink.AlcoholType(found[ref][1]).label])
+            document_parts.append(data["description"])
+            products.append(CatalogImportService._build_product(data, document_parts, package=package))
+            state.autocomplete_changes.append(("package", package.pk, package.name))
+        CatalogImportService._save_products(products, [data for _, _, data in pending], state)
+
+    @staticmethod
+    def _build_product(data: Dict[str, Any], document_parts: Sequence[Optional[str]], **target: Any) -> Product:
+        document = SearchIndexService.compose_document(document_parts)
+        return Product(
+            **target,
+            **{field: data[field] for field in PRODUCT_FIELDS if field in data},
+            main_image_url=data["images"][0],
+            search_document=document,
+            search_grams=SearchIndexService.extract_grams(document),
+        )
+
+    @staticmethod
+    def _save_products(products: List[Product], rows: List[Dict[str, Any]], state: "_ImportState") -> None:
+        """상품과 이미지 저장 (첫 번째 이미지가 메인 이미지)"""
+        Product.objects.bulk_create(products, batch_size=CatalogImportService.CHUNK_SIZE)
+        images = [
+            ProductImage(product=product, image_url=image_url, is_main=index == 0)
+            for product, data in zip(products, rows)
+            for index, image_url in enumerate(data["images"])
+        ]
+        ProductImage.objects.bulk_create(images, batch_size=CatalogImportService.CHUNK_SIZE)
+        state.counts["products"] += len(products)
+        state.counts["images"] += len(images)
+
+
+class _ImportState:
+    """일괄 등록 진행 상태 (묶음 간 공유 - 커밋된 묶음만 반영)"""
+
+    def __init__(self) -> None:
+        self.total_rows = 0
+        self.counts = {"breweries": 0, "drinks": 0, "packages": 0, "products": 0, "images": 0}
+        self.errors: List[Dict[str, Any]] = []
+        self.error_count = 0
+        # 양조장 이름 → (ID, 활성 여부)
+        self.breweries: Dict[str, Tuple[int, bool]] = {}
+        # 이번 등록에서 추가한 술 (양조장 ID, 이름) - 파일 안의 중복 확인용
+        self.drink_keys: Set[Tuple[int, str]] = set()
+        self.autocomplete_changes: List[Tuple[str, Any, Optional[str]]] = []
+
+    def add_error(self, row_number: int, errors: Any) -> None:
+        self.error_count += 1
+        if len(self.errors) < CatalogImportService.MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row_number, "errors": errors})
+
+    def begin_chunk(self) -> "_ImportState":
+        """묶음 상태 생성 (양조장/술 목록은 복사본 - 롤백 시 그대로 버림)"""
+        chunk_state = _ImportState()
+        chunk_state.breweries = dict(self.breweries)
+        chunk_state.drink_keys = set(self.drink_keys)
+        return chunk_state
+
+    def merge(self, chunk_state: "_ImportState") -> None:
+        """커밋된 묶음 상태 반영"""
+        for key, count in chunk_state.counts.items():
+            self.counts[key] += count
+        for error in chunk_state.errors:
+            self.add_error(error["row"], error["errors"])
+        self.breweries = chunk_state.breweries
+        self.drink_keys = chunk_state.drink_keys
+        self.autocomplete_changes.extend(chunk_state.autocomplete_changes)
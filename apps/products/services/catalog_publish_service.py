@@ -0,0 +1,179 @@
+# apps/products/services/catalog_publish_service.py
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import brotli
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from apps.products.models import Product
+from apps.products.serializers.product.fast import ProductCardFastSerializer
+
+from .catalog_version_service import CatalogVersionService
+
+
+class CatalogPublishService:
+    """
+    활성 카탈로그 정적 배포본 생성 (nginx/CDN이 Django 없이 서빙)
+
+    STATIC_ROOT/catalog/ 아래에 다음 파일을 기록합니다.
+
+    - <버전>/products-0001.json ...: 상품 카드 묶음 (+ .gz, .br 사전 압축본) - 내용 해시가 버전이므로 불변
+    - manifest.json: 현재 버전과 묶음 목록 (변경 시 os.replace로 교체 - 짧게 캐시)
+
+    카탈로그 버전(CatalogVersionService)이 그대로면 다시 만들지 않으며,
+    내용이 같으면 같은 버전 디렉터리를 재사용합니다.
+    조회/좋아요 수는 카탈로그 버전을 올리지 않으므로 생성 시점 값입니다.
+    """
+
+    DIRECTORY_NAME = "catalog"
+    MANIFEST_NAME = "manifest.json"
+
+    # 묶음당 상품 수
+    SHARD_SIZE = 500
+
+    # 보관할 이전 버전 수 (교체 직전 manifest를 받은 클라이언트가 이전 묶음을 받을 수 있도록)
+    KEEP_VERSIONS = 2
+
+    @staticmethod
+    def get_root() -> Path:
+        if not settings.STATIC_ROOT:
+            raise ImproperlyConfigured("카탈로그 정적 배포본을 만들려면 STATIC_ROOT 설정이 필요합니다.")
+        return Path(settings.STATIC_ROOT) / CatalogPublishService.DIRECTORY_NAME
+
+    @staticmethod
+    def read_manifest() -> Optional[Dict[str, Any]]:
+        """
+        현재 manifest 조회
+
+        Returns:
+            Optional[Dict]: manifest 내용 (없으면 None)
+        """
+        try:
+            with open(CatalogPublishService.get_root() / CatalogPublishService.MANIFEST_NAME, encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def render_shards() -> Iterator[List[Dict[str, Any]]]:
+        """
+        활성 상품 카드를 SHARD_SIZE개씩 묶어서 생성 (목록 API와 같은 카드 형식)
+
+        Returns:
+            Iterator[List[Dict]]: 상품 카드 묶음
+        """
+        queryset = Product.objects.filter(status=Product.Status.ACTIVE).order_by("created_at", "id")
+        rows = ProductCardFastSerializer.project(queryset).iterator(chunk_size=CatalogPublishService.SHARD_SIZE)
+
+        shard: List[Dict[str, Any]] = []
+        for row in rows:
+            card = ProductCardFastSerializer.to_representation(row)
+            # 사용자별 값은 정적 파일에 넣지 않음
+            card.pop("is_liked")
+            shard.append(card)
+            if len(shard) >= CatalogPublishService.SHARD_SIZE:
+                yield shard
+                shard = []
+        if shard:
+            yield shard
+
+    @staticmethod
+    def _write_file(path: Path, content: bytes) -> None:
+        path.write_bytes(content)
+        # 압축 결과가 실행마다 같도록 mtime 고정
+        path.with_name(path.name + ".gz").write_bytes(gzip.compress(content, compresslevel=9, mtime=0))
+        path.with_name(path.name + ".br").write_bytes(brotli.compress(content))
+
+    @staticmethod
+    def publish(force: bool = False) -> Dict[str, Any]:
+        """
+        카탈로그 정적 배포본 생성 및 manifest 교체
+
+        Args:
+            force: 카탈로그 버전이 같아도 다시 생성
+
+        Returns:
+            Dict: {"published": manifest 교체 여부, "version": 배포본 버전, "product_count": 상품 수}
+        """
+        root = CatalogPublishService.get_root()
+        catalog_version = CatalogVersionService.get_version()
+        manifest = CatalogPublishService.read_manifest()
+        if not force and manifest is not None and manifest["catalog_version"] == catalog_version:
+            return {"published": False, "version": manifest["version"], "product_count": manifest["product_count"]}
+
+        # 묶음을 임시 디렉터리에 기록하면서 전체 내용 해시 계산
+        root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=root, prefix=".staging-"))
+        try:
+            digest = hashlib.sha256()
+            shards: List[Dict[str, Any]] = []
+            for number, cards in enumerate(CatalogPublishService.render_shards(), start=1):
+                content = json.dumps({"products": cards}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                digest.update(content)
+                name = f"products-{number:04d}.json"
+                CatalogPublishService._write_file(staging / name, content)
+                shards.append({"name": name, "count": len(cards), "bytes": len(content)})
+
+            version = digest.hexdigest()[:16]
+            for shard in shards:
+                # manifest 기준 상대 경로
+                shard["path"] = f"{version}/{shard.pop('name')}"
+            version_dir = root / version
+            if version_dir.exists():
+                # 내용이 같은 배포본이 이미 있음 (manifest의 카탈로그 버전만 갱신)
+                shutil.rmtree(staging)
+            else:
+                staging.chmod(0o755)
+                os.rename(staging, version_dir)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        new_manifest = {
+            "version": version,
+            "catalog_version": catalog_version,
+            "generated_at": timezone.now().isoformat(),
+            "product_count": sum(shard["count"] for shard in shards),
+            "shard_size": CatalogPublishService.SHARD_SIZE,
+            "encodings": ["br", "gzip"],
+            "shards": shards,
+        }
+        CatalogPublishService._replace_manifest(root, new_manifest)
+        CatalogPublishService._remove_old_versions(root, keep=version)
+
+        changed = manifest is None or manifest["version"] != version
+        return {"published": changed, "version": version, "product_count": new_manifest["product_count"]}
+
+    @staticmethod
+    def _replace_manifest(root: Path, manifest: Dict[str, Any]) -> None:
+        """manifest 원자적 교체 (임시 파일 기록 후 os.replace)"""
+        content = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+        fd, temp_path = tempfile.mkstemp(dir=root, prefix=".manifest-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, root / CatalogPublishService.MANIFEST_NAME)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def _remove_old_versions(root: Path, keep: str) -> None:
+        """현재 버전과 최근 KEEP_VERSIONS개를 제외한 이전 버전 디렉터리 삭제"""
+        versions = sorted(
+            (path for path in root.iterdir() if path.is_dir() and not path.name.startswith(".") and path.name != keep),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for path in versions[CatalogPublishService.KEEP_VERSIONS :]:
+            shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,365 @@
+# apps/products/services/catalog_snapshot_service.py
+
+import fcntl
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, cast
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models.functions import Coalesce
+
+from apps.products.models import Product
+
+logger = logging.getLogger(__name__)
+
+# 맛 벡터 차원 순서 (슬라이더 파라미터명 → 인덱스)
+TASTE_DIMENSIONS = ["sweetness", "acidity", "body", "carbonation", "bitterness", "aroma"]
+
+# 상품 특성 비트 (flags 컬럼)
+FLAG_IS_PACKAGE = 1 << 0
+FLAG_HAS_TASTE = 1 << 1
+
+# 파일 헤더: 매직, 포맷 버전, 카탈로그 스냅샷 버전, 생성 시각, 상품 수
+_HEADER = struct.Struct("<4sHxxQdI")
+_MAGIC = b"CSNP"
+_FORMAT_VERSION = 2
+_ALIGNMENT = 8
+
+# 컬럼 순서/형식 (이름, dtype, 행당 원소 수 - None이면 1차원)
+# 맛 최근접 검색(TasteMatchService)이 읽는 컬럼만 기록
+_COLUMNS: List[Tuple[str, str, Optional[int]]] = [
+    ("ids", "u1", 16),
+    ("taste", "<f4", len(TASTE_DIMENSIONS)),
+    ("spread", "<f4", None),
+    ("flags", "u1", None),
+]
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+class ProductIdColumn(Sequence[str]):
+    """스냅샷의 상품 ID 컬럼 (16바이트 UUID를 접근 시에만 문자열로 변환)"""
+
+    def __init__(self, ids: np.ndarray):
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, position):  # type: ignore[override]
+        if isinstance(position, slice):
+            return [str(uuid.UUID(bytes=row.tobytes())) for row in self._ids[position]]
+        return str(uuid.UUID(bytes=self._ids[position].tobytes()))
+
+
+class CatalogSnapshot:
+    """
+    mmap으로 연 카탈로그 스냅샷 (읽기 전용)
+
+    컬럼 배열은 파일 매핑 위의 numpy 뷰이므로 복사가 없고,
+    같은 파일을 연 워커들은 운영체제 페이지 캐시의 같은 물리 메모리를 공유합니다.
+    """
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, format_version, self.version, self.built_at, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or format_version != _FORMAT_VERSION:
+            raise ValueError(f"카탈로그 스냅샷 형식이 올바르지 않습니다: {path}")
+
+        offset = _aligned(_HEADER.size)
+        columns: Dict[str, np.ndarray] = {}
+        for name, dtype, width in _COLUMNS:
+            size = count * (width or 1)
+            if offset + size * np.dtype(dtype).itemsize > len(self._mmap):
+                raise ValueError(f"카탈로그 스냅샷 파일이 잘렸습니다: {path}")
+            column = np.frombuffer(self._mmap, dtype=dtype, count=size, offset=offset)
+            columns[name] = column.reshape(count, width) if width else column
+            offset = _aligned(offset + column.nbytes)
+
+        self.ids = columns["ids"]
+        self.taste = columns["taste"]
+        self.spread = columns["spread"]
+        self.flags = columns["flags"]
+        self.product_ids = ProductIdColumn(self.ids)
+        self.path = path
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    def has_flag(self, flag: int) -> np.ndarray:
+        """
+        특성 비트가 켜진 상품 마스크
+
+        Args:
+            flag: FLAG_* 비트
+
+        Returns:
+            np.ndarray: 상품별 bool 배열
+        """
+        return (self.flags & flag) != 0
+
+
+class CatalogSnapshotService:
+    """
+    워커 간 공유 카탈로그 스냅샷 관리
+
+    활성 상품의 ID/맛 벡터/패키지 맛 편차/특성 비트를 컬럼형 파일 하나로 기록하고,
+    각 워커는 DB를 조회하지 않고 파일을 mmap으로 열어 사용합니다.
+
+    - 버전: 카탈로그 변경 시그널에서 invalidate()로 커밋 후 증가 (Redis - 모든 워커 공유)
+    - 생성: 버전이 바뀌면 백그라운드 스레드가 파일 잠금을 잡고 생성, 그동안 요청은 마지막으로 생성된 파일을 사용
+      (생성된 파일이 하나도 없을 때만 요청 중에 생성 - 배포 직후에는 build_catalog_snapshot 명령으로 미리 생성)
+    - 교체: 임시 파일에 쓴 뒤 os.replace로 버전 파일 이름을 붙이므로 반쯤 쓰인 파일은 읽히지 않음
+    """
+
+    VERSION_CACHE_KEY = "products:catalog_snapshot:version"
+    # 마지막으로 생성이 끝난 버전 (요청은 이 버전 파일을 엶)
+    BUILT_VERSION_CACHE_KEY = "products:catalog_snapshot:built"
+
+    FILE_PREFIX = "catalog-"
+    FILE_SUFFIX = ".snap"
+
+    _snapshot: Optional[CatalogSnapshot] = None
+    _lock = threading.Lock()
+    _building = False
+
+    @staticmethod
+    def get_directory() -> Path:
+        return Path(settings.CATALOG_SNAPSHOT_DIR)
+
+    @staticmethod
+    def get_path(version: int) -> Path:
+        return CatalogSnapshotService.get_directory() / (
+            f"{CatalogSnapshotService.FILE_PREFIX}{version}{CatalogSnapshotService.FILE_SUFFIX}"
+        )
+
+    @staticmethod
+    def get_version() -> int:
+        """
+        현재 스냅샷 버전
+
+        Redis가 비워진 뒤에도 이전 버전 파일을 다시 쓰지 않도록 초기값은 현재 시각(ms)으로 정합니다.
+
+        Returns:
+            int: 버전 번호
+        """
+        version = cache.get(CatalogSnapshotService.VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(CatalogSnapshotService.VERSION_CACHE_KEY, int(time.time() * 1000), timeout=None)
+            version = cache.get(CatalogSnapshotService.VERSION_CACHE_KEY)
+        return int(version)
+
+    @staticmethod
+    def _bump_version() -> None:
+        try:
+            cache.incr(CatalogSnapshotService.VERSION_CACHE_KEY)
+        except ValueError:
+            cache.set(CatalogSnapshotService.VERSION_CACHE_KEY, int(time.time() * 1000), timeout=None)
+
+    @staticmethod
+    def invalidate() -> None:
+        """
+        스냅샷 무효화 (커밋 후 버전 증가 - 다음 조회 시 백그라운드에서 새 버전 파일 생성)
+
+        커밋 전에 올리면 다른 워커가 옛 데이터로 새 버전 파일을 만들 수 있으므로 커밋 후에만 올립니다.
+        """
+        transaction.on_commit(CatalogSnapshotService._bump_version)
+
+    # ------------------------------------------------------------------------
+    # 생성
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _collect_rows() -> Dict[str, List]:
+        """활성 상품 행 수집 (쿼리 한 번)"""
+        taste_fields = {
+            f"taste_{dimension}": Coalesce(f"drink__{dimension}_level", f"package__{dimension}_level")
+            for dimension in TASTE_DIMENSIONS
+        }
+        rows = (
+            Product.objects.filter(status=Product.Status.ACTIVE)
+            .annotate(**taste_fields)
+            .order_by("created_at", "id")
+            .values_list("id", "drink_id", "package__drink_count", *taste_fields, "package__taste_spread")
+        )
+
+        columns: Dict[str, List] = {name: [] for name, _, _ in _COLUMNS}
+        for product_id, drink_id, drink_count, *taste, spread in rows.iterator(chunk_size=2000):
+            flags = 0 if drink_id else FLAG_IS_PACKAGE
+            if drink_id or drink_count:
+                flags |= FLAG_HAS_TASTE
+
+            columns["ids"].append(product_id.bytes)
+            columns["taste"].append([float(value or 0) for value in taste])
+            columns["spread"].append(float(spread or 0))
+            columns["flags"].append(flags)
+        return columns
+
+    @staticmethod
+    def build(version: int) -> Path:
+        """
+        스냅샷 파일 생성 (임시 파일에 기록 후 원자적으로 교체)
+
+        Args:
+            version: 스냅샷 버전
+
+        Returns:
+            Path: 생성된 파일 경로
+        """
+        columns = CatalogSnapshotService._collect_rows()
+        count = len(columns["ids"])
+
+        arrays = {
+            "ids": np.frombuffer(b"".join(columns["ids"]), dtype="u1").reshape(count, 16),
+            "taste": np.asarray(columns["taste"], dtype="<f4").reshape(count, len(TASTE_DIMENSIONS)),
+            "spread": np.asarray(columns["spread"], dtype="<f4"),
+            "flags": np.asarray(columns["flags"], dtype="u1"),
+        }
+
+        directory = CatalogSnapshotService.get_directory()
+        directory.mkdir(parents=True, exist_ok=True)
+        path = CatalogSnapshotService.get_path(version)
+
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, version, time.time(), count))
+                for name, _, _ in _COLUMNS:
+                    file.write(b"\0" * (_aligned(file.tell()) - file.tell()))
+                    file.write(arrays[name].tobytes())
+                file.flush()
+                os.fsync(file.fileno())
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        CatalogSnapshotService._remove_stale_files(keep=path)
+        return path
+
+    @staticmethod
+    def _remove_stale_files(keep: Path) -> None:
+        """이전 버전 파일 삭제 (이미 매핑한 워커는 교체 전까지 그대로 읽을 수 있음)"""
+        pattern = f"{CatalogSnapshotService.FILE_PREFIX}*{CatalogSnapshotService.FILE_SUFFIX}"
+        for path in CatalogSnapshotService.get_directory().glob(pattern):
+            if path != keep:
+                path.unlink(missing_ok=True)
+
+    @staticmethod
+    def build_latest(blocking: bool = True) -> Optional[int]:
+        """
+        현재 버전 파일 생성 (파일 잠금 - 한 번에 워커 하나만 생성)
+
+        잠금을 잡은 뒤 버전을 읽으므로 생성 완료 버전은 항상 증가합니다.
+
+        Args:
+            blocking: False면 다른 워커가 생성 중일 때 기다리지 않고 건너뜀
+
+        Returns:
+            Optional[int]: 생성 완료 버전 (건너뛴 경우 None)
+        """
+        directory = CatalogSnapshotService.get_directory()
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / ".lock", "w") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return None
+            try:
+                version = CatalogSnapshotService.get_version()
+                if not CatalogSnapshotService.get_path(version).exists():
+                    CatalogSnapshotService.build(version)
+                cache.set(CatalogSnapshotService.BUILT_VERSION_CACHE_KEY, version, timeout=None)
+                return version
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def build_in_background() -> None:
+        """현재 버전 파일 생성을 백그라운드 스레드에서 실행 (이 워커에서 이미 실행 중이면 무시)"""
+        with CatalogSnapshotService._lock:
+            if CatalogSnapshotService._building:
+                return
+            CatalogSnapshotService._building = True
+        threading.Thread(target=CatalogSnapshotService._build, daemon=True).start()
+
+    @staticmethod
+    def _build() -> None:
+        try:
+            CatalogSnapshotService.build_latest(blocking=False)
+        except Exception:
+            logger.exception("카탈로그 스냅샷 생성 실패")
+        finally:
+            CatalogSnapshotService._building = False
+            connections.close_all()
+
+    @staticmethod
+    def rebuild() -> Path:
+        """
+        새 버전으로 즉시 재생성 (배포 직후 미리 생성할 때)
+
+        Returns:
+            Path: 생성된 파일 경로
+        """
+        CatalogSnapshotService._bump_version()
+        version = CatalogSnapshotService.build_latest()
+        return CatalogSnapshotService.get_path(cast(int, version))
+
+    # ------------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------------
+
+    @classmethod
+    def get_snapshot(cls) -> CatalogSnapshot:
+        """
+        스냅샷 반환 (요청 중에는 생성하지 않음)
+
+        현재 버전 파일이 아직 없으면 마지막으로 생성된 파일을 그대로 사용하고 백그라운드에서 새 버전을 생성합니다.
+
+        Returns:
+            CatalogSnapshot: 카탈로그 스냅샷
+        """
+        version = cls.get_version()
+        snapshot = cls._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with cls._lock:
+            snapshot = cls._open_built()
+        if snapshot.version != version:
+            cls.build_in_background()
+        return snapshot
+
+    @classmethod
+    def _open_built(cls) -> CatalogSnapshot:
+        """마지막으로 생성된 버전 파일 매핑 (이미 매핑한 버전이면 그대로)"""
+        built = cache.get(cls.BUILT_VERSION_CACHE_KEY)
+        while True:
+            if built is None:
+                # 생성된 파일이 없음 (배포 직후/Redis 초기화) - 잠금을 잡은 워커 하나만 생성, 나머지는 대기
+                built = cls.build_latest()
+            if cls._snapshot is not None and cls._snapshot.version == built:
+                return cls._snapshot
+            try:
+                cls._snapshot = CatalogSnapshot(cls.get_path(built))
+                return cls._snapshot
+            except FileNotFoundError:
+                # 여는 사이 새 버전이 생성되며 이전 파일이 지워졌으면 새 버전으로 다시 시도,
+                # 생성 완료 버전이 그대로면 이 서버에 파일이 없는 경우이므로 직접 생성
+                latest = cache.get(cls.BUILT_VERSION_CACHE_KEY)
+                built = latest if latest != built else None
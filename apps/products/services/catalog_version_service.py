@@ -0,0 +1,63 @@
+# apps/products/services/catalog_version_service.py
+
+from typing import Any, Iterable, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+
+from core.utils.response_cache import ResponseCache
+
+from .autocomplete_service import AutocompleteService
+from .catalog_snapshot_service import CatalogSnapshotService
+from .product_detail_cache_service import ProductDetailCacheService
+from .search_facet_service import SearchFacetService
+from .section_snapshot_service import SectionSnapshotService
+
+
+class CatalogVersionService:
+    """
+    상품 카탈로그 전역 버전
+
+    상품/술/이미지 등 카탈로그 변경 시 버전을 증가시키며,
+    버전을 키에 포함한 캐시들은 키를 지우지 않고도 한 번(O(1))에 무효화됩니다.
+    """
+
+    VERSION_CACHE_KEY = "products:catalog:version"
+
+    @staticmethod
+    def get_version() -> int:
+        """
+        현재 카탈로그 버전
+
+        Returns:
+            int: 버전 번호
+        """
+        version = cache.get(CatalogVersionService.VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(CatalogVersionService.VERSION_CACHE_KEY, 1, timeout=None)
+            version = cache.get(CatalogVersionService.VERSION_CACHE_KEY, 1)
+        return int(version)
+
+    @staticmethod
+    def bump() -> None:
+        """카탈로그 변경 시 버전 증가 (변경 트랜잭션의 커밋 후 호출)"""
+        try:
+            cache.incr(CatalogVersionService.VERSION_CACHE_KEY)
+        except ValueError:
+            cache.set(CatalogVersionService.VERSION_CACHE_KEY, 1, timeout=None)
+
+    @staticmethod
+    def invalidate_all(autocomplete_changes: Iterable[Tuple[str, Any, Optional[str]]] = ()) -> None:
+        """
+        시그널을 거치지 않는 일괄 변경(bulk_create/update) 후 카탈로그 캐시를 한 번에 무효화
+
+        Args:
+            autocomplete_changes: 자동완성 변경 목록 (entry_type, pk, name)
+        """
+        transaction.on_commit(CatalogVersionService.bump)
+        SectionSnapshotService.invalidate()
+        SearchFacetService.invalidate()
+        CatalogSnapshotService.invalidate()
+        ResponseCache.purge_on_commit("catalog")
+        transaction.on_commit(ProductDetailCacheService.invalidate_all)
+        AutocompleteService.record_changes(autocomplete_changes)
@@ -1,24 +1,80 @@
 # apps/products/services/like_service.py
 
-from typing import Tuple
+import logging
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from django.contrib.auth import get_user_model
-from django.db.models import F
+from django.db import connection, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
 from django.shortcuts import get_object_or_404
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
 
 from apps.products.models import Product, ProductLike
 
+from .product_detail_cache_service import ProductDetailCacheService
+
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
+
+# 좋아요 추가 반영 - 변경 번호 증가, 집합이 적재된 경우에만 추가 (KEYS: 집합, 변경 번호 / ARGV: 상품 ID, 유지 시간)
+_ADD_LIKE = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('SADD', KEYS[1], ARGV[1])
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 1
+"""
+
+# 좋아요 삭제 반영 - 변경 번호 증가 후 집합에서 제거 (KEYS: 집합, 변경 번호 / ARGV: 상품 ID, 유지 시간)
+_REMOVE_LIKE = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+redis.call('SREM', KEYS[1], ARGV[1])
+return 1
+"""
+
+# DB에서 읽은 집합 저장 - 읽기 전 변경 번호와 같을 때만 (KEYS: 집합, 변경 번호 / ARGV: 읽기 전 번호, 유지 시간, 멤버...)
+_STORE_LOADED = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('SADD', KEYS[1], unpack(ARGV, 3))
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 1
+"""
+
 
 class LikeService:
     """상품 좋아요 관련 비즈니스 로직"""
 
+    # 사용자별 좋아요 상품 ID 집합 (ProductLike 미러)
+    USER_LIKES_KEY_TEMPLATE = "products:likes:user:{user_id}"
+
+    # 사용자별 좋아요 변경 번호 (적재 중 변경이 있었는지 확인용)
+    USER_LIKES_VERSION_KEY_TEMPLATE = "products:likes:version:{user_id}"
+
+    # 집합이 DB에서 적재되었음을 표시하는 멤버 (좋아요가 없는 사용자도 키가 존재하도록)
+    LOADED_MARKER = ""
+
+    USER_LIKES_TIMEOUT = 60 * 60 * 24 * 7
+
     @staticmethod
     def toggle_product_like(user, product_id: str) -> Tuple[bool, int]:
         """
         상품 좋아요 토글
 
+        현재 상태는 Redis 집합으로 확인합니다.
+        좋아요 수는 이 요청이 실제로 행을 추가/삭제한 경우에만 증감하고,
+        Redis 집합/상세 캐시 카운터는 커밋 후 갱신합니다.
+
         Args:
             user: 사용자 객체
             product_id: 상품 ID
@@ -32,26 +88,76 @@ class LikeService:
         # 상품 존재 확인
         product = get_object_or_404(Product, pk=product_id, status="ACTIVE")
 
-        # 좋아요 토글
-        like, created = ProductLike.objects.get_or_create(user=user, product=product)
+        with transaction.atomic():
+            if LikeService.check_user_liked_product(user, str(product.pk)):
+                # 이미 좋아요가 있으면 삭제 (동시 요청은 한 요청만 삭제)
+                if LikeService._delete_like(user.pk, product.pk):
+                    LikeService.apply_like_change(user.pk, product.pk, -1)
+                else:
+                    # 집합이 DB와 어긋난 경우 (이미 삭제됨) 집합만 보정
+                    transaction.on_commit(partial(LikeService.remove_from_user_likes, user.pk, product.pk), robust=True)
+                is_liked = False
+            else:
+                # 새로 좋아요 추가 (동시 요청은 unique 제약으로 한 번만 생성 - 생성 시 저장 시그널에서 반영)
+                _, created = ProductLike.objects.get_or_create(user=user, product=product)
+                if not created:
+                    transaction.on_commit(partial(LikeService.add_to_user_likes, user.pk, product.pk), robust=True)
+                is_liked = True
+
+        like_count = Product.objects.filter(pk=product.pk).values_list("like_count", flat=True).first() or 0
+        return is_liked, like_count
+
+    @staticmethod
+    def _delete_like(user_id, product_id) -> bool:
+        """
+        좋아요 행 삭제 (삭제 시그널 없이 DELETE 한 번)
 
-        if not created:
-            # 이미 좋아요가 있으면 삭제
-            like.delete()
-            is_liked = False
-        else:
-            # 새로 좋아요 추가
-            is_liked = True
+        Returns:
+            bool: 이 요청이 실제로 행을 삭제했는지 여부
+        """
+        meta = ProductLike._meta
+        table = connection.ops.quote_name(meta.db_table)
+        user_column = connection.ops.quote_name(meta.get_field("user").column)
+        product_column = connection.ops.quote_name(meta.get_field("product").column)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {table} WHERE {user_column} = %s AND {product_column} = %s",
+                [user_id, product_id],
+            )
+            return cursor.rowcount == 1
 
-        # 좋아요 수 업데이트 및 반환
-        like_count = LikeService.update_product_like_count(product_id)
+    @staticmethod
+    def apply_like_change(user_id, product_id, delta: int) -> None:
+        """
+        좋아요 행 추가/삭제 반영 (좋아요 수 증감, 커밋 후 사용자 좋아요 집합 갱신)
 
-        return is_liked, like_count
+        Args:
+            user_id: 사용자 ID
+            product_id: 상품 ID
+            delta: 1 (추가) 또는 -1 (삭제)
+        """
+        LikeService.adjust_like_count(product_id, delta)
+        sync_user_likes = LikeService.add_to_user_likes if delta > 0 else LikeService.remove_from_user_likes
+        transaction.on_commit(partial(sync_user_likes, user_id, product_id), robust=True)
+
+    @staticmethod
+    def adjust_like_count(product_id, delta: int) -> None:
+        """
+        상품 좋아요 수 원자적 증감 (0 미만으로 내려가지 않음, 상세 캐시 카운터는 커밋 후 갱신)
+
+        Args:
+            product_id: 상품 ID
+            delta: 증감량
+        """
+        Product.objects.filter(pk=product_id).update(like_count=Greatest(F("like_count") + delta, Value(0)))
+        transaction.on_commit(
+            partial(ProductDetailCacheService.add_counter_deltas, "like_count", {str(product_id): delta}), robust=True
+        )
 
     @staticmethod
     def update_product_like_count(product_id: str) -> int:
         """
-        상품의 좋아요 수 업데이트
+        상품의 좋아요 수를 ProductLike 기준으로 다시 계산 (보정용)
 
         Args:
             product_id: 상품 ID
@@ -62,9 +168,99 @@ class LikeService:
         like_count = ProductLike.objects.filter(product_id=product_id).count()
 
         Product.objects.filter(pk=product_id).update(like_count=like_count)
+        ProductDetailCacheService.set_counters(product_id, {"like_count": like_count})
 
         return like_count
 
+    # ------------------------------------------------------------------------
+    # 사용자별 좋아요 집합 (Redis)
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _redis():
+        return get_redis_connection("default")
+
+    @staticmethod
+    def get_user_likes_key(user_id) -> str:
+        return LikeService.USER_LIKES_KEY_TEMPLATE.format(user_id=user_id)
+
+    @staticmethod
+    def get_user_likes_version_key(user_id) -> str:
+        return LikeService.USER_LIKES_VERSION_KEY_TEMPLATE.format(user_id=user_id)
+
+    @staticmethod
+    def _get_db_liked_product_ids(user_id, product_ids: Optional[List[str]] = None) -> Set[str]:
+        """ProductLike에서 좋아요 상품 ID 조회 (Redis 미적재/장애 시)"""
+        queryset = ProductLike.objects.filter(user_id=user_id)
+        if product_ids is not None:
+            queryset = queryset.filter(product_id__in=product_ids)
+        return {str(product_id) for product_id in queryset.values_list("product_id", flat=True)}
+
+    @staticmethod
+    def _load_user_likes(user_id) -> Optional[Set[str]]:
+        """
+        사용자 좋아요 집합이 없으면 ProductLike에서 적재
+
+        적재 중 좋아요 변경이 커밋되면(변경 번호가 달라지면) 저장하지 않고 다음 조회 때 다시 적재합니다.
+
+        Returns:
+            Optional[Set[str]]: DB에서 읽은 상품 ID 집합 (이미 적재되어 있으면 None - Redis 집합 사용)
+        """
+        key = LikeService.get_user_likes_key(user_id)
+        version_key = LikeService.get_user_likes_version_key(user_id)
+        redis = LikeService._redis()
+        exists, version = redis.pipeline().exists(key).get(version_key).execute()
+        if exists:
+            return None
+
+        product_ids = LikeService._get_db_liked_product_ids(user_id)
+        redis.register_script(_STORE_LOADED)(
+            keys=[key, version_key],
+            args=[(version or b"").decode(), LikeService.USER_LIKES_TIMEOUT, LikeService.LOADED_MARKER, *product_ids],
+        )
+        return product_ids
+
+    @staticmethod
+    def get_user_liked_product_ids(user) -> Set[str]:
+        """
+        사용자가 좋아요한 상품 ID 집합
+
+        Args:
+            user: 사용자 객체
+
+        Returns:
+            Set[str]: 상품 ID(문자열) 집합
+        """
+        try:
+            loaded = LikeService._load_user_likes(user.pk)
+            if loaded is not None:
+                return loaded
+            members = LikeService._redis().smembers(LikeService.get_user_likes_key(user.pk))
+        except RedisError:
+            logger.warning("좋아요 집합 조회 실패", exc_info=True)
+            return LikeService._get_db_liked_product_ids(user.pk)
+        return {member.decode() for member in members} - {LikeService.LOADED_MARKER}
+
+    @staticmethod
+    def add_to_user_likes(user_id, product_id) -> None:
+        """좋아요 집합에 상품 추가 (집합이 적재된 경우에만, 미적재 시 다음 조회 때 DB에서 적재)"""
+        LikeService._redis().register_script(_ADD_LIKE)(
+            keys=[LikeService.get_user_likes_key(user_id), LikeService.get_user_likes_version_key(user_id)],
+            args=[str(product_id), LikeService.USER_LIKES_TIMEOUT],
+        )
+
+    @staticmethod
+    def remove_from_user_likes(user_id, product_id) -> None:
+        """좋아요 집합에서 상품 제거"""
+        LikeService._redis().register_script(_REMOVE_LIKE)(
+            keys=[LikeService.get_user_likes_key(user_id), LikeService.get_user_likes_version_key(user_id)],
+            args=[str(product_id), LikeService.USER_LIKES_TIMEOUT],
+        )
+
+    # ------------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------------
+
     @staticmethod
     def get_user_liked_products(user):
         """
@@ -76,11 +272,8 @@ class LikeService:
         Returns:
             QuerySet: 좋아요한 상품들
         """
-        return (
-            Product.objects.filter(likes__user=user, status="ACTIVE")
-            .select_related("drink__brewery", "package")
-            .prefetch_related("images")
-        )
+        product_ids = LikeService.get_user_liked_product_ids(user)
+        return Product.objects.filter(pk__in=product_ids, status="ACTIVE").select_related("drink__brewery", "package")
 
     @staticmethod
     def check_user_liked_product(user, product_id: str) -> bool:
@@ -97,4 +290,111 @@ class LikeService:
         if not hasattr(user, "is_authenticated") or not user.is_authenticated:
             return False
 
-        return ProductLike.objects.filter(user=user, product_id=product_id).exists()
+        product_id = str(product_id)
+        try:
+            loaded = LikeService._load_user_likes(user.pk)
+            if loaded is not None:
+                return product_id in loaded
+            return bool(LikeService._redis().sismember(LikeService.get_user_likes_key(user.pk), product_id))
+        except RedisError:
+            logger.warning("좋아요 집합 조회 실패", exc_info=True)
+            return bool(LikeService._get_db_liked_product_ids(user.pk, [product_id]))
+
+    @staticmethod
+    def get_liked_product_ids(user, product_ids: Iterable[Any]) -> Set[str]:
+        """
+        주어진 상품들 중 사용자가 좋아요한 상품 ID (SMISMEMBER 한 번으로 조회, Redis 장애 시 DB 조회)
+
+        Args:
+            user: 사용자 객체 (비로그인이면 빈 집합)
+            product_ids: 확인할 상품 ID 목록
+
+        Returns:
+            Set[str]: 좋아요한 상품 ID(문자열) 집합
+        """
+        if not hasattr(user, "is_authenticated") or not user.is_authenticated:
+            return set()
+
+        keys = list(dict.fromkeys(str(product_id) for product_id in product_ids))
+        if not keys:
+            return set()
+
+        try:
+            loaded = LikeService._load_user_likes(user.pk)
+            if loaded is not None:
+                return loaded.intersection(keys)
+            flags = LikeService._redis().smismember(LikeService.get_user_likes_key(user.pk), keys)
+        except RedisError:
+            logger.warning("좋아요 집합 조회 실패", exc_info=True)
+            return LikeService._get_db_liked_product_ids(user.pk, keys)
+        return {key for key, flag in zip(keys, flags) if flag}
+
+    @staticmethod
+    def attach_like_state(
+        products: List[Dict[str, Any]], user, liked_product_ids: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        직렬화된 상품 목록(dict)에 is_liked 값 설정 (스냅샷/고속 직렬화 결과용)
+
+        Args:
+            products: 직렬화된 상품 목록 ("id" 키 필요)
+            user: 사용자 객체
+            liked_product_ids: 이미 조회한 좋아요 상품 ID 집합 (없으면 조회)
+
+        Returns:
+            List[Dict]: is_liked가 설정된 같은 목록
+        """
+        if liked_product_ids is None:
+            liked_product_ids = LikeService.get_liked_product_ids(user, [product["id"] for product in products])
+        for product in products:
+            product["is_liked"] = product["id"] in liked_product_ids
+        return products
+
+    # ------------------------------------------------------------------------
+    # 보정
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def reconcile(product_ids: Optional[Iterable[str]] = None) -> Tuple[int, int]:
+        """
+        좋아요 수/집합을 ProductLike 기준으로 보정
+
+        - 좋아요 수가 실제 행 수와 다른 상품만 한 번의 UPDATE로 갱신합니다.
+        - 사용자 좋아요 집합은 모두 삭제하여 다음 조회 때 DB에서 다시 적재되도록 합니다.
+
+        Args:
+            product_ids: 보정할 상품 ID 목록 (None이면 전체)
+
+        Returns:
+            Tuple[int, int]: (보정된 상품 수, 삭제된 사용자 집합 수)
+        """
+        actual_count = Coalesce(
+            Subquery(
+                ProductLike.objects.filter(product_id=OuterRef("pk"))
+                .order_by()
+                .values("product_id")
+                .annotate(count=Count("id"))
+                .values("count"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+
+        queryset = Product.objects.all()
+        if product_ids is not None:
+            product_ids = list(product_ids)
+            queryset = queryset.filter(pk__in=product_ids)
+        updated = queryset.exclude(like_count=actual_count).update(like_count=actual_count)
+
+        if updated:
+            if product_ids is None:
+                ProductDetailCacheService.invalidate_all()
+            else:
+                ProductDetailCacheService.invalidate(*product_ids)
+
+        redis = LikeService._redis()
+        keys: List[bytes] = list(redis.scan_iter(match=LikeService.USER_LIKES_KEY_TEMPLATE.format(user_id="*")))
+        if keys:
+            redis.delete(*keys)
+
+        return updated, len(keys)
@@ -0,0 +1,140 @@
+# apps/products/services/package_composition_service.py
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Dict, Iterable, List, Optional, cast
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Avg, Count, Max, Min, StdDev
+
+from apps.products.models import Package, PackageItem
+
+from .taste_match_service import TASTE_DIMENSIONS
+
+TASTE_LEVEL_FIELDS = [f"{dimension}_level" for dimension in TASTE_DIMENSIONS]
+
+
+class PackageCompositionService:
+    """
+    패키지 구성 요약 관리
+
+    구성 술의 주종 목록/개수/도수 범위/맛 프로필 평균과 편차를 Package에 저장해 두어
+    패키지 조건 조회 시 구성 술 JOIN + DISTINCT 없이 인덱스(alcohol_types GIN)로 처리합니다.
+    """
+
+    COMPOSITION_FIELDS = [
+        "alcohol_types",
+        "drink_count",
+        "min_abv",
+        "max_abv",
+        *TASTE_LEVEL_FIELDS,
+        "taste_spread",
+    ]
+
+    # 한 번에 갱신할 패키지 수
+    REFRESH_BATCH_SIZE = 500
+
+    _QUANTUM = Decimal("0.01")
+
+    @staticmethod
+    def _round(value: Any) -> Optional[Decimal]:
+        if value is None:
+            return None
+        return Decimal(str(value)).quantize(PackageCompositionService._QUANTUM, rounding=ROUND_HALF_UP)
+
+    @staticmethod
+    def summarize(package_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        패키지별 구성 요약 계산 (집계 쿼리 한 번)
+
+        Args:
+            package_ids: 패키지 ID 목록
+
+        Returns:
+            Dict: {패키지 ID: {필드명: 값}} (구성 술이 없는 패키지는 제외)
+        """
+        aggregates: Dict[str, Any] = {
+            "alcohol_types": ArrayAgg("drink__alcohol_type", distinct=True),
+            "drink_count": Count("drink_id"),
+            "min_abv": Min("drink__abv"),
+            "max_abv": Max("drink__abv"),
+            **{f"{field}_mean": Avg(f"drink__{field}") for field in TASTE_LEVEL_FIELDS},
+            **{f"{field}_stddev": StdDev(f"drink__{field}") for field in TASTE_LEVEL_FIELDS},
+        }
+        rows = cast(
+            Iterable[Dict[str, Any]],
+            PackageItem.objects.filter(package_id__in=package_ids)
+            .order_by()
+            .values("package_id")
+            .annotate(**aggregates),
+        )
+
+        summaries = {}
+        for row in rows:
+            summary = {
+                "alcohol_types": sorted(row["alcohol_types"]),
+                "drink_count": row["drink_count"],
+                "min_abv": row["min_abv"],
+                "max_abv": row["max_abv"],
+            }
+            for field in TASTE_LEVEL_FIELDS:
+                summary[field] = PackageCompositionService._round(row[f"{field}_mean"])
+            spreads = [Decimal(str(row[f"{field}_stddev"] or 0)) for field in TASTE_LEVEL_FIELDS]
+            summary["taste_spread"] = PackageCompositionService._round(sum(spreads) / len(spreads))
+            summaries[row["package_id"]] = summary
+        return summaries
+
+    @staticmethod
+    def refresh(package_ids: Iterable[int]) -> int:
+        """
+        패키지 구성 요약 갱신 (변경된 패키지만 저장)
+
+        Args:
+            package_ids: 갱신할 패키지 ID 목록
+
+        Returns:
+            int: 갱신된 패키지 수
+        """
+        package_ids = list(set(package_ids))
+        if not package_ids:
+            return 0
+
+        fields = PackageCompositionService.COMPOSITION_FIELDS
+        empty = {field: None for field in fields} | {"alcohol_types": [], "drink_count": 0}
+
+        changed: List[Package] = []
+        for start in range(0, len(package_ids), PackageCompositionService.REFRESH_BATCH_SIZE):
+            batch = package_ids[start : start + PackageCompositionService.REFRESH_BATCH_SIZE]
+            summaries = PackageCompositionService.summarize(batch)
+            for package in Package.objects.filter(pk__in=batch).only("id", *fields):
+                summary = summaries.get(package.pk, empty)
+                if any(getattr(package, field) != summary[field] for field in fields):
+                    for field in fields:
+                        setattr(package, field, summary[field])
+                    changed.append(package)
+
+        Package.objects.bulk_update(changed, fields, batch_size=PackageCompositionService.REFRESH_BATCH_SIZE)
+        return len(changed)
+
+    @staticmethod
+    def refresh_for_drinks(drink_ids: Iterable[int]) -> int:
+        """
+        술 변경 시 해당 술이 포함된 패키지 구성 요약 갱신
+
+        Args:
+            drink_ids: 변경된 술 ID 목록
+
+        Returns:
+            int: 갱신된 패키지 수
+        """
+        package_ids = PackageItem.objects.filter(drink_id__in=list(drink_ids)).values_list("package_id", flat=True)
+        return PackageCompositionService.refresh(package_ids.distinct())
+
+    @staticmethod
+    def refresh_all() -> int:
+        """
+        전체 패키지 구성 요약 재계산
+
+        Returns:
+            int: 갱신된 패키지 수
+        """
+        return PackageCompositionService.refresh(Package.objects.values_list("id", flat=True))
@@ -0,0 +1,92 @@
+# apps/products/services/product_bulk_update_service.py
+
+from typing import Any, Dict
+
+from django.db.models import F, Q, QuerySet
+from django.utils import timezone
+
+from apps.products.models import Product
+
+from .catalog_version_service import CatalogVersionService
+
+
+class ProductBulkUpdateService:
+    """
+    상품 일괄 변경 (관리자용)
+
+    선택 조건에 맞는 상품들의 상태/가격/할인/특성을 UPDATE 한 번으로 변경합니다.
+    QuerySet.update()는 모델 시그널을 발생시키지 않으므로 캐시 무효화는 변경 후 한 번만 수행합니다.
+    """
+
+    @staticmethod
+    def select(selector: Dict[str, Any]) -> QuerySet:
+        """
+        선택 조건에 맞는 상품 쿼리셋
+
+        Args:
+            selector: {"ids", "brewery_id", "alcohol_type", "flag", "status"} 중 지정한 조건 (모두 AND)
+
+        Returns:
+            QuerySet: 대상 상품 쿼리셋
+        """
+        queryset = Product.objects.all()
+        if selector.get("ids"):
+            queryset = queryset.filter(pk__in=selector["ids"])
+        if selector.get("brewery_id"):
+            queryset = queryset.filter(drink__brewery_id=selector["brewery_id"])
+        if selector.get("alcohol_type"):
+            alcohol_type = selector["alcohol_type"]
+            # 패키지는 저장된 구성 주종 목록으로 판단 (구성 술 JOIN 없음)
+            queryset = queryset.filter(
+                Q(drink__alcohol_type=alcohol_type) | Q(package__alcohol_types__contains=[alcohol_type])
+            )
+        if selector.get("flag"):
+            queryset = queryset.filter(**{selector["flag"]: True})
+        if selector.get("status"):
+            queryset = queryset.filter(status=selector["status"])
+        return queryset
+
+    @staticmethod
+    def apply(selector: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, int]:
+        """
+        선택한 상품 일괄 변경 (UPDATE 한 번)
+
+        Args:
+            selector: 선택 조건 (select 참고)
+            changes: {"status", "price", "price_change_percent", "discount", "flags"} 중 변경할 내용
+
+        Returns:
+            Dict: {"matched": 선택된 상품 수, "updated": 변경된 상품 수, "skipped": 할인 조건으로 제외된 상품 수}
+        """
+        queryset = ProductBulkUpdateService.select(selector)
+
+        # auto_now는 update()에 적용되지 않으므로 직접 설정 (상세 조회 ETag/Last-Modified 반영)
+        assignments: Dict[str, Any] = {"updated_at": timezone.now()}
+        if "status" in changes:
+            assignments["status"] = changes["status"]
+        if "price" in changes:
+            assignments["price"] = changes["price"]
+        elif "price_change_percent" in changes:
+            # 정수 연산으로 반올림 (가격은 음수가 아님)
+            assignments["price"] = (F("price") * (100 + changes["price_change_percent"]) + 50) / 100
+        for flag, value in changes.get("flags", {}).items():
+            assignments[flag] = value
+
+        matched = None
+        target = queryset
+        if "discount" in changes:
+            discount = changes["discount"]
+            assignments["discount"] = discount
+            # 할인금액은 정가 이하여야 하므로 조건을 만족하지 않는 상품은 제외
+            if discount:
+                matched = queryset.count()
+                target = queryset.filter(original_price__gte=discount)
+
+        updated = target.update(**assignments)
+        if matched is None:
+            matched = updated
+
+        if updated:
+            CatalogVersionService.invalidate_all()
+
+        return {"matched": matched, "updated": updated, "skipped": matched - updated}
@@ -0,0 +1,353 @@
+# apps/products/services/product_detail_cache_service.py
+
+import datetime
+import json
+import logging
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework.utils.encoders import JSONEncoder
+
+logger = logging.getLogger(__name__)
+
+# 키가 있을 때만 카운터 증감 (0 미만으로 내려가지 않음)
+_INCREMENT_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+if value < 0 then
+    redis.call('HSET', KEYS[1], ARGV[1], 0)
+    value = 0
+end
+return value
+"""
+
+# 조회 전에 읽은 세대 값이 그대로일 때만 저장 (조회 중 무효화되었으면 저장하지 않음)
+# KEYS: 상세, 상품 세대, 전체 세대, 태그... / ARGV: 상품 세대, 전체 세대, 보관 시간, 상품 ID, 필드, 값, ...
+_SET_IF_GENERATION_UNCHANGED = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] or (redis.call('GET', KEYS[3]) or '0') ~= ARGV[2] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], unpack(ARGV, 5))
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+for index = 4, #KEYS do
+    redis.call('SADD', KEYS[index], ARGV[4])
+    redis.call('EXPIRE', KEYS[index], ARGV[3] * 2)
+end
+return 1
+"""
+
+# 키가 있을 때만 카운터 값 설정 (ARGV: 필드, 값, 필드, 값, ...)
+_SET_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV))
+return 1
+"""
+
+
+class ProductDetailCacheService:
+    """
+    상품 상세 직렬화 결과 캐시 (로그인 사용자 포함 모든 요청에서 사용)
+
+    상품별 Redis 해시에 직렬화된 본문과 카운터를 나누어 저장합니다.
+
+    - body: 상세 응답 JSON (is_liked 제외 - 요청마다 좋아요 집합으로 채움)
+    - updated_at: 상품 수정 시각 (조건부 요청 검증값 - 적중 시 검증값 조회 쿼리도 생략)
+    - 카운터(조회/주문/좋아요/리뷰 수): 변경 시 본문을 다시 만들지 않고 해시 필드만 갱신
+
+    술/양조장/패키지 변경 시 해당 데이터를 포함한 상품 본문만 삭제하도록 태그 집합을 함께 저장합니다.
+
+    조회 중 무효화된 옛 데이터가 저장되지 않도록, 조회 전에 세대 값(상품별 + 전체)을 읽고
+    저장 시 그대로인 경우에만 저장합니다. 무효화는 세대 값을 올린 뒤 캐시를 삭제하며, 커밋 후 실행합니다.
+    """
+
+    KEY_PREFIX = "products:detail"
+
+    # 세대 값 키 (상품별/전체 - 전체 삭제 시 SCAN 대상에서 제외되도록 별도 접두사 사용)
+    GENERATION_PREFIX = "products:detail_generation"
+
+    COUNTER_FIELDS = ["view_count", "order_count", "like_count", "review_count"]
+
+    # 본문 보관 시간 (초) - 조회수 반영 타이밍에 따른 미세한 오차도 이 시간 안에 사라짐
+    TIMEOUT = 60 * 30
+
+    @staticmethod
+    def _redis():
+        return get_redis_connection("default")
+
+    @staticmethod
+    def _key(product_id: Any) -> str:
+        return f"{ProductDetailCacheService.KEY_PREFIX}:{product_id}"
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"{ProductDetailCacheService.KEY_PREFIX}:tag:{tag}"
+
+    @staticmethod
+    def _generation_key(product_id: Any) -> str:
+        return f"{ProductDetailCacheService.GENERATION_PREFIX}:{product_id}"
+
+    @staticmethod
+    def _all_generation_key() -> str:
+        return f"{ProductDetailCacheService.GENERATION_PREFIX}:all"
+
+    @staticmethod
+    def _bump_generations(pipeline, keys: Iterable[str]) -> None:
+        for key in keys:
+            pipeline.incr(key)
+            # 조회~저장 사이보다 충분히 길게 유지 (만료되어도 값이 달라지므로 저장은 거부됨)
+            pipeline.expire(key, ProductDetailCacheService.TIMEOUT * 2)
+
+    @staticmethod
+    def get_tags(data: Dict[str, Any]) -> List[str]:
+        """
+        상세 본문이 의존하는 술/양조장/패키지 태그 목록
+
+        Args:
+            data: 직렬화된 상세 데이터
+
+        Returns:
+            List[str]: 태그 목록 (예: ["drink:3", "brewery:1"])
+        """
+        drinks = []
+        if data.get("drink"):
+            drinks.append(data["drink"])
+
+        tags = []
+        if data.get("package"):
+            tags.append(f"package:{data['package']['id']}")
+            drinks.extend(data["package"]["drinks"])
+
+        for drink in drinks:
+            tags.append(f"drink:{drink['id']}")
+            tags.append(f"brewery:{drink['brewery']['id']}")
+        return sorted(set(tags))
+
+    # ------------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def get(product_id: Any) -> Optional[Tuple[Dict[str, Any], datetime.datetime]]:
+        """
+        캐시된 상세 데이터 조회 (DB 조회 없음)
+
+        Args:
+            product_id: 상품 ID
+
+        Returns:
+            Optional[Tuple]: (카운터가 반영된 상세 데이터, 상품 수정 시각) - 없으면 None
+        """
+        try:
+            entry = ProductDetailCacheService._redis().hgetall(ProductDetailCacheService._key(product_id))
+        except RedisError:
+            logger.warning("상품 상세 캐시 조회 실패", exc_info=True)
+            return None
+        if b"body" not in entry:
+            return None
+
+        data = json.loads(entry[b"body"])
+        for field in ProductDetailCacheService.COUNTER_FIELDS:
+            data[field] = int(entry.get(field.encode(), 0))
+        return data, datetime.datetime.fromisoformat(entry[b"updated_at"].decode())
+
+    @staticmethod
+    def get_generation(product_id: Any) -> Optional[Tuple[str, str]]:
+        """
+        상세 조회 전 세대 값 조회 (set()에 그대로 전달)
+
+        Args:
+            product_id: 상품 ID
+
+        Returns:
+            Optional[Tuple[str, str]]: (상품 세대, 전체 세대) - 조회 실패 시 None (저장하지 않음)
+        """
+        try:
+            values = ProductDetailCacheService._redis().mget(
+                [ProductDetailCacheService._generation_key(product_id), ProductDetailCacheService._all_generation_key()]
+            )
+        except RedisError:
+            logger.warning("상품 상세 캐시 세대 조회 실패", exc_info=True)
+            return None
+        product_generation, all_generation = [(value or b"0").decode() for value in values]
+        return product_generation, all_generation
+
+    @staticmethod
+    def set(product, data: Dict[str, Any], generation: Optional[Tuple[str, str]]) -> bool:
+        """
+        직렬화된 상세 데이터 저장 (조회 전 세대 값이 그대로인 경우에만)
+
+        Args:
+            product: 상세 조회한 상품 객체 (DB 값 그대로 - 조회수 증가분이 더해지기 전)
+            data: 상품 객체를 직렬화한 데이터
+            generation: 조회 전에 get_generation()으로 읽은 세대 값
+
+        Returns:
+            bool: 저장 여부
+        """
+        if generation is None:
+            return False
+
+        mapping = {
+            # 필드 순서 유지를 위해 키는 남겨두고 값은 조회 시 채움
+            "body": json.dumps({**data, "is_liked": False}, cls=JSONEncoder, ensure_ascii=False),
+            "updated_at": product.updated_at.isoformat(),
+            **{field: getattr(product, field) for field in ProductDetailCacheService.COUNTER_FIELDS},
+        }
+        keys = [
+            ProductDetailCacheService._key(product.pk),
+            ProductDetailCacheService._generation_key(product.pk),
+            ProductDetailCacheService._all_generation_key(),
+            *[ProductDetailCacheService._tag_key(tag) for tag in ProductDetailCacheService.get_tags(data)],
+        ]
+        args = [*generation, ProductDetailCacheService.TIMEOUT, str(product.pk)]
+        args.extend(value for item in mapping.items() for value in item)
+
+        try:
+            redis = ProductDetailCacheService._redis()
+            return bool(redis.register_script(_SET_IF_GENERATION_UNCHANGED)(keys=keys, args=args))
+        except RedisError:
+            logger.warning("상품 상세 캐시 저장 실패", exc_info=True)
+            return False
+
+    # ------------------------------------------------------------------------
+    # 카운터 갱신 (본문은 유지)
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def add_counter_deltas(field: str, deltas: Dict[str, int]) -> None:
+        """
+        캐시된 상품들의 카운터 증감 (캐시가 없는 상품은 무시)
+
+        Args:
+            field: 카운터 필드명
+            deltas: 상품 ID(문자열)별 증감량
+        """
+        if not deltas:
+            return
+        try:
+            redis = ProductDetailCacheService._redis()
+            script = redis.register_script(_INCREMENT_IF_EXISTS)
+            pipeline = redis.pipeline()
+            for product_id, delta in deltas.items():
+                script(keys=[ProductDetailCacheService._key(product_id)], args=[field, delta], client=pipeline)
+            # 반영 전 카운터로 조회 중인 요청은 저장하지 않도록 세대 증가
+            ProductDetailCacheService._bump_generations(
+                pipeline, [ProductDetailCacheService._generation_key(product_id) for product_id in deltas]
+            )
+            pipeline.execute()
+        except RedisError:
+            # 카운터를 갱신하지 못한 캐시는 삭제 시도 (남은 값은 TIMEOUT 안에 사라짐)
+            logger.warning("상품 상세 캐시 카운터 갱신 실패", exc_info=True)
+            ProductDetailCacheService.invalidate(*deltas)
+
+    @staticmethod
+    def set_counters(product_id: Any, counters: Dict[str, int]) -> None:
+        """
+        캐시된 상품의 카운터 값 설정 (캐시가 없으면 무시)
+
+        Args:
+            product_id: 상품 ID
+            counters: {카운터 필드명: 값}
+        """
+        if not counters:
+            return
+        args = [value for item in counters.items() for value in item]
+        try:
+            redis = ProductDetailCacheService._redis()
+            pipeline = redis.pipeline()
+            redis.register_script(_SET_IF_EXISTS)(
+                keys=[ProductDetailCacheService._key(product_id)], args=args, client=pipeline
+            )
+            ProductDetailCacheService._bump_generations(
+                pipeline, [ProductDetailCacheService._generation_key(product_id)]
+            )
+            pipeline.execute()
+        except RedisError:
+            logger.warning("상품 상세 캐시 카운터 설정 실패", exc_info=True)
+
+    # ------------------------------------------------------------------------
+    # 무효화
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def invalidate(*product_ids: Any) -> None:
+        """
+        상품 상세 캐시 삭제
+
+        Args:
+            product_ids: 상품 ID들
+        """
+        if not product_ids:
+            return
+        try:
+            pipeline = ProductDetailCacheService._redis().pipeline()
+            ProductDetailCacheService._bump_generations(
+                pipeline, [ProductDetailCacheService._generation_key(product_id) for product_id in product_ids]
+            )
+            pipeline.delete(*[ProductDetailCacheService._key(product_id) for product_id in product_ids])
+            pipeline.execute()
+        except RedisError:
+            logger.warning("상품 상세 캐시 삭제 실패", exc_info=True)
+
+    @staticmethod
+    def purge(tags: Iterable[str]) -> int:
+        """
+        태그(술/양조장/패키지)가 붙은 상품 상세 캐시 삭제
+
+        Args:
+            tags: 태그 목록 (예: ["drink:3"])
+
+        Returns:
+            int: 삭제 대상 상품 수
+        """
+        tag_keys = [ProductDetailCacheService._tag_key(tag) for tag in tags]
+        if not tag_keys:
+            return 0
+        try:
+            redis = ProductDetailCacheService._redis()
+            # 태그를 아직 등록하지 않은 (조회 중인) 상품도 저장되지 않도록 전체 세대 증가
+            pipeline = redis.pipeline()
+            ProductDetailCacheService._bump_generations(pipeline, [ProductDetailCacheService._all_generation_key()])
+            pipeline.sunion(tag_keys)
+            product_ids = pipeline.execute()[-1]
+            pipeline = redis.pipeline()
+            if product_ids:
+                pipeline.delete(*[ProductDetailCacheService._key(product_id.decode()) for product_id in product_ids])
+            pipeline.delete(*tag_keys)
+            pipeline.execute()
+        except RedisError:
+            logger.warning("상품 상세 캐시 태그 삭제 실패", exc_info=True)
+            return 0
+        return len(product_ids)
+
+    @staticmethod
+    def invalidate_all() -> None:
+        """전체 상품 상세 캐시 삭제 (시그널을 거치지 않는 일괄 변경 후)"""
+        try:
+            redis = ProductDetailCacheService._redis()
+            pipeline = redis.pipeline()
+            ProductDetailCacheService._bump_generations(pipeline, [ProductDetailCacheService._all_generation_key()])
+            pipeline.execute()
+            keys = list(redis.scan_iter(match=f"{ProductDetailCacheService.KEY_PREFIX}:*", count=1000))
+            for start in range(0, len(keys), 1000):
+                redis.delete(*keys[start : start + 1000])
+        except RedisError:
+            logger.warning("상품 상세 캐시 전체 삭제 실패", exc_info=True)
+
+    @staticmethod
+    def invalidate_on_commit(*product_ids: Any) -> None:
+        """커밋 후 상품 상세 캐시 삭제 (모델 변경 시그널에서 사용)"""
+        transaction.on_commit(partial(ProductDetailCacheService.invalidate, *product_ids))
+
+    @staticmethod
+    def purge_on_commit(tags: Iterable[str]) -> None:
+        """커밋 후 태그가 붙은 상품 상세 캐시 삭제 (모델 변경 시그널에서 사용)"""
+        transaction.on_commit(partial(ProductDetailCacheService.purge, list(tags)))
@@ -0,0 +1,60 @@
+# apps/products/services/product_export_service.py
+
+from typing import Any, Iterator, Optional, Tuple
+
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Coalesce
+
+from apps.products.models import Product
+from core.utils.streaming_export import EXPORT_CHUNK_SIZE
+
+
+class ProductExportService:
+    """상품 목록 내보내기 (관리자용 - 서버 측 커서로 한 번에 EXPORT_CHUNK_SIZE행씩 조회)"""
+
+    COLUMNS = [
+        "id",
+        "name",
+        "product_type",
+        "brewery",
+        "alcohol_type",
+        "price",
+        "original_price",
+        "discount",
+        "status",
+        "is_gift_suitable",
+        "is_award_winning",
+        "is_regional_specialty",
+        "is_limited_edition",
+        "is_premium",
+        "is_organic",
+        "view_count",
+        "order_count",
+        "like_count",
+        "review_count",
+        "created_at",
+    ]
+
+    @staticmethod
+    def iter_rows(status: Optional[str] = None) -> Iterator[Tuple[Any, ...]]:
+        """
+        내보낼 상품 행 (COLUMNS 순서의 값 튜플)
+
+        Args:
+            status: 상품 상태 필터
+
+        Returns:
+            Iterator: 행 튜플 (모델 객체 생성 없음)
+        """
+        queryset = Product.objects.annotate(
+            export_name=Coalesce("drink__name", "package__name"),
+            export_product_type=Case(When(drink__isnull=False, then=Value("individual")), default=Value("package")),
+            brewery_name=F("drink__brewery__name"),
+            export_alcohol_type=F("drink__alcohol_type"),
+        )
+        if status:
+            queryset = queryset.filter(status=status)
+
+        fields = ["id", "export_name", "export_product_type", "brewery_name", "export_alcohol_type"]
+        fields += ProductExportService.COLUMNS[len(fields) :]
+        return queryset.order_by("created_at", "id").values_list(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE)
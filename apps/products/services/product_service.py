@@ -1,16 +1,28 @@
 # apps/products/services/product_service.py
 
-from typing import Optional
+import datetime
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
 
-from django.db.models import F
 from django.shortcuts import get_object_or_404
 
-from apps.products.models import Product
+from apps.products.models import Drink, Product
+from core.utils.write_behind_counter import WriteBehindCounter
+
+from .product_detail_cache_service import ProductDetailCacheService
 
 
 class ProductService:
     """상품 관련 비즈니스 로직"""
 
+    # 상품 조회수 (Redis에 누적 후 주기적으로 DB 반영)
+    VIEW_COUNTER = WriteBehindCounter(
+        "product_view_count",
+        Product,
+        "view_count",
+        on_flush=partial(ProductDetailCacheService.add_counter_deltas, "view_count"),
+    )
+
     @staticmethod
     def get_product_detail(product_id: str) -> Product:
         """
@@ -25,8 +37,28 @@ class ProductService:
         Raises:
             Http404: 상품이 존재하지 않거나 비활성 상태일 때
         """
-        # 상품 존재 여부 확인
-        product = get_object_or_404(
+        product = ProductService.load_product_detail(product_id)
+
+        # 조회수 증가 (DB 반영 전 증가분을 더해서 반환)
+        ProductService.increment_view_count(product_id)
+        ProductService.VIEW_COUNTER.overlay(product)
+        return product
+
+    @staticmethod
+    def load_product_detail(product_id: str) -> Product:
+        """
+        상품 상세 직렬화용 조회 (조회수 증가 없음)
+
+        Args:
+            product_id: 상품 ID
+
+        Returns:
+            Product: 연관 객체(술/양조장/패키지/이미지)가 함께 로드된 상품 객체
+
+        Raises:
+            Http404: 상품이 존재하지 않거나 비활성 상태일 때
+        """
+        return get_object_or_404(
             Product.objects.select_related("drink__brewery", "package").prefetch_related(
                 "images", "package__drinks__brewery"
             ),
@@ -34,22 +66,46 @@ class ProductService:
             status="ACTIVE",
         )
 
-        # 조회수 증가
+    @staticmethod
+    def record_detail_view(product_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        상세 응답 데이터 기준 조회수 증가 (DB 반영 전 증가분을 응답의 조회수에 더함)
+
+        Args:
+            product_id: 상품 ID
+            data: 상세 응답 데이터 (조회수는 DB 값)
+
+        Returns:
+            Dict: 조회수가 반영된 응답 데이터
+        """
         ProductService.increment_view_count(product_id)
+        pending = ProductService.VIEW_COUNTER.pending([product_id]).get(str(product_id), 0)
+        return {**data, "view_count": data["view_count"] + pending}
 
-        # 업데이트된 상품 객체 반환
-        product.refresh_from_db()
-        return product
+    @staticmethod
+    def get_detail_validators(product_id: str) -> Optional[Tuple[datetime.datetime, int]]:
+        """
+        상품 상세 조건부 요청용 검증값 조회 (컬럼 두 개만 조회)
+
+        Args:
+            product_id: 상품 ID
+
+        Returns:
+            Optional[Tuple]: (수정 시각, 좋아요 수) - 상품이 없거나 비활성이면 None
+        """
+        return Product.objects.filter(pk=product_id, status="ACTIVE").values_list("updated_at", "like_count").first()
 
     @staticmethod
     def increment_view_count(product_id: str) -> None:
         """
         상품 조회수 증가
 
+        Redis에만 누적하며, DB 반영은 WriteBehindCounter.flush()에서 일괄 처리합니다.
+
         Args:
             product_id: 상품 ID
         """
-        Product.objects.filter(pk=product_id).update(view_count=F("view_count") + 1)
+        ProductService.VIEW_COUNTER.increment(product_id)
 
     @staticmethod
     def get_product_list_queryset():
@@ -62,7 +118,7 @@ class ProductService:
         return (
             Product.objects.filter(status="ACTIVE")
             .select_related("drink__brewery", "package")
-            .prefetch_related("images", "package__drinks__brewery")
+            .prefetch_related("package__drinks__brewery")
         )
 
     @staticmethod
@@ -78,12 +134,10 @@ class ProductService:
             QuerySet: 해당 주종이 포함된 패키지 상품들
         """
         return (
-            Product.objects.filter(
-                status="ACTIVE", package__isnull=False, package__drinks__alcohol_type=alcohol_type  # 패키지 상품만
-            )
+            # 패키지 구성 주종 목록(GIN 인덱스)으로 조회 - 구성 술 JOIN/DISTINCT 없음
+            Product.objects.filter(status="ACTIVE", package__alcohol_types__contains=[alcohol_type])
             .select_related("package")
-            .prefetch_related("images", "package__drinks__brewery")
-            .distinct()
+            .prefetch_related("package__drinks__brewery")
             .order_by("-created_at")[:limit]
         )
 
@@ -122,10 +176,8 @@ class ProductService:
             return base_queryset.filter(is_award_winning=True, package__isnull=False).order_by("-order_count")[:limit]
 
         elif section_type == "makgeolli":
-
-            # 패키지페이지 전용: 이름에 막걸리가 포함된 패키지만
-
-            return base_queryset.filter(package__isnull=False, package__name__icontains="막걸리").order_by(
+            # 패키지페이지 전용: 막걸리가 포함된 패키지만
+            return base_queryset.filter(package__alcohol_types__contains=[Drink.AlcoholType.MAKGEOLLI]).order_by(
                 "-created_at"
             )[:limit]
 
@@ -0,0 +1,126 @@
+# apps/products/services/recommendation_service.py
+
+from typing import List, Optional
+
+from django.core.cache import cache
+from django.db.models import Case, IntegerField, QuerySet, Value, When
+
+from apps.orders.models import OrderItem
+from apps.users.models import PreferTasteProfile
+
+from .product_service import ProductService
+from .taste_match_service import TASTE_DIMENSIONS, TasteMatchService
+
+
+class RecommendationService:
+    """사용자 취향 프로필(PreferTasteProfile) 기반 개인화 상품 추천"""
+
+    # 사용자별 추천 목록 캐시 키
+    CACHE_KEY_TEMPLATE = "products:recommendations:{user_id}"
+
+    # 캐시에 저장할 추천 상품 수 (응답 개수와 무관하게 넉넉히 저장)
+    CACHE_SIZE = 50
+
+    # 프로필 변경이 없어도 상품 구성 변화가 반영되도록 하는 최대 보관 시간 (초)
+    CACHE_TIMEOUT = 60 * 60 * 24
+
+    DEFAULT_LIMIT = 8
+
+    @staticmethod
+    def get_cache_key(user_id: int) -> str:
+        return RecommendationService.CACHE_KEY_TEMPLATE.format(user_id=user_id)
+
+    @staticmethod
+    def invalidate(user_id: int) -> None:
+        """
+        사용자 추천 캐시 삭제
+
+        Args:
+            user_id: 사용자 ID
+        """
+        cache.delete(RecommendationService.get_cache_key(user_id))
+
+    @staticmethod
+    def build_recommendations(profile: PreferTasteProfile) -> List[str]:
+        """
+        취향 프로필과 가까운 상품 ID 목록 계산 (이미 주문한 상품 제외)
+
+        Args:
+            profile: 사용자 취향 프로필
+
+        Returns:
+            List[str]: 추천 상품 ID 목록 (가까운 순)
+        """
+        targets = {dimension: float(getattr(profile, f"{dimension}_level")) for dimension in TASTE_DIMENSIONS}
+        ordered_ids = {
+            str(product_id)
+            for product_id in OrderItem.objects.filter(order__user_id=profile.user_id).values_list(
+                "product_id", flat=True
+            )
+        }
+        return TasteMatchService.find_closest(
+            targets,
+            limit=RecommendationService.CACHE_SIZE,
+            include_packages=True,
+            exclude_ids=ordered_ids,
+        )
+
+    @staticmethod
+    def get_recommended_product_ids(user) -> Optional[List[str]]:
+        """
+        사용자 추천 상품 ID 목록 조회 (캐시 우선)
+
+        캐시는 취향 프로필의 last_updated가 바뀔 때 시그널에서 삭제되므로 적중 시 프로필을 다시 확인하지 않고
+        캐시 조회 한 번으로 끝납니다.
+
+        Args:
+            user: 로그인 사용자
+
+        Returns:
+            Optional[List[str]]: 추천 상품 ID 목록 (취향 프로필이 없으면 None)
+        """
+        cache_key = RecommendationService.get_cache_key(user.pk)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached["product_ids"]
+
+        profile = PreferTasteProfile.objects.filter(user_id=user.pk).first()
+        if profile is None:
+            return None
+
+        product_ids = RecommendationService.build_recommendations(profile)
+        cache.set(cache_key, {"product_ids": product_ids}, timeout=RecommendationService.CACHE_TIMEOUT)
+        return product_ids
+
+    @staticmethod
+    def get_recommended_products(user, limit: int = DEFAULT_LIMIT) -> QuerySet:
+        """
+        사용자 맞춤 추천 상품 목록 조회
+
+        취향 프로필이 없는 사용자에게는 기본 추천 전통주 섹션을 반환합니다.
+
+        Args:
+            user: 로그인 사용자
+            limit: 반환할 상품 수
+
+        Returns:
+            QuerySet: 추천 순으로 정렬된 상품 목록
+        """
+        product_ids = RecommendationService.get_recommended_product_ids(user)
+        if product_ids is None:
+            return ProductService.get_section_products("recommended", limit=limit)
+
+        base_queryset = ProductService.get_product_list_queryset()
+        if not product_ids:
+            return base_queryset.none()
+
+        return (
+            base_queryset.filter(id__in=product_ids)
+            .annotate(
+                recommendation_rank=Case(
+                    *[When(id=product_id, then=Value(rank)) for rank, product_id in enumerate(product_ids)],
+                    output_field=IntegerField(),
+                )
+            )
+            .order_by("recommendation_rank")[:limit]
+        )
@@ -0,0 +1,176 @@
+# apps/products/services/search_facet_service.py
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q, QuerySet
+from django.http import QueryDict
+
+from apps.products.models import Brewery, Drink, Product
+
+from .search_index_service import SearchIndexService
+from .search_service import SearchService
+
+
+class SearchFacetService:
+    """검색 사이드바 패싯(필터별 상품 수) 집계"""
+
+    # 가격대 구간 (최소 이상, 최대 미만 / None은 제한 없음)
+    PRICE_BANDS: List[Tuple[int, Optional[int]]] = [
+        (0, 10000),
+        (10000, 30000),
+        (30000, 50000),
+        (50000, 100000),
+        (100000, None),
+    ]
+
+    CACHE_KEY_PREFIX = "products:search_facets"
+    CACHE_TIMEOUT = 60
+
+    # 상품 변경 시 증가시켜 기존 집계 캐시를 한 번에 무효화하는 버전 키
+    VERSION_CACHE_KEY = "products:search_facets:version"
+
+    REGIONS_CACHE_KEY = "products:search_facets:regions"
+    REGIONS_CACHE_TIMEOUT = 60 * 60
+
+    @staticmethod
+    def _current_version() -> int:
+        version = cache.get(SearchFacetService.VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(SearchFacetService.VERSION_CACHE_KEY, 1, timeout=None)
+            version = cache.get(SearchFacetService.VERSION_CACHE_KEY, 1)
+        return int(version)
+
+    @staticmethod
+    def invalidate() -> None:
+        """
+        상품/술/양조장 변경 시 패싯 집계 캐시 무효화
+
+        커밋 후 버전을 올려 커밋 전 집계가 새 버전으로 캐시되지 않도록 합니다.
+        """
+        transaction.on_commit(SearchFacetService.bump_version)
+
+    @staticmethod
+    def bump_version() -> None:
+        """패싯 집계 버전 증가 및 지역 목록 캐시 삭제"""
+        try:
+            cache.incr(SearchFacetService.VERSION_CACHE_KEY)
+        except ValueError:
+            cache.set(SearchFacetService.VERSION_CACHE_KEY, 1, timeout=None)
+        cache.delete(SearchFacetService.REGIONS_CACHE_KEY)
+
+    @staticmethod
+    def get_cache_key(query_params: QueryDict) -> str:
+        """
+        정규화된 검색 조건 기반 캐시 키 생성
+
+        Args:
+            query_params: HTTP 요청의 쿼리 파라미터
+
+        Returns:
+            str: 캐시 키
+        """
+        normalized = SearchService.normalize_query_params(query_params)
+        digest = hashlib.sha1(json.dumps(normalized, ensure_ascii=False).encode()).hexdigest()
+        return f"{SearchFacetService.CACHE_KEY_PREFIX}:v{SearchFacetService._current_version()}:{digest}"
+
+    @staticmethod
+    def get_regions() -> List[str]:
+        """
+        양조장 지역 목록 (지역 패싯 항목)
+
+        Returns:
+            List[str]: 지역 목록
+        """
+        regions = cache.get(SearchFacetService.REGIONS_CACHE_KEY)
+        if regions is None:
+            regions = list(
+                Brewery.objects.exclude(region__isnull=True)
+                .exclude(region="")
+                .order_by("region")
+                .values_list("region", flat=True)
+                .distinct()
+            )
+            cache.set(SearchFacetService.REGIONS_CACHE_KEY, regions, timeout=SearchFacetService.REGIONS_CACHE_TIMEOUT)
+        return regions
+
+    @staticmethod
+    def get_filtered_queryset(query_params: QueryDict) -> QuerySet:
+        """
+        패싯 집계용 쿼리셋 (검색 목록과 같은 조건, 조인/프리페치 없음)
+
+        Args:
+            query_params: HTTP 요청의 쿼리 파라미터
+
+        Returns:
+            QuerySet: 필터가 적용된 상품 쿼리셋
+        """
+        queryset = SearchService.apply_filters(Product.objects.filter(status=Product.Status.ACTIVE), query_params)
+        search_terms = query_params.get("search", "").replace(",", " ").split()
+        return SearchIndexService.apply_search(queryset, search_terms)
+
+    @staticmethod
+    def compute_facets(query_params: QueryDict) -> Dict[str, Any]:
+        """
+        현재 검색 조건의 패싯 집계 (조건부 Count 단일 집계 쿼리)
+
+        Args:
+            query_params: HTTP 요청의 쿼리 파라미터
+
+        Returns:
+            Dict: 전체/주종별/카테고리별/지역별/가격대별 상품 수
+        """
+        regions = SearchFacetService.get_regions()
+
+        aggregates = {"total": Count("id")}
+        for alcohol_type in Drink.AlcoholType.values:
+            aggregates[f"alcohol_type__{alcohol_type}"] = Count("id", filter=Q(drink__alcohol_type=alcohol_type))
+        for param, field in SearchService.CATEGORY_FILTER_MAPPING.items():
+            aggregates[f"category__{param}"] = Count("id", filter=Q(**{field: True}))
+        for index, region in enumerate(regions):
+            aggregates[f"region__{index}"] = Count("id", filter=Q(drink__brewery__region=region))
+        for index, (min_price, max_price) in enumerate(SearchFacetService.PRICE_BANDS):
+            condition = Q(price__gte=min_price)
+            if max_price is not None:
+                condition &= Q(price__lt=max_price)
+            aggregates[f"price_band__{index}"] = Count("id", filter=condition)
+
+        counts = SearchFacetService.get_filtered_queryset(query_params).aggregate(**aggregates)
+
+        return {
+            "total_count": counts["total"],
+            "alcohol_types": [
+                {"value": value, "label": label, "count": counts[f"alcohol_type__{value}"]}
+                for value, label in Drink.AlcoholType.choices
+            ],
+            "categories": [
+                {"value": param, "count": counts[f"category__{param}"]}
+                for param in SearchService.CATEGORY_FILTER_MAPPING.keys()
+            ],
+            "regions": [{"value": region, "count": counts[f"region__{index}"]} for index, region in enumerate(regions)],
+            "price_bands": [
+                {"min_price": min_price, "max_price": max_price, "count": counts[f"price_band__{index}"]}
+                for index, (min_price, max_price) in enumerate(SearchFacetService.PRICE_BANDS)
+            ],
+        }
+
+    @staticmethod
+    def get_facets(query_params: QueryDict) -> Dict[str, Any]:
+        """
+        패싯 집계 조회 (정규화된 검색 조건별 캐시)
+
+        Args:
+            query_params: HTTP 요청의 쿼리 파라미터
+
+        Returns:
+            Dict: 패싯 집계 결과
+        """
+        cache_key = SearchFacetService.get_cache_key(query_params)
+        facets = cache.get(cache_key)
+        if facets is None:
+            facets = SearchFacetService.compute_facets(query_params)
+            cache.set(cache_key, facets, timeout=SearchFacetService.CACHE_TIMEOUT)
+        return facets
@@ -0,0 +1,191 @@
+# apps/products/services/search_index_service.py
+
+import re
+import unicodedata
+from typing import Iterable, List, Optional
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import Case, FloatField, Q, QuerySet, Value, When
+
+from apps.products.models import Product
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class SearchIndexService:
+    """상품 검색 문서(search_document) 관리 및 검색 로직"""
+
+    # 관련 모델 변경 시 한 번에 갱신할 상품 수
+    REFRESH_BATCH_SIZE = 500
+
+    # 이름이 검색어로 시작할 때 부여하는 가산점 (이름이 문서 맨 앞에 위치)
+    NAME_PREFIX_BOOST = 1.0
+
+    # 트라이그램 인덱스를 쓸 수 없는 짧은 검색어 길이 (미만이면 search_grams 인덱스 사용)
+    TRIGRAM_MIN_LENGTH = 3
+
+    @staticmethod
+    def normalize(text: Optional[str]) -> str:
+        """
+        검색용 텍스트 정규화
+
+        NFKC 정규화로 분리된 한글 자모(NFD 입력)를 완성형 음절로 합치고,
+        소문자화 및 공백 정리를 수행합니다.
+
+        Args:
+            text: 원본 텍스트
+
+        Returns:
+            str: 정규화된 텍스트
+        """
+        if not text:
+            return ""
+        text = unicodedata.normalize("NFKC", str(text)).lower()
+        return _WHITESPACE_RE.sub(" ", text).strip()
+
+    @staticmethod
+    def compose_document(parts: Iterable[Optional[str]]) -> str:
+        """
+        검색 문서 구성 (빈 값 제외, 중복 제거, 순서 유지)
+
+        Args:
+            parts: 문서에 포함할 텍스트 조각들 (이름이 가장 먼저 와야 함)
+
+        Returns:
+            str: 정규화된 검색 문서
+        """
+        seen = set()
+        normalized_parts = []
+        for part in parts:
+            normalized = SearchIndexService.normalize(part)
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                normalized_parts.append(normalized)
+        return " ".join(normalized_parts)
+
+    @staticmethod
+    def extract_grams(document: str) -> List[str]:
+        """
+        검색 문서의 1~2글자 조각 목록 (단어 안의 글자/연속한 두 글자, 중복 제거)
+
+        pg_trgm은 3글자 미만 검색어("소주", "약주" 등)에 트라이그램 인덱스를 쓰지 못하므로
+        짧은 검색어는 이 조각 배열의 GIN 인덱스로 찾습니다. (공백을 포함하지 않는 검색어는
+        문서의 부분 문자열인 것과 조각 배열에 포함된 것이 같음)
+
+        Args:
+            document: 정규화된 검색 문서
+
+        Returns:
+            List[str]: 정렬된 조각 목록
+        """
+        grams = set()
+        for word in document.split():
+            grams.update(word)
+            grams.update(word[index : index + 2] for index in range(len(word) - 1))
+        return sorted(grams)
+
+    @staticmethod
+    def build_document(product: Product) -> str:
+        """
+        상품의 검색 문서 생성 (상품명, 양조장, 주종, 설명)
+
+        Args:
+            product: 상품 객체
+
+        Returns:
+            str: 검색 문서
+        """
+        parts: List[Optional[str]] = [product.name]
+
+        if product.drink:
+            drink = product.drink
+            parts.extend([drink.brewery.name, drink.get_alcohol_type_display()])
+        elif product.package:
+            # 패키지는 구성 술의 이름/양조장/주종으로도 검색되도록 포함
+            for drink in product.package.drinks.all():
+                parts.extend([drink.name, drink.brewery.name, drink.get_alcohol_type_display()])
+
+        parts.append(product.description)
+        return SearchIndexService.compose_document(parts)
+
+    @staticmethod
+    def refresh_documents(queryset: QuerySet) -> int:
+        """
+        쿼리셋에 포함된 상품들의 검색 문서 재생성
+
+        Args:
+            queryset: 갱신할 상품 쿼리셋
+
+        Returns:
+            int: 변경된 상품 수
+        """
+        products = queryset.select_related("drink__brewery", "package").prefetch_related("package__drinks__brewery")
+
+        changed = []
+        for product in products.iterator(chunk_size=SearchIndexService.REFRESH_BATCH_SIZE):
+            document = SearchIndexService.build_document(product)
+            if document != product.search_document:
+                product.search_document = document
+                product.search_grams = SearchIndexService.extract_grams(document)
+                changed.append(product)
+
+        Product.objects.bulk_update(
+            changed, ["search_document", "search_grams"], batch_size=SearchIndexService.REFRESH_BATCH_SIZE
+        )
+        return len(changed)
+
+    @staticmethod
+    def refresh_for_drinks(drink_ids: Iterable[int]) -> int:
+        """
+        술 변경 시 관련 상품(개별 상품 + 해당 술이 포함된 패키지 상품) 검색 문서 갱신
+
+        Args:
+            drink_ids: 변경된 술 ID 목록
+
+        Returns:
+            int: 변경된 상품 수
+        """
+        drink_ids = list(drink_ids)
+        if not drink_ids:
+            return 0
+        queryset = Product.objects.filter(Q(drink_id__in=drink_ids) | Q(package__drinks__id__in=drink_ids)).distinct()
+        return SearchIndexService.refresh_documents(queryset)
+
+    @staticmethod
+    def apply_search(queryset: QuerySet, search_terms: List[str]) -> QuerySet:
+        """
+        검색어 필터링 및 관련도(search_rank) 계산
+
+        각 검색어는 모두 포함되어야 하며(AND), 트라이그램 GIN 인덱스를 사용하는
+        search_document 부분 일치 검색으로 처리됩니다.
+        문서와 검색어 모두 정규화(소문자)되어 있으므로 UPPER() 변환이 붙는 icontains 대신
+        contains를 사용해야 인덱스를 탈 수 있습니다.
+        TRIGRAM_MIN_LENGTH 미만인 검색어는 트라이그램이 없어 전체 스캔이 되므로
+        search_grams 배열 포함 검색(GIN 인덱스)으로 처리합니다.
+
+        Args:
+            queryset: 기본 쿼리셋
+            search_terms: 검색어 목록
+
+        Returns:
+            QuerySet: 검색 조건과 search_rank가 적용된 쿼리셋
+        """
+        terms = [term for term in (SearchIndexService.normalize(t) for t in search_terms) if term]
+        if not terms:
+            return queryset
+
+        for term in terms:
+            if len(term) < SearchIndexService.TRIGRAM_MIN_LENGTH:
+                queryset = queryset.filter(search_grams__contains=[term])
+            else:
+                queryset = queryset.filter(search_document__contains=term)
+
+        query = " ".join(terms)
+        return queryset.annotate(
+            search_rank=TrigramWordSimilarity(query, "search_document")
+            + Case(
+                When(search_document__startswith=query, then=Value(SearchIndexService.NAME_PREFIX_BOOST)),
+                default=Value(0.0),
+                output_field=FloatField(),
+            )
+        )
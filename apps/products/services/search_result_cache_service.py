@@ -0,0 +1,135 @@
+# apps/products/services/search_result_cache_service.py
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from django.core.cache import cache
+from django.http import QueryDict
+
+from apps.products.models import Product
+from apps.products.serializers.product.fast import ProductCardFastSerializer
+
+from .catalog_version_service import CatalogVersionService
+from .search_service import SearchService
+
+
+class SearchResultCacheService:
+    """
+    상품 검색 결과 캐시
+
+    정규화된 검색 조건/정렬/페이지별로 결과 상품 ID 목록과 페이지네이션 정보만 저장하고,
+    응답 시 id__in 쿼리 한 번으로 행을 다시 조회합니다.
+    키에 카탈로그 버전이 포함되어 있어 상품/술/이미지 변경 시 한 번에 무효화됩니다.
+    (조회수/좋아요 수 정렬 순서는 CACHE_TIMEOUT 동안 이전 순서가 유지될 수 있습니다)
+    """
+
+    CACHE_KEY_PREFIX = "products:search_results"
+    CACHE_TIMEOUT = 60 * 5
+
+    # 정렬/페이지네이션 파라미터 (검색 조건은 SearchService.normalize_query_params에서 정규화)
+    ORDERING_PARAM = "ordering"
+    PAGE_PARAM = "page"
+    CURSOR_PARAM = "cursor"
+    INCLUDE_COUNT_PARAM = "include_count"
+
+    @staticmethod
+    def normalize_query_params(query_params: QueryDict, page_size: Optional[int]) -> Dict[str, str]:
+        """
+        캐시 키용 검색 조건 정규화 (검색 조건 + 정렬 + 페이지)
+
+        기본값과 같은 파라미터(page=1 등)는 생략하고, 페이지 크기는 실제 적용되는 값을 사용합니다.
+
+        Args:
+            query_params: HTTP 요청의 쿼리 파라미터
+            page_size: 실제 적용되는 페이지 크기
+
+        Returns:
+            Dict: 정규화된 조건 (키 정렬)
+        """
+        normalized = SearchService.normalize_query_params(query_params)
+
+        ordering = ",".join(
+            field.strip()
+            for field in query_params.get(SearchResultCacheService.ORDERING_PARAM, "").split(",")
+            if field.strip()
+        )
+        if ordering:
+            normalized[SearchResultCacheService.ORDERING_PARAM] = ordering
+
+        if page_size is not None:
+            normalized["page_size"] = str(page_size)
+
+        if SearchResultCacheService.CURSOR_PARAM in query_params:
+            normalized[SearchResultCacheService.CURSOR_PARAM] = query_params.get(
+                SearchResultCacheService.CURSOR_PARAM, ""
+            )
+            if query_params.get(SearchResultCacheService.INCLUDE_COUNT_PARAM) == "true":
+                normalized[SearchResultCacheService.INCLUDE_COUNT_PARAM] = "true"
+        else:
+            page = query_params.get(SearchResultCacheService.PAGE_PARAM, "1")
+            if page not in ("", "1"):
+                normalized[SearchResultCacheService.PAGE_PARAM] = page
+
+        return dict(sorted(normalized.items()))
+
+    @staticmethod
+    def get_cache_key(query_params: QueryDict, page_size: Optional[int]) -> str:
+        """
+        검색 결과 캐시 키 생성
+
+        Args:
+            query_params: HTTP 요청의 쿼리 파라미터
+            page_size: 실제 적용되는 페이지 크기
+
+        Returns:
+            str: 캐시 키
+        """
+        normalized = SearchResultCacheService.normalize_query_params(query_params, page_size)
+        digest = hashlib.sha1(json.dumps(normalized, ensure_ascii=False).encode()).hexdigest()
+        return f"{SearchResultCacheService.CACHE_KEY_PREFIX}:v{CatalogVersionService.get_version()}:{digest}"
+
+    @staticmethod
+    def get(cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 검색 결과 조회
+
+        Returns:
+            Optional[Dict]: {"ids": [...], "pagination": {...}} 또는 None
+        """
+        return cache.get(cache_key)
+
+    @staticmethod
+    def set(cache_key: str, rows: List[Dict[str, Any]], pagination: Optional[Dict[str, Any]]) -> None:
+        """
+        검색 결과 저장 (상품 ID 순서와 페이지네이션 정보만 저장)
+
+        Args:
+            cache_key: 캐시 키
+            rows: 현재 페이지의 .values() 행 목록
+            pagination: 페이지네이션 상태
+        """
+        cache.set(
+            cache_key,
+            {"ids": [str(row["id"]) for row in rows], "pagination": pagination},
+            timeout=SearchResultCacheService.CACHE_TIMEOUT,
+        )
+
+    @staticmethod
+    def hydrate(product_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        캐시된 ID 순서대로 상품 행 조회 (id__in 쿼리 한 번)
+
+        Args:
+            product_ids: 상품 ID 목록 (정렬 순서 유지)
+
+        Returns:
+            List[Dict]: ProductCardFastSerializer.project() 형태의 행 목록
+        """
+        if not product_ids:
+            return []
+        rows = ProductCardFastSerializer.project(
+            Product.objects.filter(pk__in=product_ids, status=Product.Status.ACTIVE)
+        )
+        rows_by_id = {str(row["id"]): row for row in rows}
+        return [rows_by_id[product_id] for product_id in product_ids if product_id in rows_by_id]
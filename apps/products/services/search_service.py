@@ -3,11 +3,24 @@
 from decimal import Decimal, InvalidOperation
 from typing import Any, Dict, Optional
 
-from django.db.models import Case, DecimalField, F, QuerySet, When
+from django.db.models import (
+    Case,
+    DecimalField,
+    F,
+    IntegerField,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
 from django.http import QueryDict
 
 from apps.products.models import Product
 
+from .search_index_service import SearchIndexService
+from .search_term_service import SearchTermService
+from .taste_match_service import TasteMatchService
+
 
 class SearchService:
     """상품 검색 및 필터링 관련 비즈니스 로직"""
@@ -31,11 +44,18 @@ class SearchService:
         "award_winning": "is_award_winning",
     }
 
+    # 패키지 맛 프로필 필드 (구성 술 평균, PackageCompositionService가 저장)
+    PACKAGE_TASTE_PARAM_MAPPING = {param: f"package__{param}_level" for param in TASTE_PARAM_MAPPING}
+
     # 맛 프로필 허용 범위
     TASTE_RANGE = Decimal("0.5")
     MIN_TASTE_VALUE = Decimal("0.0")
     MAX_TASTE_VALUE = Decimal("5.0")
 
+    # 맛 검색 모드 (match=closest: 범위 필터 대신 가까운 맛 순으로 정렬)
+    MATCH_PARAM = "match"
+    MATCH_CLOSEST = "closest"
+
     @staticmethod
     def get_search_queryset(query_params: QueryDict) -> QuerySet:
         """
@@ -50,14 +70,98 @@ class SearchService:
         # 기본 쿼리셋 (할인율 계산 포함)
         queryset = SearchService._get_base_queryset_with_discount()
 
-        # 맛 프로필 필터 적용
-        queryset = SearchService.apply_taste_filters(queryset, query_params)
+        return SearchService.apply_filters(queryset, query_params)
+
+    @staticmethod
+    def apply_filters(queryset: QuerySet, query_params: QueryDict) -> QuerySet:
+        """
+        검색 필터 일괄 적용 (맛 프로필, 카테고리, 주종, 가격, 양조장)
+
+        검색 목록과 패싯 집계가 같은 필터 조건을 사용하도록 한 곳에서 적용합니다.
+
+        Args:
+            queryset: 기본 쿼리셋
+            query_params: HTTP 요청의 쿼리 파라미터
+
+        Returns:
+            QuerySet: 필터가 적용된 쿼리셋
+        """
+        # 맛 프로필 필터 적용 (closest 모드는 최근접 순위로 대체)
+        if query_params.get(SearchService.MATCH_PARAM) == SearchService.MATCH_CLOSEST:
+            queryset = SearchService.apply_taste_ranking(queryset, query_params)
+        else:
+            queryset = SearchService.apply_taste_filters(queryset, query_params)
 
         # 카테고리 필터 적용
         queryset = SearchService.apply_category_filters(queryset, query_params)
 
+        # 주종/가격/양조장 필터 적용
+        queryset = SearchService.apply_alcohol_type_filter(queryset, query_params.get("alcohol_type", ""))
+        queryset = SearchService.apply_price_range_filter(
+            queryset,
+            min_price=SearchService._parse_int(query_params.get("min_price")),
+            max_price=SearchService._parse_int(query_params.get("max_price")),
+        )
+        queryset = SearchService.apply_brewery_filter(queryset, SearchService._parse_int(query_params.get("brewery")))
+
         return queryset
 
+    @staticmethod
+    def _parse_int(value: Optional[str]) -> Optional[int]:
+        """정수 파라미터 변환 (잘못된 값은 None)"""
+        if value in (None, ""):
+            return None
+        try:
+            return int(str(value))
+        except (ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def normalize_query_params(query_params: QueryDict) -> Dict[str, str]:
+        """
+        검색 조건 정규화 (캐시 키 생성용)
+
+        결과에 영향을 주는 파라미터만 남기고 값 표현을 통일하여,
+        같은 조건이면 파라미터 순서/표기와 무관하게 같은 결과가 나오도록 합니다.
+
+        Args:
+            query_params: HTTP 요청의 쿼리 파라미터
+
+        Returns:
+            Dict: 정규화된 검색 조건 (키 정렬)
+        """
+        normalized = {}
+
+        for param in SearchService.TASTE_PARAM_MAPPING.keys():
+            value = query_params.get(param)
+            if value:
+                try:
+                    normalized[param] = str(Decimal(str(value)).normalize())
+                except (ValueError, TypeError, InvalidOperation):
+                    continue
+
+        if query_params.get(SearchService.MATCH_PARAM) == SearchService.MATCH_CLOSEST:
+            normalized[SearchService.MATCH_PARAM] = SearchService.MATCH_CLOSEST
+
+        for param in SearchService.CATEGORY_FILTER_MAPPING.keys():
+            if query_params.get(param) == "true":
+                normalized[param] = "true"
+
+        alcohol_type = query_params.get("alcohol_type")
+        if alcohol_type:
+            normalized["alcohol_type"] = str(alcohol_type)
+
+        for param in ("min_price", "max_price", "brewery"):
+            number = SearchService._parse_int(query_params.get(param))
+            if number is not None:
+                normalized[param] = str(number)
+
+        search = SearchIndexService.normalize(query_params.get("search", "").replace(",", " "))
+        if search:
+            normalized["search"] = search
+
+        return dict(sorted(normalized.items()))
+
     @staticmethod
     def _get_base_queryset_with_discount() -> QuerySet:
         """
@@ -69,7 +173,7 @@ class SearchService:
         return (
             Product.objects.filter(status="ACTIVE")
             .select_related("drink__brewery", "package")
-            .prefetch_related("images", "package__drinks__brewery")
+            .prefetch_related("package__drinks__brewery")
             .annotate(
                 discount_rate=Case(
                     When(
@@ -89,6 +193,9 @@ class SearchService:
         """
         맛 프로필 슬라이더 필터링 적용
 
+        개별 상품은 술 맛이 목표값 ±TASTE_RANGE 안에 있어야 하고,
+        패키지 상품은 구성 술 맛 평균이 편차만큼 좁아진 범위 안에 있어야 합니다.
+
         Args:
             queryset: 기본 쿼리셋
             query_params: HTTP 요청의 쿼리 파라미터
@@ -106,18 +213,81 @@ class SearchService:
                     min_value = max(SearchService.MIN_TASTE_VALUE, target - SearchService.TASTE_RANGE)
                     max_value = min(SearchService.MAX_TASTE_VALUE, target + SearchService.TASTE_RANGE)
 
+                    # 패키지 허용 범위 (구성 술 맛 편차 × 가중치만큼 축소)
+                    package_field = SearchService.PACKAGE_TASTE_PARAM_MAPPING[param]
+                    penalty = F("package__taste_spread") * Decimal(str(TasteMatchService.PACKAGE_SPREAD_PENALTY))
+
                     # 필터 적용
                     queryset = queryset.filter(
-                        **{f"{field}__gte": min_value},
-                        **{f"{field}__lte": max_value},
+                        Q(**{f"{field}__gte": min_value, f"{field}__lte": max_value})
+                        | Q(
+                            **{
+                                f"{package_field}__gte": target - SearchService.TASTE_RANGE + penalty,
+                                f"{package_field}__lte": target + SearchService.TASTE_RANGE - penalty,
+                            }
+                        )
                     )
 
-                except (ValueError, TypeError):
+                except (ValueError, TypeError, InvalidOperation):
                     # 잘못된 값은 무시
                     continue
 
         return queryset
 
+    @staticmethod
+    def get_taste_targets(query_params: QueryDict) -> Dict[str, float]:
+        """
+        맛 프로필 슬라이더 목표값 추출 (잘못된 값/범위 밖 값은 무시)
+
+        Args:
+            query_params: HTTP 요청의 쿼리 파라미터
+
+        Returns:
+            Dict: 맛 차원별 목표값
+        """
+        targets = {}
+        for param in SearchService.TASTE_PARAM_MAPPING.keys():
+            value = query_params.get(param)
+            if not value:
+                continue
+            try:
+                target = Decimal(str(value))
+            except (ValueError, TypeError, InvalidOperation):
+                continue
+            if SearchService.MIN_TASTE_VALUE <= target <= SearchService.MAX_TASTE_VALUE:
+                targets[param] = float(target)
+        return targets
+
+    @staticmethod
+    def apply_taste_ranking(queryset: QuerySet, query_params: QueryDict) -> QuerySet:
+        """
+        맛 프로필 최근접 검색 적용 (closest 모드)
+
+        맛 벡터 인덱스에서 가까운 순 상위 상품 ID를 구한 뒤,
+        해당 상품들로 제한하고 순위(taste_rank)를 어노테이션합니다.
+
+        Args:
+            queryset: 기본 쿼리셋
+            query_params: HTTP 요청의 쿼리 파라미터
+
+        Returns:
+            QuerySet: 최근접 상품으로 제한되고 taste_rank가 적용된 쿼리셋
+        """
+        targets = SearchService.get_taste_targets(query_params)
+        if not targets:
+            return queryset
+
+        product_ids = TasteMatchService.find_closest(targets, include_packages=True)
+        if not product_ids:
+            return queryset.none()
+
+        return queryset.filter(id__in=product_ids).annotate(
+            taste_rank=Case(
+                *[When(id=product_id, then=Value(rank)) for rank, product_id in enumerate(product_ids)],
+                output_field=IntegerField(),
+            )
+        )
+
     @staticmethod
     def apply_category_filters(queryset: QuerySet, query_params: QueryDict) -> QuerySet:
         """
@@ -200,7 +370,8 @@ class SearchService:
         Returns:
             Dict: 검색 통계 정보
         """
-        queryset = SearchService.get_search_queryset(query_params)
+        # 개수만 필요하므로 조인/프리페치/할인율 계산 없이 필터만 적용
+        queryset = SearchService.apply_filters(Product.objects.filter(status="ACTIVE"), query_params)
 
         return {
             "total_count": queryset.count(),
@@ -263,13 +434,12 @@ class SearchService:
     @staticmethod
     def get_popular_search_terms() -> list:
         """
-        인기 검색어 반환 (추후 구현 가능)
+        인기 검색어 반환 (최근 검색 기록 기반, SearchTermService 참고)
 
         Returns:
             list: 인기 검색어 목록
         """
-        # TODO: 실제 검색 로그 기반으로 구현
-        return ["막걸리", "소주", "전통주", "선물세트", "프리미엄"]
+        return SearchTermService.get_cached_popular_terms()
 
     @staticmethod
     def validate_search_params(query_params: QueryDict) -> Dict[str, list]:
@@ -0,0 +1,151 @@
+# apps/products/services/search_term_service.py
+
+import logging
+import time
+from typing import List, Optional
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from .search_index_service import SearchIndexService
+
+logger = logging.getLogger(__name__)
+
+
+class SearchTermService:
+    """
+    인기 검색어 집계
+
+    검색어를 시간 구간(버킷)별 Redis 정렬 집합에 기록(ZINCRBY, O(log n))하고,
+    최근 WINDOW_BUCKETS개 버킷을 오래된 버킷일수록 낮은 가중치로 합산(ZUNIONSTORE)한 상위 TOP_K를
+    별도 정렬 집합에 저장해 두어 조회는 ZREVRANGE 한 번으로 처리합니다.
+    """
+
+    KEY_PREFIX = "products:search_terms"
+
+    # 버킷 크기 (초) 및 집계 구간 (버킷 수)
+    BUCKET_SECONDS = 60 * 60
+    WINDOW_BUCKETS = 24
+
+    # 버킷이 하나 지날 때마다 곱하는 가중치
+    DECAY = 0.8
+
+    # 인기 검색어 개수
+    TOP_K = 10
+
+    # 인기 검색어 재집계 최소 간격 (초)
+    REBUILD_INTERVAL = 60
+
+    # 인기 검색어 API 응답 캐시
+    CACHE_KEY = "products:search_terms:popular_response"
+    CACHE_TIMEOUT = 60
+
+    # 기록하지 않는 검색어 길이
+    MAX_TERM_LENGTH = 30
+
+    # 집계된 검색어가 없을 때 (서비스 초기) 노출할 기본 검색어
+    DEFAULT_TERMS = ["막걸리", "소주", "전통주", "선물세트", "프리미엄"]
+
+    @staticmethod
+    def _redis():
+        return get_redis_connection("default")
+
+    @staticmethod
+    def _bucket_key(bucket: int) -> str:
+        return f"{SearchTermService.KEY_PREFIX}:bucket:{bucket}"
+
+    @staticmethod
+    def _popular_key() -> str:
+        return f"{SearchTermService.KEY_PREFIX}:popular"
+
+    @staticmethod
+    def _current_bucket(now: Optional[float] = None) -> int:
+        return int((now if now is not None else time.time()) // SearchTermService.BUCKET_SECONDS)
+
+    @staticmethod
+    def record(search: str, now: Optional[float] = None) -> None:
+        """
+        검색어 기록 (파이프라인 한 번, 실패해도 검색 요청에는 영향 없음)
+
+        Args:
+            search: 검색어 원문
+            now: 기준 시각 (테스트용, 기본 현재 시각)
+        """
+        term = SearchIndexService.normalize(search.replace(",", " "))
+        if not term or len(term) > SearchTermService.MAX_TERM_LENGTH:
+            return
+
+        bucket_key = SearchTermService._bucket_key(SearchTermService._current_bucket(now))
+        try:
+            redis = SearchTermService._redis()
+            pipeline = redis.pipeline(transaction=False)
+            pipeline.zincrby(bucket_key, 1, term)
+            pipeline.expire(bucket_key, SearchTermService.BUCKET_SECONDS * (SearchTermService.WINDOW_BUCKETS + 1))
+            pipeline.set(
+                f"{SearchTermService.KEY_PREFIX}:rebuild_lock", 1, nx=True, ex=SearchTermService.REBUILD_INTERVAL
+            )
+            _, _, rebuild = pipeline.execute()
+
+            # REBUILD_INTERVAL마다 한 요청이 인기 검색어 재집계
+            if rebuild:
+                SearchTermService.rebuild(now)
+        except RedisError:
+            logger.warning("검색어 기록 실패", exc_info=True)
+
+    @staticmethod
+    def rebuild(now: Optional[float] = None) -> int:
+        """
+        최근 구간 버킷을 감쇠 가중치로 합산하여 인기 검색어 상위 TOP_K 저장
+
+        Args:
+            now: 기준 시각 (테스트용, 기본 현재 시각)
+
+        Returns:
+            int: 저장된 검색어 수
+        """
+        current = SearchTermService._current_bucket(now)
+        weights = {
+            SearchTermService._bucket_key(current - age): SearchTermService.DECAY**age
+            for age in range(SearchTermService.WINDOW_BUCKETS)
+        }
+
+        redis = SearchTermService._redis()
+        popular_key = SearchTermService._popular_key()
+        staging_key = f"{popular_key}:staging"
+
+        if not redis.zunionstore(staging_key, weights):
+            redis.delete(popular_key)
+            return 0
+
+        pipeline = redis.pipeline()
+        pipeline.zremrangebyrank(staging_key, 0, -(SearchTermService.TOP_K + 1))
+        pipeline.rename(staging_key, popular_key)
+        pipeline.zcard(popular_key)
+        _, _, count = pipeline.execute()
+        return count
+
+    @staticmethod
+    def get_popular_terms() -> List[str]:
+        """
+        인기 검색어 조회 (ZREVRANGE 한 번, 집계 데이터가 없으면 기본 검색어)
+
+        Returns:
+            List[str]: 인기 검색어 목록 (인기순)
+        """
+        terms = SearchTermService._redis().zrevrange(SearchTermService._popular_key(), 0, SearchTermService.TOP_K - 1)
+        return [term.decode() for term in terms] or list(SearchTermService.DEFAULT_TERMS)
+
+    @staticmethod
+    def get_cached_popular_terms() -> List[str]:
+        """
+        인기 검색어 조회 (API 응답용 캐시)
+
+        Returns:
+            List[str]: 인기 검색어 목록
+        """
+        terms = cache.get(SearchTermService.CACHE_KEY)
+        if terms is None:
+            terms = SearchTermService.get_popular_terms()
+            cache.set(SearchTermService.CACHE_KEY, terms, timeout=SearchTermService.CACHE_TIMEOUT)
+        return terms
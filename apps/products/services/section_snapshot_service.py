@@ -0,0 +1,211 @@
+# apps/products/services/section_snapshot_service.py
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from django.core.cache import cache
+from django.db import connections, transaction
+
+from apps.products.serializers.product.fast import ProductCardFastSerializer
+
+from .product_service import ProductService
+
+logger = logging.getLogger(__name__)
+
+
+class SectionSnapshotService:
+    """메인/패키지 페이지 섹션 스냅샷 (직렬화된 응답을 Redis에 저장)"""
+
+    # 섹션 타입별 노출 상품 수
+    SECTION_LIMITS = {
+        "monthly": 3,
+        "popular": 8,
+        "recommended": 8,
+        "featured": 4,
+        "award_winning": 4,
+        "makgeolli": 4,
+        "regional": 4,
+    }
+
+    SNAPSHOT_KEY_TEMPLATE = "products:sections:{section_type}"
+    REBUILD_LOCK_KEY_TEMPLATE = "products:sections:{section_type}:rebuilding"
+
+    # 상품 변경(커밋) 시 증가 - 스냅샷에 기록된 세대와 다르면 오래된 스냅샷
+    GENERATION_KEY = "products:sections:generation"
+
+    # 이 시간이 지난 스냅샷은 그대로 응답하되 백그라운드에서 재생성 (초)
+    STALE_AFTER = 60 * 5
+
+    # 스냅샷 최대 보관 시간 - 재생성이 계속 실패해도 이보다 오래된 데이터는 응답하지 않음 (초)
+    HARD_TIMEOUT = 60 * 60
+
+    # 재생성 중복 실행 방지 락 유지 시간 (초)
+    REBUILD_LOCK_TIMEOUT = 30
+
+    # 스냅샷이 없고 다른 요청이 생성 중일 때 기다리는 최대 시간/확인 간격 (초)
+    BUILD_WAIT_TIMEOUT = 1.0
+    BUILD_WAIT_INTERVAL = 0.05
+
+    @staticmethod
+    def get_snapshot_key(section_type: str) -> str:
+        return SectionSnapshotService.SNAPSHOT_KEY_TEMPLATE.format(section_type=section_type)
+
+    @staticmethod
+    def get_rebuild_lock_key(section_type: str) -> str:
+        return SectionSnapshotService.REBUILD_LOCK_KEY_TEMPLATE.format(section_type=section_type)
+
+    @staticmethod
+    def get_generation() -> int:
+        """
+        현재 스냅샷 세대
+
+        Returns:
+            int: 세대 번호
+        """
+        generation = cache.get(SectionSnapshotService.GENERATION_KEY)
+        if generation is None:
+            cache.add(SectionSnapshotService.GENERATION_KEY, 1, timeout=None)
+            generation = cache.get(SectionSnapshotService.GENERATION_KEY, 1)
+        return int(generation)
+
+    @staticmethod
+    def build_snapshot(section_type: str, store: bool = True) -> Dict[str, Any]:
+        """
+        섹션 상품을 조회/직렬화하여 스냅샷 저장
+
+        조회 전 세대를 기록하므로, 조회 중 상품이 변경되면 저장된 스냅샷은 오래된 것으로 판단됩니다.
+
+        Args:
+            section_type: 섹션 타입
+            store: 캐시에 저장 여부
+
+        Returns:
+            Dict: 스냅샷 ({"built_at": ..., "generation": ..., "products": [...]})
+        """
+        generation = SectionSnapshotService.get_generation()
+        limit = SectionSnapshotService.SECTION_LIMITS[section_type]
+        products = ProductService.get_section_products(section_type, limit=limit)
+        snapshot = {
+            "built_at": time.time(),
+            "generation": generation,
+            "products": ProductCardFastSerializer.serialize(products),
+        }
+        if store:
+            cache.set(
+                SectionSnapshotService.get_snapshot_key(section_type),
+                snapshot,
+                timeout=SectionSnapshotService.HARD_TIMEOUT,
+            )
+        return snapshot
+
+    @staticmethod
+    def get_snapshot(section_type: str) -> Dict[str, Any]:
+        """
+        섹션 스냅샷 조회
+
+        현재 세대 스냅샷이 있으면 SQL 없이 응답하고, STALE_AFTER가 지났으면 백그라운드 재생성을 예약합니다.
+        스냅샷이 없거나 세대가 다르면(상품 변경) 섹션 락을 잡은 요청 하나만 동기적으로 생성하며,
+        나머지 요청은 이전 스냅샷을 응답하거나(없으면) 생성이 끝나기를 잠시 기다립니다.
+
+        Args:
+            section_type: 섹션 타입
+
+        Returns:
+            Dict: 스냅샷 ({"built_at": ..., "products": [...]}, built_at은 조건부 요청 검증값으로도 사용)
+        """
+        snapshot_key = SectionSnapshotService.get_snapshot_key(section_type)
+        values = cache.get_many([snapshot_key, SectionSnapshotService.GENERATION_KEY])
+        snapshot: Optional[Dict[str, Any]] = values.get(snapshot_key)
+        generation = values.get(SectionSnapshotService.GENERATION_KEY)
+        if generation is None:
+            generation = SectionSnapshotService.get_generation()
+
+        if snapshot is not None and snapshot.get("generation") == int(generation):
+            if time.time() - snapshot["built_at"] > SectionSnapshotService.STALE_AFTER:
+                SectionSnapshotService.rebuild_in_background([section_type])
+            return snapshot
+
+        lock_key = SectionSnapshotService.get_rebuild_lock_key(section_type)
+        if cache.add(lock_key, 1, timeout=SectionSnapshotService.REBUILD_LOCK_TIMEOUT):
+            try:
+                return SectionSnapshotService.build_snapshot(section_type)
+            finally:
+                cache.delete(lock_key)
+
+        # 다른 요청이 생성 중 - 이전 스냅샷 응답
+        if snapshot is not None:
+            return snapshot
+
+        deadline = time.monotonic() + SectionSnapshotService.BUILD_WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(SectionSnapshotService.BUILD_WAIT_INTERVAL)
+            snapshot = cache.get(snapshot_key)
+            if snapshot is not None:
+                return snapshot
+
+        # 생성이 늦어지면 이 요청만 직접 조회 (저장은 락을 가진 요청이 담당)
+        return SectionSnapshotService.build_snapshot(section_type, store=False)
+
+    @staticmethod
+    def get_products(section_type: str) -> List[Dict[str, Any]]:
+        """
+        섹션 상품 직렬화 데이터 조회 (스냅샷 우선)
+
+        Args:
+            section_type: 섹션 타입
+
+        Returns:
+            List[Dict]: 직렬화된 상품 목록
+        """
+        return SectionSnapshotService.get_snapshot(section_type)["products"]
+
+    @staticmethod
+    def rebuild_in_background(section_types: Optional[List[str]] = None) -> None:
+        """
+        섹션 스냅샷 백그라운드 재생성 (섹션별 락으로 중복 실행 방지)
+
+        Args:
+            section_types: 재생성할 섹션 타입 목록 (None이면 전체)
+        """
+        targets = []
+        for section_type in section_types or list(SectionSnapshotService.SECTION_LIMITS):
+            lock_key = SectionSnapshotService.get_rebuild_lock_key(section_type)
+            if cache.add(lock_key, 1, timeout=SectionSnapshotService.REBUILD_LOCK_TIMEOUT):
+                targets.append(section_type)
+
+        if targets:
+            threading.Thread(target=SectionSnapshotService._rebuild, args=(targets,), daemon=True).start()
+
+    @staticmethod
+    def _rebuild(section_types: List[str]) -> None:
+        try:
+            for section_type in section_types:
+                try:
+                    SectionSnapshotService.build_snapshot(section_type)
+                except Exception:
+                    logger.exception("섹션 스냅샷 재생성 실패: %s", section_type)
+                finally:
+                    cache.delete(SectionSnapshotService.get_rebuild_lock_key(section_type))
+        finally:
+            connections.close_all()
+
+    @staticmethod
+    def mark_stale() -> None:
+        """세대 증가 - 기존 스냅샷은 삭제하지 않고 오래된 것으로 표시"""
+        try:
+            cache.incr(SectionSnapshotService.GENERATION_KEY)
+        except ValueError:
+            cache.set(SectionSnapshotService.GENERATION_KEY, 1, timeout=None)
+
+    @staticmethod
+    def invalidate() -> None:
+        """
+        상품/이미지/패키지 변경 시 전체 섹션 스냅샷 갱신
+
+        커밋 후 세대만 증가시키며 스냅샷은 삭제하지 않습니다.
+        커밋 전 조회가 변경 전 데이터로 스냅샷을 다시 만들지 않고,
+        다음 조회 시 섹션별로 한 요청만 락을 잡고 재생성하는 동안 나머지는 이전 스냅샷을 응답합니다.
+        """
+        transaction.on_commit(SectionSnapshotService.mark_stale)
@@ -0,0 +1,152 @@
+# apps/products/services/taste_match_service.py
+
+import threading
+from typing import Collection, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .catalog_snapshot_service import (
+    FLAG_HAS_TASTE,
+    FLAG_IS_PACKAGE,
+    TASTE_DIMENSIONS,
+    CatalogSnapshot,
+    CatalogSnapshotService,
+)
+
+
+class TasteVectorIndex:
+    """활성 상품 맛 벡터 행렬 (카탈로그 스냅샷 기반)"""
+
+    def __init__(
+        self,
+        version: int,
+        product_ids: Sequence[str],
+        matrix: np.ndarray,
+        is_package: np.ndarray,
+        spread: Optional[np.ndarray] = None,
+    ):
+        self.version = version
+        self.product_ids = product_ids
+        self.matrix = matrix
+        self.is_package = is_package
+        # 패키지 구성 술 맛 편차 (개별 상품은 0)
+        self.spread = spread if spread is not None else np.zeros(len(product_ids), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+
+class TasteMatchService:
+    """맛 프로필 최근접 검색 (가까운 맛 순 상품 추천)"""
+
+    # 반환할 최대 상품 수
+    DEFAULT_LIMIT = 100
+
+    # 패키지 맛 편차 가중치 (구성 술 맛이 제각각인 패키지일수록 평균 맛이 같아도 멀게 취급)
+    PACKAGE_SPREAD_PENALTY = 0.5
+
+    _index: Optional[TasteVectorIndex] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def invalidate() -> None:
+        """인덱스 무효화 (맛 벡터는 카탈로그 스냅샷에서 읽으므로 스냅샷을 무효화)"""
+        CatalogSnapshotService.invalidate()
+
+    @staticmethod
+    def build_index(snapshot: CatalogSnapshot) -> TasteVectorIndex:
+        """
+        카탈로그 스냅샷으로 맛 벡터 인덱스 구성
+
+        맛 행렬은 스냅샷의 공유 메모리를 복사 없이 그대로 사용하고, 워커별로는 상품당 몇 바이트의 마스크만 만듭니다.
+        개별 상품은 술의 맛 프로필을, 패키지 상품은 Package에 저장된 구성 술 맛 평균/편차를 사용합니다.
+
+        Args:
+            snapshot: 카탈로그 스냅샷
+
+        Returns:
+            TasteVectorIndex: 생성된 인덱스
+        """
+        # 맛 정보가 없는 상품(구성 술이 없는 패키지)은 편차를 무한대로 두어 결과에서 제외
+        spread = np.where(snapshot.has_flag(FLAG_HAS_TASTE), snapshot.spread, np.inf).astype(np.float32)
+        return TasteVectorIndex(
+            snapshot.version,
+            snapshot.product_ids,
+            snapshot.taste,
+            snapshot.has_flag(FLAG_IS_PACKAGE),
+            spread,
+        )
+
+    @classmethod
+    def get_index(cls) -> TasteVectorIndex:
+        """
+        현재 스냅샷 버전의 인덱스 반환 (버전이 바뀌었으면 재구성)
+
+        Returns:
+            TasteVectorIndex: 맛 벡터 인덱스
+        """
+        snapshot = CatalogSnapshotService.get_snapshot()
+        index = cls._index
+        if index is not None and index.version == snapshot.version:
+            return index
+
+        with cls._lock:
+            if cls._index is None or cls._index.version != snapshot.version:
+                cls._index = cls.build_index(snapshot)
+            return cls._index
+
+    @classmethod
+    def find_closest(
+        cls,
+        targets: Dict[str, float],
+        limit: int = DEFAULT_LIMIT,
+        include_packages: bool = False,
+        exclude_ids: Optional[Collection[str]] = None,
+    ) -> List[str]:
+        """
+        목표 맛 프로필과 가장 가까운 상품 ID 목록 반환 (가까운 순)
+
+        지정된 슬라이더 차원만 가중치 1로 반영한 가중 유클리드 거리를 사용하며,
+        패키지는 구성 술 맛 편차 × PACKAGE_SPREAD_PENALTY만큼 거리를 더합니다.
+
+        Args:
+            targets: 맛 차원별 목표값 (예: {"sweetness": 3.0, "body": 4.0})
+            limit: 반환할 최대 상품 수
+            include_packages: 패키지 상품 포함 여부
+            exclude_ids: 제외할 상품 ID 목록
+
+        Returns:
+            List[str]: 상품 ID 목록
+        """
+        index = cls.get_index()
+        if not len(index) or not targets or limit <= 0:
+            return []
+
+        target = np.zeros(len(TASTE_DIMENSIONS), dtype=np.float32)
+        weights = np.zeros(len(TASTE_DIMENSIONS), dtype=np.float32)
+        for position, dimension in enumerate(TASTE_DIMENSIONS):
+            if dimension in targets:
+                target[position] = targets[dimension]
+                weights[position] = 1.0
+
+        diff = index.matrix - target
+        distances = np.sqrt((diff * diff) @ weights) + index.spread * cls.PACKAGE_SPREAD_PENALTY
+        if not include_packages:
+            distances[index.is_package] = np.inf
+
+        exclude_ids = set(exclude_ids or ())
+        k = min(limit + len(exclude_ids), len(index))
+        candidates = np.argpartition(distances, k - 1)[:k]
+        ordered = candidates[np.argsort(distances[candidates], kind="stable")]
+
+        product_ids = []
+        for position in ordered:
+            if not np.isfinite(distances[position]):
+                break
+            product_id = index.product_ids[position]
+            if product_id in exclude_ids:
+                continue
+            product_ids.append(product_id)
+            if len(product_ids) >= limit:
+                break
+        return product_ids
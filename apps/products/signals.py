@@ -0,0 +1,391 @@
+# apps/products/signals.py
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.products.models import (
+    Brewery,
+    Drink,
+    Package,
+    PackageItem,
+    Product,
+    ProductImage,
+    ProductLike,
+)
+from apps.products.services.autocomplete_service import AutocompleteService
+from apps.products.services.catalog_snapshot_service import CatalogSnapshotService
+from apps.products.services.catalog_version_service import CatalogVersionService
+from apps.products.services.like_service import LikeService
+from apps.products.services.package_composition_service import PackageCompositionService
+from apps.products.services.product_detail_cache_service import (
+    ProductDetailCacheService,
+)
+from apps.products.services.recommendation_service import RecommendationService
+from apps.products.services.search_facet_service import SearchFacetService
+from apps.products.services.search_index_service import SearchIndexService
+from apps.products.services.section_snapshot_service import SectionSnapshotService
+from apps.users.models import PreferTasteProfile
+from core.utils.response_cache import ResponseCache
+
+# 검색 문서에 영향을 주는 필드들
+DRINK_SEARCH_FIELDS = {"name", "brewery", "alcohol_type"}
+BREWERY_SEARCH_FIELDS = {"name"}
+PACKAGE_SEARCH_FIELDS = {"name"}
+
+# 맛 벡터에 영향을 주는 필드들
+DRINK_TASTE_FIELDS = {
+    "sweetness_level",
+    "acidity_level",
+    "body_level",
+    "carbonation_level",
+    "bitterness_level",
+    "aroma_level",
+}
+
+# 카탈로그 스냅샷(맛 벡터 인덱스 포함)에 영향을 주는 술/패키지 필드들
+DRINK_SNAPSHOT_FIELDS = DRINK_TASTE_FIELDS | {"name", "alcohol_type"}
+PACKAGE_SNAPSHOT_FIELDS = {"name"}
+
+# 패키지 구성 요약에 영향을 주는 필드들
+DRINK_COMPOSITION_FIELDS = DRINK_TASTE_FIELDS | {"alcohol_type", "abv"}
+
+# 해당 상품 응답에만 영향을 주는 카운터 필드들
+PRODUCT_COUNTER_FIELDS = {"view_count", "order_count", "like_count", "review_count"}
+
+
+def _affects(update_fields, fields) -> bool:
+    """update_fields 저장 시 관련 필드가 포함되어 있는지 확인"""
+    return update_fields is None or bool(fields.intersection(update_fields))
+
+
+# ============================================================================
+# 검색 문서 동기화
+# ============================================================================
+
+
+@receiver(post_save, sender=Drink)
+def refresh_search_documents_on_drink_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """술 이름/양조장/주종 변경 시 관련 상품 검색 문서 갱신"""
+    if raw or created or not _affects(update_fields, DRINK_SEARCH_FIELDS):
+        return
+    SearchIndexService.refresh_for_drinks([instance.pk])
+
+
+@receiver(post_save, sender=Brewery)
+def refresh_search_documents_on_brewery_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """양조장 이름 변경 시 소속 술의 상품 검색 문서 갱신"""
+    if raw or created or not _affects(update_fields, BREWERY_SEARCH_FIELDS):
+        return
+    SearchIndexService.refresh_for_drinks(instance.drinks.values_list("id", flat=True))
+
+
+@receiver(post_save, sender=Package)
+def refresh_search_documents_on_package_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """패키지 이름 변경 시 패키지 상품 검색 문서 갱신"""
+    if raw or created or not _affects(update_fields, PACKAGE_SEARCH_FIELDS):
+        return
+    SearchIndexService.refresh_documents(Product.objects.filter(package=instance))
+
+
+@receiver(post_save, sender=PackageItem)
+@receiver(post_delete, sender=PackageItem)
+def refresh_search_documents_on_package_item_change(sender, instance, raw=False, **kwargs):
+    """패키지 구성 변경 시 패키지 상품 검색 문서 갱신"""
+    if raw:
+        return
+    SearchIndexService.refresh_documents(Product.objects.filter(package_id=instance.package_id))
+
+
+# ============================================================================
+# 패키지 구성 요약 갱신
+# ============================================================================
+
+
+@receiver(post_save, sender=PackageItem)
+@receiver(post_delete, sender=PackageItem)
+def refresh_package_composition_on_item_change(sender, instance, raw=False, **kwargs):
+    """패키지 구성 변경 시 패키지 구성 요약 갱신"""
+    if raw:
+        return
+    PackageCompositionService.refresh([instance.package_id])
+
+
+@receiver(post_save, sender=Drink)
+def refresh_package_composition_on_drink_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """술 주종/도수/맛 프로필 변경 시 포함된 패키지 구성 요약 갱신"""
+    if raw or created or not _affects(update_fields, DRINK_COMPOSITION_FIELDS):
+        return
+    PackageCompositionService.refresh_for_drinks([instance.pk])
+
+
+# ============================================================================
+# 카탈로그 스냅샷 무효화 (맛 벡터 인덱스 포함)
+# ============================================================================
+
+
+@receiver(post_save, sender=Product)
+def invalidate_catalog_snapshot_on_product_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    """상품 추가/변경 시 카탈로그 스냅샷 무효화 (카운터만 변경되면 MAX_AGE마다 재생성되므로 제외)"""
+    if raw or (update_fields and PRODUCT_COUNTER_FIELDS.issuperset(update_fields)):
+        return
+    CatalogSnapshotService.invalidate()
+
+
+@receiver(post_delete, sender=Product)
+def invalidate_catalog_snapshot_on_product_delete(sender, instance, **kwargs):
+    """상품 삭제 시 카탈로그 스냅샷 무효화"""
+    CatalogSnapshotService.invalidate()
+
+
+@receiver(post_save, sender=Drink)
+def invalidate_catalog_snapshot_on_drink_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """술 이름/주종/맛 프로필 변경 시 카탈로그 스냅샷 무효화"""
+    if raw or created or not _affects(update_fields, DRINK_SNAPSHOT_FIELDS):
+        return
+    CatalogSnapshotService.invalidate()
+
+
+@receiver(post_save, sender=Package)
+def invalidate_catalog_snapshot_on_package_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """패키지 이름 변경 시 카탈로그 스냅샷 무효화"""
+    if raw or created or not _affects(update_fields, PACKAGE_SNAPSHOT_FIELDS):
+        return
+    CatalogSnapshotService.invalidate()
+
+
+@receiver(post_save, sender=PackageItem)
+@receiver(post_delete, sender=PackageItem)
+def invalidate_catalog_snapshot_on_package_item_change(sender, instance, raw=False, **kwargs):
+    """패키지 구성 변경 시 카탈로그 스냅샷 무효화 (패키지 맛 = 구성 술 평균)"""
+    if raw:
+        return
+    CatalogSnapshotService.invalidate()
+
+
+# ============================================================================
+# 개인화 추천 캐시 무효화
+# ============================================================================
+
+
+@receiver(post_save, sender=PreferTasteProfile)
+def invalidate_recommendations_on_profile_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    """취향 프로필 갱신(last_updated 변경) 시 사용자 추천 캐시 삭제"""
+    if raw or not _affects(update_fields, {"last_updated"}):
+        return
+    RecommendationService.invalidate(instance.user_id)
+
+
+# ============================================================================
+# 섹션 스냅샷 갱신
+# ============================================================================
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+@receiver(post_save, sender=Package)
+@receiver(post_delete, sender=Package)
+@receiver(post_save, sender=PackageItem)
+@receiver(post_delete, sender=PackageItem)
+@receiver(post_save, sender=Drink)
+@receiver(post_save, sender=Brewery)
+def refresh_section_snapshots(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    섹션에 노출되는 상품 정보 변경 시 섹션 스냅샷 갱신
+
+    패키지 구성 변경은 PackageItem 시그널로 처리 (Package.alcohol_types는 bulk_update로 저장되어 시그널 없음)
+    """
+    if raw:
+        return
+    # 카운터만 저장한 경우 제외 (인기순 변화는 STALE_AFTER 주기 재생성으로 반영)
+    if sender is Product and update_fields and PRODUCT_COUNTER_FIELDS.issuperset(update_fields):
+        return
+    SectionSnapshotService.invalidate()
+
+
+# ============================================================================
+# 검색 패싯 집계 캐시 무효화
+# ============================================================================
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=Drink)
+@receiver(post_save, sender=Brewery)
+@receiver(post_delete, sender=Brewery)
+@receiver(post_save, sender=Package)
+@receiver(post_save, sender=PackageItem)
+@receiver(post_delete, sender=PackageItem)
+def invalidate_search_facets(sender, instance, raw=False, **kwargs):
+    """검색 조건/집계 대상 필드 변경 시 패싯 캐시 무효화"""
+    if raw:
+        return
+    SearchFacetService.invalidate()
+
+
+# ============================================================================
+# 카탈로그 버전 갱신 (검색 결과 캐시 등 버전 기반 캐시 무효화)
+# ============================================================================
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+@receiver(post_save, sender=Drink)
+@receiver(post_delete, sender=Drink)
+@receiver(post_save, sender=Brewery)
+@receiver(post_delete, sender=Brewery)
+@receiver(post_save, sender=Package)
+@receiver(post_delete, sender=Package)
+@receiver(post_save, sender=PackageItem)
+@receiver(post_delete, sender=PackageItem)
+def bump_catalog_version(sender, instance, raw=False, **kwargs):
+    """카탈로그 데이터 변경 시 전역 카탈로그 버전 증가 (커밋 후 - 커밋 전 결과가 새 버전으로 캐시되지 않도록)"""
+    if raw:
+        return
+    transaction.on_commit(CatalogVersionService.bump)
+
+
+# ============================================================================
+# 좋아요 수/사용자 좋아요 집합 동기화
+# ============================================================================
+
+
+@receiver(post_save, sender=ProductLike)
+def apply_product_like_created(sender, instance, created, raw=False, **kwargs):
+    """좋아요 추가 시 상품 좋아요 수 증가 및 사용자 좋아요 집합에 추가"""
+    if raw or not created:
+        return
+    LikeService.apply_like_change(instance.user_id, instance.product_id, 1)
+
+
+@receiver(post_delete, sender=ProductLike)
+def apply_product_like_deleted(sender, instance, **kwargs):
+    """
+    좋아요 삭제 시 상품 좋아요 수 감소 및 사용자 좋아요 집합에서 제거
+
+    좋아요 토글은 DELETE 결과 행 수로 직접 처리하므로 이 시그널을 거치지 않습니다. (관리자/연쇄 삭제용)
+    """
+    LikeService.apply_like_change(instance.user_id, instance.product_id, -1)
+
+
+# ============================================================================
+# 자동완성 색인 변경 로그
+# ============================================================================
+
+AUTOCOMPLETE_TYPES = {Drink: "drink", Package: "package", Brewery: "brewery"}
+
+
+@receiver(post_save, sender=Drink)
+@receiver(post_save, sender=Package)
+@receiver(post_save, sender=Brewery)
+def record_autocomplete_change_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """술/패키지/양조장 이름 추가/변경 시 자동완성 변경 로그 기록"""
+    if raw or not (created or _affects(update_fields, {"name"})):
+        return
+    AutocompleteService.record_change(AUTOCOMPLETE_TYPES[sender], instance.pk, instance.name)
+
+
+@receiver(post_delete, sender=Drink)
+@receiver(post_delete, sender=Package)
+@receiver(post_delete, sender=Brewery)
+def record_autocomplete_change_on_delete(sender, instance, **kwargs):
+    """술/패키지/양조장 삭제 시 자동완성 변경 로그 기록"""
+    AutocompleteService.record_change(AUTOCOMPLETE_TYPES[sender], instance.pk, None)
+
+
+# ============================================================================
+# 익명 응답 캐시 무효화 (서로게이트 키 purge)
+# ============================================================================
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+@receiver(post_save, sender=Drink)
+@receiver(post_delete, sender=Drink)
+@receiver(post_save, sender=Brewery)
+@receiver(post_delete, sender=Brewery)
+@receiver(post_save, sender=Package)
+@receiver(post_delete, sender=Package)
+@receiver(post_save, sender=PackageItem)
+@receiver(post_delete, sender=PackageItem)
+def purge_catalog_response_cache(sender, instance, raw=False, update_fields=None, **kwargs):
+    """카탈로그 데이터 변경 시 카탈로그 응답 캐시 삭제 (카운터만 변경되면 해당 상품 응답만)"""
+    if raw:
+        return
+    if sender is Product and update_fields and PRODUCT_COUNTER_FIELDS.issuperset(update_fields):
+        ResponseCache.purge_on_commit(f"product:{instance.pk}")
+        return
+    ResponseCache.purge_on_commit("catalog")
+
+
+@receiver(post_save, sender=ProductLike)
+@receiver(post_delete, sender=ProductLike)
+def purge_product_response_cache_on_like(sender, instance, raw=False, **kwargs):
+    """좋아요 추가/삭제 시 해당 상품 응답 캐시 삭제 (좋아요 수 반영)"""
+    if raw:
+        return
+    ResponseCache.purge_on_commit(f"product:{instance.product_id}")
+
+
+# ============================================================================
+# 상품 상세 직렬화 캐시 무효화 (좋아요 수는 LikeService에서 갱신)
+# ============================================================================
+
+DETAIL_CACHE_TAGS = {Drink: "drink", Brewery: "brewery", Package: "package"}
+
+
+@receiver(post_save, sender=Product)
+def refresh_product_detail_cache_on_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    """상품 변경 시 상세 캐시 삭제 (카운터만 변경되면 캐시의 카운터 값만 갱신)"""
+    if raw:
+        return
+    if update_fields and PRODUCT_COUNTER_FIELDS.issuperset(update_fields):
+        counters = {field: getattr(instance, field) for field in update_fields}
+        transaction.on_commit(partial(ProductDetailCacheService.set_counters, instance.pk, counters))
+        return
+    ProductDetailCacheService.invalidate_on_commit(instance.pk)
+
+
+@receiver(post_delete, sender=Product)
+def invalidate_product_detail_cache_on_delete(sender, instance, **kwargs):
+    """상품 삭제 시 상세 캐시 삭제"""
+    ProductDetailCacheService.invalidate_on_commit(instance.pk)
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def invalidate_product_detail_cache_on_image_change(sender, instance, raw=False, **kwargs):
+    """상품 이미지 추가/변경/삭제 시 해당 상품 상세 캐시 삭제"""
+    if raw:
+        return
+    ProductDetailCacheService.invalidate_on_commit(instance.product_id)
+
+
+@receiver(post_save, sender=Drink)
+@receiver(post_delete, sender=Drink)
+@receiver(post_save, sender=Brewery)
+@receiver(post_delete, sender=Brewery)
+@receiver(post_save, sender=Package)
+@receiver(post_delete, sender=Package)
+def purge_product_detail_cache(sender, instance, raw=False, **kwargs):
+    """술/양조장/패키지 변경 시 해당 데이터를 포함한 상품 상세 캐시 삭제"""
+    if raw:
+        return
+    ProductDetailCacheService.purge_on_commit([f"{DETAIL_CACHE_TAGS[sender]}:{instance.pk}"])
+
+
+@receiver(post_save, sender=PackageItem)
+@receiver(post_delete, sender=PackageItem)
+def purge_product_detail_cache_on_package_item_change(sender, instance, raw=False, **kwargs):
+    """패키지 구성 변경 시 해당 패키지 상품 상세 캐시 삭제"""
+    if raw:
+        return
+    ProductDetailCacheService.purge_on_commit([f"package:{instance.package_id}"])
@@ -209,6 +209,35 @@ class ProductSerializerTest(BaseSerializerTestCase):
         }
         self.assertTrue(expected_fields.issubset(set(first_product.keys())))
 
+    def test_product_main_image_url_synced(self):
+        """메인 이미지 변경/삭제 시 main_image_url 동기화 검증"""
+        from apps.products.serializers.product.list import ProductListSerializer
+
+        product = self.individual_product
+        ProductImage.objects.filter(product=product, is_main=True).delete()
+        image = ProductImage.objects.create(product=product, image_url="https://example.com/new-main.jpg", is_main=True)
+
+        product.refresh_from_db()
+        self.assertEqual(ProductListSerializer(product).data["main_image_url"], "https://example.com/new-main.jpg")
+
+        image.delete()
+        product.refresh_from_db()
+        self.assertIsNone(product.main_image_url)
+
+    def test_fast_card_serializer_matches_list_serializer(self):
+        """고속 카드 직렬화 결과가 ProductListSerializer와 바이트 단위로 같은지 검증"""
+        from rest_framework.renderers import JSONRenderer
+
+        from apps.products.serializers.product.fast import ProductCardFastSerializer
+        from apps.products.serializers.product.list import ProductListSerializer
+
+        queryset = Product.objects.select_related("drink__brewery", "package").order_by("-created_at", "id")
+
+        expected = JSONRenderer().render(ProductListSerializer(queryset, many=True).data)
+        actual = JSONRenderer().render(ProductCardFastSerializer.serialize(queryset))
+
+        self.assertEqual(actual, expected)
+
     def test_product_no_discount_serialization(self):
         """할인 없는 상품 직렬화 검증"""
         from apps.products.serializers.product.detail import ProductDetailSerializer
@@ -1,13 +1,52 @@
 # apps/products/tests/test_services.py
 
+import gzip
+import json
+import tempfile
+import time
+import uuid
 from decimal import Decimal
+from unittest.mock import patch
 
+import brotli
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import IntegrityError, connection
 from django.http import QueryDict
-from django.test import TestCase
-
-from apps.products.models import Product, ProductLike
-from apps.products.services import LikeService, ProductService, SearchService
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.products.models import (
+    Brewery,
+    Drink,
+    Package,
+    PackageItem,
+    Product,
+    ProductLike,
+)
+from apps.products.services import (
+    AutocompleteService,
+    CatalogImportService,
+    CatalogPublishService,
+    CatalogSnapshotService,
+    CatalogVersionService,
+    LikeService,
+    PackageCompositionService,
+    ProductBulkUpdateService,
+    ProductDetailCacheService,
+    ProductService,
+    RecommendationService,
+    SearchFacetService,
+    SearchIndexService,
+    SearchService,
+    SearchTermService,
+    SectionSnapshotService,
+    TasteMatchService,
+)
+from apps.products.services.catalog_snapshot_service import (
+    FLAG_HAS_TASTE,
+    FLAG_IS_PACKAGE,
+)
 
 from .test_helpers import TestDataCreator
 
@@ -18,6 +57,8 @@ class BaseServiceTestCase(TestCase):
     """서비스 테스트 기본 클래스"""
 
     def setUp(self):
+        # 이전 테스트에서 남은 Redis 캐시 정리 (캐시 무효화는 커밋 후 실행되므로 테스트 트랜잭션 안에서는 실행되지 않음)
+        cache.clear()
         self.test_data = TestDataCreator.create_full_dataset()
         self.individual_products = self.test_data["individual_products"]
         self.package_products = self.test_data["package_products"]
@@ -39,10 +80,112 @@ class ProductServiceTest(BaseServiceTestCase):
         # Service 메서드 호출
         result_product = ProductService.get_product_detail(str(product.pk))
 
-        # 조회수 증가 확인
+        # 조회수 증가 확인 (DB 반영 전 증가분 포함)
         self.assertEqual(result_product.view_count, initial_view_count + 1)
 
-        # DB에서도 확인
+        # DB 반영 후 확인
+        ProductService.VIEW_COUNTER.flush()
+        product.refresh_from_db()
+        self.assertEqual(product.view_count, initial_view_count + 1)
+
+    def test_view_counter_flushes_in_batch(self):
+        """조회수는 Redis에 누적되고 flush 시 한 번의 UPDATE로 반영"""
+        first, second = self.individual_products[0], self.individual_products[1]
+        ProductService.VIEW_COUNTER.flush()
+
+        for _ in range(3):
+            ProductService.increment_view_count(first.pk)
+        ProductService.increment_view_count(second.pk)
+
+        # 반영 전: DB는 그대로, 증가분은 Redis에서 조회
+        first.refresh_from_db()
+        self.assertEqual(first.view_count, 0)
+        self.assertEqual(
+            ProductService.VIEW_COUNTER.pending([first.pk, second.pk]), {str(first.pk): 3, str(second.pk): 1}
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            flushed = ProductService.VIEW_COUNTER.flush()
+        self.assertEqual(flushed, 2)
+        self.assertEqual(len([query for query in queries if query["sql"].startswith("UPDATE")]), 1)
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.view_count, 3)
+        self.assertEqual(second.view_count, 1)
+        self.assertEqual(ProductService.VIEW_COUNTER.pending([first.pk, second.pk]), {})
+
+    def test_view_counter_reapplies_interrupted_flush_once(self):
+        """반영 도중 중단되어 남은 flushing 키는 다음 반영에서 한 번만 반영"""
+        counter = ProductService.VIEW_COUNTER
+        product = self.individual_products[0]
+        counter.flush()
+        product.refresh_from_db()
+        initial_view_count = product.view_count
+
+        ProductService.increment_view_count(product.pk)
+        ProductService.increment_view_count(product.pk)
+
+        # DB 반영 중 프로세스 종료 재현 (flushing 키만 남음)
+        with patch.object(counter, "_apply", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                counter.flush()
+        self.assertEqual(counter.pending([product.pk]), {str(product.pk): 2})
+
+        self.assertEqual(counter.flush(), 1)
+        self.assertEqual(counter.flush(), 0)
+
+        product.refresh_from_db()
+        self.assertEqual(product.view_count, initial_view_count + 2)
+        self.assertEqual(counter.pending([product.pk]), {})
+
+    def test_view_counter_flushes_under_lock(self):
+        """다른 반영이 잠금을 가진 동안은 반영하지 않고, 반영 중 잠금을 잃으면 롤백"""
+        counter = ProductService.VIEW_COUNTER
+        redis = counter._redis()
+        product = self.individual_products[0]
+        counter.flush()
+        product.refresh_from_db()
+        initial_view_count = product.view_count
+
+        for _ in range(3):
+            ProductService.increment_view_count(product.pk)
+
+        apply = counter._apply
+
+        def apply_and_lose_lock(items):
+            # 반영 도중 잠금이 만료되어 다른 반영이 잠금을 가져감
+            apply(items)
+            redis.set(counter.flush_lock_key, "other")
+
+        with patch.object(counter, "_apply", side_effect=apply_and_lose_lock):
+            self.assertEqual(counter.flush(), 0)
+        self.assertEqual(counter.flush(), 0)
+
+        product.refresh_from_db()
+        self.assertEqual(product.view_count, initial_view_count)
+        self.assertEqual(counter.pending([product.pk]), {str(product.pk): 3})
+
+        redis.delete(counter.flush_lock_key)
+        self.assertEqual(counter.flush(), 1)
+        product.refresh_from_db()
+        self.assertEqual(product.view_count, initial_view_count + 3)
+
+    def test_view_counter_falls_back_to_db_without_redis(self):
+        """Redis 장애 시 조회수는 DB에 바로 반영되고 상세 조회는 정상 동작"""
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        counter = ProductService.VIEW_COUNTER
+        product = self.individual_products[0]
+        counter.flush()
+        product.refresh_from_db()
+        initial_view_count = product.view_count
+
+        with patch.object(counter, "_redis", side_effect=RedisConnectionError):
+            result = ProductService.get_product_detail(str(product.pk))
+            self.assertEqual(counter.pending([product.pk]), {})
+
+        self.assertEqual(result.pk, product.pk)
         product.refresh_from_db()
         self.assertEqual(product.view_count, initial_view_count + 1)
 
@@ -106,6 +249,11 @@ class ProductServiceTest(BaseServiceTestCase):
 class LikeServiceTest(BaseServiceTestCase):
     """LikeService 테스트"""
 
+    def setUp(self):
+        super().setUp()
+        # 이전 테스트 실행에서 남은 사용자 좋아요 집합 정리 (사용자 ID 재사용 대비)
+        LikeService.reconcile()
+
     def test_toggle_product_like_add(self):
         """좋아요 추가 테스트"""
         product = self.individual_products[0]
@@ -157,10 +305,191 @@ class LikeServiceTest(BaseServiceTestCase):
         # 좋아요 하지 않은 상태
         self.assertFalse(LikeService.check_user_liked_product(self.user, str(product.pk)))
 
-        # 좋아요 추가 후
-        ProductLike.objects.create(user=self.user, product=product)
+        # 좋아요 추가 후 (집합은 커밋 후 갱신)
+        with self.captureOnCommitCallbacks(execute=True):
+            ProductLike.objects.create(user=self.user, product=product)
         self.assertTrue(LikeService.check_user_liked_product(self.user, str(product.pk)))
 
+    def test_like_count_is_incremented_without_recount(self):
+        """좋아요 추가/삭제 시 좋아요 수를 COUNT 없이 증감"""
+        product = self.individual_products[0]
+        other_user = TestDataCreator.create_user(nickname="other", email="other@example.com")
+        LikeService.toggle_product_like(other_user, str(product.pk))
+
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            is_liked, like_count = LikeService.toggle_product_like(self.user, str(product.pk))
+        self.assertTrue(is_liked)
+        self.assertEqual(like_count, 2)
+        self.assertFalse(any("COUNT(" in query["sql"] for query in queries))
+
+        is_liked, like_count = LikeService.toggle_product_like(self.user, str(product.pk))
+        self.assertFalse(is_liked)
+        self.assertEqual(like_count, 1)
+
+    def test_unlike_applied_once_when_row_already_deleted(self):
+        """다른 요청이 이미 삭제한 좋아요를 다시 취소해도 좋아요 수를 줄이지 않음"""
+        product = self.individual_products[0]
+        other_user = TestDataCreator.create_user(nickname="other", email="other@example.com")
+        with self.captureOnCommitCallbacks(execute=True):
+            LikeService.toggle_product_like(other_user, str(product.pk))
+            LikeService.toggle_product_like(self.user, str(product.pk))
+
+        # 동시 취소 요청이 먼저 행을 삭제한 상태 (집합은 아직 좋아요로 남음)
+        ProductLike.objects.filter(user=self.user, product=product).delete()
+        like_count = Product.objects.get(pk=product.pk).like_count
+        LikeService.add_to_user_likes(self.user.pk, product.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            is_liked, result_count = LikeService.toggle_product_like(self.user, str(product.pk))
+
+        self.assertFalse(is_liked)
+        self.assertEqual(result_count, like_count)
+        self.assertFalse(LikeService.check_user_liked_product(self.user, str(product.pk)))
+
+    def test_like_side_effects_wait_for_commit(self):
+        """좋아요 집합은 커밋 후에만 갱신 (롤백 시 그대로)"""
+        product = self.individual_products[0]
+        self.assertFalse(LikeService.check_user_liked_product(self.user, str(product.pk)))
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            LikeService.toggle_product_like(self.user, str(product.pk))
+        self.assertFalse(LikeService.check_user_liked_product(self.user, str(product.pk)))
+
+        for callback in callbacks:
+            callback()
+        self.assertTrue(LikeService.check_user_liked_product(self.user, str(product.pk)))
+
+    def test_like_and_catalog_writes_survive_detail_cache_outage(self):
+        """상세 캐시(Redis) 장애 시에도 좋아요/술 저장은 성공 (캐시 갱신 실패는 로그만 남김)"""
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        product = self.individual_products[0]
+        with patch.object(ProductDetailCacheService, "_redis", side_effect=RedisConnectionError):
+            with self.captureOnCommitCallbacks(execute=True):
+                _, like_count = LikeService.toggle_product_like(self.user, str(product.pk))
+                drink = product.drink
+                drink.name = "장애 중 변경"
+                drink.save()
+            LikeService.update_product_like_count(str(product.pk))
+            ProductDetailCacheService.invalidate_all()
+
+        self.assertEqual(like_count, 1)
+        self.assertEqual(Product.objects.get(pk=product.pk).like_count, 1)
+
+    def test_user_liked_products_from_redis_set(self):
+        """좋아요한 상품 목록/여부를 Redis 집합으로 조회"""
+        liked, not_liked = self.individual_products[0], self.individual_products[1]
+        with self.captureOnCommitCallbacks(execute=True):
+            LikeService.toggle_product_like(self.user, str(liked.pk))
+
+        self.assertEqual(LikeService.get_user_liked_product_ids(self.user), {str(liked.pk)})
+        self.assertEqual(list(LikeService.get_user_liked_products(self.user)), [liked])
+
+        with self.assertNumQueries(0):
+            self.assertTrue(LikeService.check_user_liked_product(self.user, str(liked.pk)))
+            self.assertFalse(LikeService.check_user_liked_product(self.user, str(not_liked.pk)))
+
+    def test_like_set_not_created_by_change_when_missing(self):
+        """집합이 없을 때의 변경 반영은 집합을 만들지 않음 (다음 조회 때 DB에서 전체 적재)"""
+        liked, other = self.individual_products[0], self.individual_products[1]
+        ProductLike.objects.create(user=self.user, product=other)
+        redis = LikeService._redis()
+        redis.delete(LikeService.get_user_likes_key(self.user.pk))
+
+        LikeService.add_to_user_likes(self.user.pk, liked.pk)
+        self.assertFalse(redis.exists(LikeService.get_user_likes_key(self.user.pk)))
+
+        self.assertEqual(LikeService.get_user_liked_product_ids(self.user), {str(other.pk)})
+        self.assertGreater(redis.ttl(LikeService.get_user_likes_key(self.user.pk)), 0)
+
+    def test_like_set_not_stored_when_changed_during_load(self):
+        """DB 적재 중 좋아요 변경이 커밋되면 읽은 집합을 저장하지 않음"""
+        product = self.individual_products[0]
+        redis = LikeService._redis()
+        load = LikeService._get_db_liked_product_ids
+
+        def load_then_like(user_id, product_ids=None):
+            result = load(user_id, product_ids)
+            # 적재 중 다른 요청의 좋아요가 커밋됨
+            ProductLike.objects.create(user=self.user, product=product)
+            LikeService.add_to_user_likes(self.user.pk, product.pk)
+            return result
+
+        with patch.object(LikeService, "_get_db_liked_product_ids", side_effect=load_then_like):
+            self.assertFalse(LikeService.check_user_liked_product(self.user, str(product.pk)))
+        self.assertFalse(redis.exists(LikeService.get_user_likes_key(self.user.pk)))
+
+        self.assertTrue(LikeService.check_user_liked_product(self.user, str(product.pk)))
+
+    def test_like_state_falls_back_to_db_without_redis(self):
+        """Redis 장애 시 좋아요 여부는 ProductLike 조회로 응답"""
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        liked, not_liked = self.individual_products[0], self.individual_products[1]
+        ProductLike.objects.create(user=self.user, product=liked)
+
+        with patch.object(LikeService, "_redis", side_effect=RedisConnectionError):
+            products = LikeService.attach_like_state([{"id": str(liked.pk)}, {"id": str(not_liked.pk)}], self.user)
+            self.assertTrue(LikeService.check_user_liked_product(self.user, str(liked.pk)))
+            self.assertEqual(LikeService.get_user_liked_product_ids(self.user), {str(liked.pk)})
+
+        self.assertEqual([product["is_liked"] for product in products], [True, False])
+
+    def test_reconcile_restores_like_count_and_user_set(self):
+        """보정 시 ProductLike 기준으로 좋아요 수와 집합 복구"""
+        product = self.individual_products[0]
+        LikeService.toggle_product_like(self.user, str(product.pk))
+
+        # DB/Redis가 어긋난 상태 만들기
+        Product.objects.filter(pk=product.pk).update(like_count=42)
+        LikeService.remove_from_user_likes(self.user.pk, product.pk)
+        self.assertFalse(LikeService.check_user_liked_product(self.user, str(product.pk)))
+
+        LikeService.reconcile([product.pk])
+
+        product.refresh_from_db()
+        self.assertEqual(product.like_count, 1)
+        self.assertTrue(LikeService.check_user_liked_product(self.user, str(product.pk)))
+
+
+class ProductDetailCacheServiceTest(BaseServiceTestCase):
+    """ProductDetailCacheService 테스트"""
+
+    def test_set_skipped_when_invalidated_during_load(self):
+        """조회 전 세대 값 이후 무효화(상품/태그/전체)가 있으면 옛 데이터를 저장하지 않음"""
+        product = self.individual_products[0]
+        data = {"id": str(product.pk), "drink": None, "package": None}
+
+        for invalidate in [
+            lambda: ProductDetailCacheService.invalidate(product.pk),
+            lambda: ProductDetailCacheService.purge([f"drink:{product.drink_id}"]),
+            ProductDetailCacheService.invalidate_all,
+            lambda: ProductDetailCacheService.add_counter_deltas("like_count", {str(product.pk): 1}),
+        ]:
+            generation = ProductDetailCacheService.get_generation(product.pk)
+            invalidate()
+            self.assertFalse(ProductDetailCacheService.set(product, data, generation))
+            self.assertIsNone(ProductDetailCacheService.get(product.pk))
+
+        generation = ProductDetailCacheService.get_generation(product.pk)
+        self.assertTrue(ProductDetailCacheService.set(product, data, generation))
+        self.assertEqual(ProductDetailCacheService.get(product.pk)[0]["id"], str(product.pk))
+
+    def test_invalidation_runs_after_commit(self):
+        """상품 변경 시 상세 캐시는 커밋 후 삭제"""
+        product = self.individual_products[0]
+        data = {"id": str(product.pk), "drink": None, "package": None}
+        ProductDetailCacheService.set(product, data, ProductDetailCacheService.get_generation(product.pk))
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            product.price += 1000
+            product.save()
+        self.assertIsNotNone(ProductDetailCacheService.get(product.pk))
+
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(ProductDetailCacheService.get(product.pk))
+
 
 class SearchServiceTest(BaseServiceTestCase):
     """SearchService 테스트"""
@@ -242,3 +571,738 @@ class SearchServiceTest(BaseServiceTestCase):
 
         self.assertEqual(applied_filters["sweetness"], 3.0)
         self.assertTrue(applied_filters["premium"])
+
+
+class SearchIndexServiceTest(BaseServiceTestCase):
+    """SearchIndexService 테스트"""
+
+    def test_normalize_composes_hangul_jamo(self):
+        """분리된 한글 자모(NFD)가 완성형으로 정규화되는지 테스트"""
+        import unicodedata
+
+        decomposed = unicodedata.normalize("NFD", "막걸리  SET")
+
+        self.assertEqual(SearchIndexService.normalize(decomposed), "막걸리 set")
+
+    def test_search_document_contains_brewery_and_alcohol_type(self):
+        """개별 상품 검색 문서에 상품명/양조장/주종이 포함되는지 테스트"""
+        product = self.individual_products[0]
+        product.refresh_from_db()
+
+        self.assertTrue(product.search_document.startswith("우리쌀막걸리"))
+        self.assertIn("우리술양조장", product.search_document)
+        self.assertIn("막걸리", product.search_document)
+
+    def test_search_document_refreshed_on_brewery_rename(self):
+        """양조장 이름 변경 시 관련 상품 검색 문서 갱신 테스트"""
+        product = self.individual_products[0]
+        brewery = product.drink.brewery
+        brewery.name = "새이름양조장"
+        brewery.save()
+
+        product.refresh_from_db()
+        self.assertIn("새이름양조장", product.search_document)
+
+    def test_apply_search_ranks_name_match_first(self):
+        """이름이 검색어로 시작하는 상품이 먼저 오는지 테스트"""
+        queryset = SearchIndexService.apply_search(Product.objects.filter(status="ACTIVE"), ["우리쌀막걸리"])
+        results = list(queryset.order_by("-search_rank"))
+
+        self.assertGreater(len(results), 0)
+        self.assertEqual(results[0].name, "우리쌀막걸리")
+
+    def test_apply_search_short_term_uses_grams(self):
+        """트라이그램 길이 미만 검색어는 조각 배열로 찾고 부분 일치 결과와 같은지 테스트"""
+        product = self.individual_products[0]
+        product.refresh_from_db()
+        self.assertIn("막걸", product.search_grams)
+        self.assertEqual(product.search_grams, SearchIndexService.extract_grams(product.search_document))
+
+        active = Product.objects.filter(status="ACTIVE")
+        for term in ["막걸", "주", "양조"]:
+            queryset = SearchIndexService.apply_search(active, [term])
+            self.assertIn("search_grams", str(queryset.query))
+            self.assertEqual(
+                set(queryset.values_list("pk", flat=True)),
+                set(active.filter(search_document__contains=term).values_list("pk", flat=True)),
+            )
+
+
+class AutocompleteServiceTest(BaseServiceTestCase):
+    """AutocompleteService 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        AutocompleteService.rebuild()
+
+    def _names(self, query):
+        return [entry["name"] for entry in AutocompleteService.suggest(query)]
+
+    def test_suggest_syllable_and_chosung(self):
+        """입력 중인 음절/초성/이름 중간 입력으로 검색되는지 테스트"""
+        for query in ["우리쌀", "막거", "막ㄱ", "ㅁㄱㄹ", "ㅇㄹㅆ"]:
+            self.assertIn("우리쌀막걸리", self._names(query), query)
+
+        # 이름 앞부분 일치가 먼저
+        self.assertEqual(self._names("우리")[0], "우리쌀막걸리")
+
+    def test_rename_applied_from_changelog(self):
+        """이름 변경이 변경 로그로 색인에 반영되는지 테스트 (전체 재생성 없음)"""
+        drink = Drink.objects.get(name="우리쌀막걸리")
+        drink.name = "달빛유자막걸리"
+        with self.captureOnCommitCallbacks(execute=True):
+            drink.save(update_fields=["name"])
+
+        with patch.object(AutocompleteService, "load_entries") as load_entries:
+            AutocompleteService.sync(force=True)
+            load_entries.assert_not_called()
+
+        self.assertIn("달빛유자막걸리", self._names("ㄷㅂㅇㅈ"))
+        self.assertNotIn("우리쌀막걸리", self._names("우리쌀"))
+
+    def test_rolled_back_rename_not_recorded(self):
+        """롤백된 이름 변경은 변경 로그에 기록하지 않음"""
+        drink = Drink.objects.get(name="우리쌀막걸리")
+        drink.name = "롤백된막걸리"
+        with self.captureOnCommitCallbacks(execute=False):
+            drink.save(update_fields=["name"])
+
+        AutocompleteService.sync(force=True)
+        self.assertEqual(self._names("롤백"), [])
+
+    def test_sync_stops_at_missing_seq(self):
+        """순번이 빠진 변경 이후는 반영하지 않고 다음 동기화에서 다시 조회"""
+        AutocompleteService._write_changes([("drink", 0, "먼저온막걸리")])
+        index = AutocompleteService.sync(force=True)
+        self.assertIn("먼저온막걸리", self._names("먼저온"))
+        redis = AutocompleteService._redis()
+        applied_seq = index.applied_seq
+        change = {"seq": applied_seq + 2, "type": "drink", "id": 0, "name": "나중에온막걸리"}
+        redis.zadd(AutocompleteService.CHANGELOG_KEY, {json.dumps(change, ensure_ascii=False): applied_seq + 2})
+
+        self.assertEqual(AutocompleteService.sync(force=True).applied_seq, applied_seq)
+        self.assertEqual(self._names("나중에온"), [])
+
+    def test_suggest_without_index_does_not_query(self):
+        """색인이 아직 없으면 DB 조회 없이 빈 결과를 주고 백그라운드 생성을 시작"""
+        with (
+            patch.object(AutocompleteService, "_index", None),
+            patch.object(AutocompleteService, "rebuild_in_background") as rebuild_in_background,
+            self.assertNumQueries(0),
+        ):
+            self.assertEqual(AutocompleteService.suggest("막거"), [])
+        rebuild_in_background.assert_called_once()
+
+
+class PackageCompositionServiceTest(BaseServiceTestCase):
+    """PackageCompositionService 테스트"""
+
+    def test_composition_summary(self):
+        """패키지 구성 요약(주종/개수/도수 범위/맛 평균/편차) 계산 테스트"""
+        package = Package.objects.get(name="전통주 입문세트")
+
+        self.assertEqual(package.alcohol_types, ["CHEONGJU", "MAKGEOLLI"])
+        self.assertEqual(package.drink_count, 2)
+        self.assertEqual(package.min_abv, Decimal("6.50"))
+        self.assertEqual(package.max_abv, Decimal("15.00"))
+        self.assertEqual(package.sweetness_level, Decimal("3.35"))
+        # 맛 차원별 표준편차 (0.85, 0.35, 0.6, 1.25, 0.4, 0.35)의 평균
+        self.assertEqual(package.taste_spread, Decimal("0.63"))
+
+    def test_composition_refreshed_on_item_and_drink_change(self):
+        """구성 술 추가/삭제 및 술 주종 변경 시 요약이 갱신되는지 테스트"""
+        package = Package.objects.get(name="전통주 입문세트")
+        soju = Drink.objects.get(name="한옥증류소주")
+
+        PackageItem.objects.create(package=package, drink=soju)
+        package.refresh_from_db()
+        self.assertEqual(package.alcohol_types, ["CHEONGJU", "MAKGEOLLI", "SOJU"])
+        self.assertEqual(package.max_abv, Decimal("25.00"))
+
+        soju.alcohol_type = Drink.AlcoholType.YAKJU
+        soju.save(update_fields=["alcohol_type"])
+        package.refresh_from_db()
+        self.assertIn("YAKJU", package.alcohol_types)
+
+        PackageItem.objects.filter(package=package).delete()
+        package.refresh_from_db()
+        self.assertEqual(package.alcohol_types, [])
+        self.assertEqual(package.drink_count, 0)
+        self.assertIsNone(package.sweetness_level)
+
+    def test_package_products_by_alcohol_type_without_join(self):
+        """주종별 패키지 조회가 구성 술 JOIN/DISTINCT 없이 처리되는지 테스트"""
+        with CaptureQueriesContext(connection) as context:
+            products = list(ProductService.get_package_products_by_alcohol_type("MAKGEOLLI"))
+
+        self.assertEqual([product.package.name for product in products], ["전통주 입문세트"])
+        sql = context.captured_queries[0]["sql"]
+        self.assertNotIn("package_items", sql)
+        self.assertNotIn("DISTINCT", sql)
+        self.assertEqual(PackageCompositionService.refresh_all(), 0)
+
+
+class CatalogImportServiceTest(BaseServiceTestCase):
+    """CatalogImportService 테스트"""
+
+    def _row(self, name, **overrides):
+        row = {
+            "type": "individual",
+            "name": name,
+            "brewery": "달빛양조장",
+            "brewery_region": "강원",
+            "ingredients": "쌀, 누룩",
+            "alcohol_type": "MAKGEOLLI",
+            "abv": "7.0",
+            "volume_ml": 750,
+            "sweetness_level": "3.5",
+            "price": 12000,
+            "description": "달빛 아래 빚은 막걸리",
+            "description_image_url": "https://cdn.example.com/desc.jpg",
+            "images": [f"https://cdn.example.com/{name}-1.jpg", f"https://cdn.example.com/{name}-2.jpg"],
+        }
+        row.update(overrides)
+        return json.dumps(row, ensure_ascii=False)
+
+    def test_import_jsonl(self):
+        """개별/패키지 상품 일괄 등록 및 행별 오류 보고 테스트"""
+        lines = [
+            self._row("달빛막걸리"),
+            self._row("달빛청주", alcohol_type="CHEONGJU", abv="15.0"),
+            self._row("우리쌀막걸리", brewery="우리술양조장"),  # 기존 술과 중복
+            self._row("달빛막걸리"),  # 파일 안에서 중복
+            self._row("도수오류", abv="150"),
+            "{not json",
+            self._row(
+                "달빛 페어링 세트",
+                type="package",
+                drinks=["달빛양조장/달빛막걸리", "우리술양조장/우리쌀막걸리"],
+            ),
+            self._row("없는 술 세트", type="package", drinks=["달빛양조장/달빛소주", "우리술양조장/우리쌀막걸리"]),
+        ]
+
+        result = CatalogImportService.import_file(lines, "jsonl")
+
+        self.assertEqual(result["total_rows"], 8)
+        self.assertEqual(result["created"], {"breweries": 1, "drinks": 2, "packages": 1, "products": 3, "images": 6})
+        self.assertEqual([error["row"] for error in result["errors"]], [3, 4, 5, 6, 8])
+        self.assertIn("abv", result["errors"][2]["errors"])
+
+        # 검색 문서/메인 이미지 URL은 개별 저장 시와 같은 값으로 저장
+        product = Product.objects.select_related("drink__brewery").get(drink__name="달빛막걸리")
+        self.assertEqual(product.search_document, SearchIndexService.build_document(product))
+        self.assertEqual(product.main_image_url, "https://cdn.example.com/달빛막걸리-1.jpg")
+        self.assertEqual(product.images.filter(is_main=True).count(), 1)
+        self.assertEqual(Brewery.objects.get(name="달빛양조장").region, "강원")
+
+        package_product = Product.objects.get(package__name="달빛 페어링 세트")
+        self.assertEqual(
+            set(package_product.search_document.split()),
+            set(SearchIndexService.build_document(package_product).split()),
+        )
+        self.assertEqual(package_product.package.alcohol_types, ["MAKGEOLLI"])
+        self.assertEqual(package_product.package.drink_count, 2)
+
+    def test_import_csv_dry_run(self):
+        """CSV 검증 모드는 오류만 보고하고 저장하지 않는지 테스트"""
+        lines = [
+            "type,name,brewery,ingredients,alcohol_type,abv,volume_ml,price,description,description_image_url,images\n",
+            "individual,달빛막걸리,달빛양조장,쌀,MAKGEOLLI,7.0,750,12000,설명,https://cdn.example.com/d.jpg,"
+            "https://cdn.example.com/1.jpg|https://cdn.example.com/2.jpg\n",
+            "individual,이미지없음,달빛양조장,쌀,MAKGEOLLI,7.0,750,12000,설명,https://cdn.example.com/d.jpg,\n",
+        ]
+        product_count = Product.objects.count()
+
+        result = CatalogImportService.import_file(lines, "csv", dry_run=True)
+
+        self.assertEqual(result["created"]["products"], 1)
+        self.assertEqual(result["created"]["images"], 2)
+        self.assertEqual([error["row"] for error in result["errors"]], [3])
+        self.assertEqual(Product.objects.count(), product_count)
+        self.assertFalse(Brewery.objects.filter(name="달빛양조장").exists())
+
+    def test_failed_chunk_reported_as_row_errors(self):
+        """롤백된 묶음은 행 오류로 보고하고 생성 수/자동완성 변경에 포함하지 않는지 테스트"""
+        save_products = CatalogImportService._save_products
+        calls = []
+
+        def fail_second_chunk(products, rows, state):
+            save_products(products, rows, state)
+            calls.append(len(products))
+            if len(calls) == 2:
+                raise IntegrityError("duplicate key")
+
+        lines = [
+            self._row("달빛막걸리"),
+            self._row("달빛청주", alcohol_type="CHEONGJU", abv="15.0"),
+            self._row("별빛막걸리", brewery="별빛양조장"),
+            self._row("달빛소주", alcohol_type="SOJU", abv="25.0"),
+            self._row("달빛약주", alcohol_type="YAKJU", abv="13.0"),
+        ]
+        with (
+            patch.object(CatalogImportService, "CHUNK_SIZE", 2),
+            patch.object(CatalogImportService, "_save_products", side_effect=fail_second_chunk),
+            patch.object(CatalogVersionService, "invalidate_all") as invalidate_all,
+        ):
+            result = CatalogImportService.import_file(lines, "jsonl")
+
+        self.assertEqual(result["created"], {"breweries": 1, "drinks": 3, "packages": 0, "products": 3, "images": 6})
+        self.assertEqual([error["row"] for error in result["errors"]], [3, 4])
+        self.assertEqual(
+            result["errors"][0]["errors"], {"non_field_errors": [CatalogImportService.CHUNK_FAILED_MESSAGE]}
+        )
+        self.assertFalse(Brewery.objects.filter(name="별빛양조장").exists())
+        self.assertTrue(Product.objects.filter(drink__name="달빛약주").exists())
+
+        changed_names = {name for _, _, name in invalidate_all.call_args.args[0]}
+        self.assertEqual(changed_names, {"달빛양조장", "달빛막걸리", "달빛청주", "달빛약주"})
+
+    def test_query_count_independent_of_rows(self):
+        """행 수와 무관하게 묶음당 쿼리 수가 일정한지 테스트"""
+
+        def count_queries(prefix, size):
+            lines = [self._row(f"{prefix}{index}") for index in range(size)]
+            lines.append(
+                self._row(f"{prefix} 세트", type="package", drinks=[f"달빛양조장/{prefix}0", f"달빛양조장/{prefix}1"])
+            )
+            with CaptureQueriesContext(connection) as context:
+                CatalogImportService.import_file(lines, "jsonl")
+            return len(context.captured_queries)
+
+        # 양조장 생성 쿼리가 첫 등록에만 포함되지 않도록 미리 생성
+        Brewery.objects.create(name="달빛양조장")
+        self.assertEqual(count_queries("소량", 3), count_queries("대량", 60))
+
+
+class ProductBulkUpdateServiceTest(BaseServiceTestCase):
+    """ProductBulkUpdateService 테스트"""
+
+    def test_mark_brewery_out_of_stock(self):
+        """양조장 상품 전체 품절 처리가 UPDATE 한 번으로 처리되고 캐시가 무효화되는지 테스트"""
+        brewery = Brewery.objects.get(name="우리술양조장")
+        expected = Product.objects.filter(drink__brewery=brewery).count()
+        version = CatalogVersionService.get_version()
+
+        with self.assertNumQueries(1):
+            result = ProductBulkUpdateService.apply({"brewery_id": brewery.pk}, {"status": "OUT_OF_STOCK"})
+
+        self.assertEqual(result, {"matched": expected, "updated": expected, "skipped": 0})
+        self.assertFalse(Product.objects.filter(drink__brewery=brewery).exclude(status="OUT_OF_STOCK").exists())
+        self.assertTrue(Product.objects.exclude(drink__brewery=brewery).filter(status="ACTIVE").exists())
+        self.assertGreater(CatalogVersionService.get_version(), version)
+
+    def test_price_and_discount_changes(self):
+        """가격 증감률/할인금액 일괄 변경 테스트 (정가보다 큰 할인은 제외)"""
+        makgeolli = Product.objects.get(drink__name="우리쌀막걸리")
+        cheongju = Product.objects.get(drink__name="프리미엄청주")
+        package_product = Product.objects.get(package__name="전통주 입문세트")
+        package_price = package_product.price
+
+        # 개별 막걸리 1개 + 막걸리가 포함된 패키지 1개
+        result = ProductBulkUpdateService.apply({"alcohol_type": "MAKGEOLLI"}, {"price_change_percent": -10})
+        self.assertEqual(result["updated"], 2)
+        makgeolli.refresh_from_db()
+        package_product.refresh_from_db()
+        self.assertEqual(makgeolli.price, 13500)
+        self.assertEqual(package_product.price, (package_price * 90 + 50) // 100)
+
+        result = ProductBulkUpdateService.apply(
+            {"ids": [makgeolli.pk, cheongju.pk]}, {"discount": 5000, "flags": {"is_premium": True}}
+        )
+        self.assertEqual(result, {"matched": 2, "updated": 1, "skipped": 1})
+        makgeolli.refresh_from_db()
+        cheongju.refresh_from_db()
+        self.assertEqual(makgeolli.discount, 5000)
+        self.assertTrue(makgeolli.is_premium)
+        self.assertIsNone(cheongju.discount)
+
+
+class CatalogSnapshotServiceTest(BaseServiceTestCase):
+    """CatalogSnapshotService 테스트"""
+
+    def test_snapshot_columns(self):
+        """활성 상품의 ID/맛 벡터/특성이 스냅샷 컬럼에 기록되는지 테스트"""
+        snapshot = CatalogSnapshotService.get_snapshot()
+        active = Product.objects.filter(status=Product.Status.ACTIVE)
+        self.assertEqual(len(snapshot), active.count())
+
+        positions = {product_id: position for position, product_id in enumerate(snapshot.product_ids)}
+        for product in active.select_related("drink", "package"):
+            position = positions[str(product.pk)]
+            target = product.drink or product.package
+            self.assertAlmostEqual(float(snapshot.taste[position][0]), float(target.sweetness_level or 0), places=5)
+            self.assertEqual(bool(snapshot.flags[position] & FLAG_IS_PACKAGE), product.package_id is not None)
+            self.assertEqual(
+                bool(snapshot.flags[position] & FLAG_HAS_TASTE), product.drink_id is not None or target.drink_count > 0
+            )
+
+        # 배열은 파일 매핑 위의 읽기 전용 뷰
+        self.assertFalse(snapshot.taste.flags.writeable)
+
+    def test_snapshot_swapped_on_catalog_change(self):
+        """상품 변경 시 새 파일이 생성될 때까지 이전 스냅샷을 사용하고, 카운터만 변경되면 유지되는지 테스트"""
+        snapshot = CatalogSnapshotService.get_snapshot()
+        product = self.individual_products[0]
+
+        product.review_count += 1
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save(update_fields=["review_count"])
+        self.assertIs(CatalogSnapshotService.get_snapshot(), snapshot)
+
+        product.status = Product.Status.INACTIVE
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save()
+
+        # 요청 중에는 생성하지 않고 이전 스냅샷 사용 (생성은 백그라운드)
+        with (
+            patch.object(CatalogSnapshotService, "build_in_background") as build_in_background,
+            self.assertNumQueries(0),
+        ):
+            self.assertIs(CatalogSnapshotService.get_snapshot(), snapshot)
+        build_in_background.assert_called_once_with()
+
+        CatalogSnapshotService.build_latest()
+        updated = CatalogSnapshotService.get_snapshot()
+
+        self.assertGreater(updated.version, snapshot.version)
+        self.assertNotIn(str(product.pk), list(updated.product_ids))
+        self.assertEqual(len(updated), len(snapshot) - 1)
+
+
+class CatalogPublishServiceTest(BaseServiceTestCase):
+    """CatalogPublishService 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        static_root = tempfile.TemporaryDirectory()
+        self.addCleanup(static_root.cleanup)
+        settings_override = override_settings(STATIC_ROOT=static_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def read_shards(self, manifest):
+        root = CatalogPublishService.get_root()
+        cards = []
+        for shard in manifest["shards"]:
+            content = (root / shard["path"]).read_bytes()
+            # 사전 압축본은 원본과 같은 내용
+            self.assertEqual(gzip.decompress((root / f"{shard['path']}.gz").read_bytes()), content)
+            self.assertEqual(brotli.decompress((root / f"{shard['path']}.br").read_bytes()), content)
+            cards.extend(json.loads(content)["products"])
+        return cards
+
+    @patch.object(CatalogPublishService, "SHARD_SIZE", 2)
+    def test_publish_shards_and_manifest(self):
+        """활성 상품이 묶음 파일로 나뉘어 기록되고 manifest가 가리키는지 테스트"""
+        result = CatalogPublishService.publish()
+        manifest = CatalogPublishService.read_manifest()
+
+        active_ids = {
+            str(pk) for pk in Product.objects.filter(status=Product.Status.ACTIVE).values_list("pk", flat=True)
+        }
+        cards = self.read_shards(manifest)
+
+        self.assertTrue(result["published"])
+        self.assertEqual(manifest["version"], result["version"])
+        self.assertEqual(manifest["product_count"], len(active_ids))
+        self.assertEqual(len(manifest["shards"]), (len(active_ids) + 1) // 2)
+        self.assertEqual({card["id"] for card in cards}, active_ids)
+        # 사용자별 값은 포함하지 않음
+        self.assertNotIn("is_liked", cards[0])
+
+    def test_publish_skipped_until_catalog_changes(self):
+        """카탈로그 변경이 없으면 건너뛰고, 변경 시 새 버전으로 manifest가 교체되는지 테스트"""
+        first = CatalogPublishService.publish()
+
+        self.assertFalse(CatalogPublishService.publish()["published"])
+
+        product = self.individual_products[0]
+        product.status = Product.Status.INACTIVE
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save()
+        second = CatalogPublishService.publish()
+        manifest = CatalogPublishService.read_manifest()
+
+        self.assertTrue(second["published"])
+        self.assertNotEqual(second["version"], first["version"])
+        self.assertEqual(manifest["version"], second["version"])
+        self.assertNotIn(str(product.pk), {card["id"] for card in self.read_shards(manifest)})
+        # 이전 버전 묶음은 보관
+        self.assertTrue((CatalogPublishService.get_root() / first["version"]).is_dir())
+
+
+class TasteMatchServiceTest(BaseServiceTestCase):
+    """TasteMatchService 테스트"""
+
+    def test_find_closest_orders_by_distance(self):
+        """목표 맛 프로필과 가까운 순으로 반환되는지 테스트"""
+        target = self.individual_products[0].drink
+        targets = {"sweetness": float(target.sweetness_level), "body": float(target.body_level)}
+
+        product_ids = TasteMatchService.find_closest(targets)
+
+        self.assertEqual(product_ids[0], str(self.individual_products[0].pk))
+        self.assertNotIn(str(self.package_products[0].pk), product_ids)
+
+    def test_index_rebuilt_after_taste_change(self):
+        """술 맛 프로필 변경 시 인덱스가 재생성되는지 테스트"""
+        drink = self.individual_products[1].drink
+        TasteMatchService.find_closest({"sweetness": 0.0})
+
+        drink.sweetness_level = Decimal("0.0")
+        drink.acidity_level = Decimal("0.0")
+        with self.captureOnCommitCallbacks(execute=True):
+            drink.save()
+        # 백그라운드 생성 대신 직접 생성 (테스트 트랜잭션 밖의 스레드에서는 테스트 데이터가 보이지 않음)
+        CatalogSnapshotService.build_latest()
+
+        product_ids = TasteMatchService.find_closest({"sweetness": 0.0, "acidity": 0.0}, limit=1)
+        self.assertEqual(product_ids, [str(self.individual_products[1].pk)])
+
+    def test_package_taste_filter_with_spread_penalty(self):
+        """패키지 상품이 구성 술 맛 평균으로 필터링되고, 편차만큼 허용 범위가 좁아지는지 테스트"""
+        starter = Package.objects.get(name="전통주 입문세트")
+        collection = Package.objects.get(name="프리미엄 컬렉션")
+
+        # 입문세트 단맛 평균 3.35 (편차 0.63 → 허용 범위 ±0.185)
+        queryset = SearchService.get_search_queryset(QueryDict("sweetness=3.35"))
+        self.assertTrue(queryset.filter(package=starter).exists())
+
+        # 컬렉션 단맛 평균 2.67과 0.3 차이 - 개별 술이라면 포함되지만 편차(0.58)로 제외
+        queryset = SearchService.get_search_queryset(QueryDict("sweetness=2.97"))
+        self.assertFalse(queryset.filter(package=collection).exists())
+        self.assertTrue(queryset.filter(drink__name="프리미엄청주").exists())
+
+    def test_closest_mode_includes_packages(self):
+        """match=closest 검색에 패키지 상품이 포함되는지 테스트"""
+        package = Package.objects.get(name="전통주 입문세트")
+        query_params = QueryDict(f"sweetness={package.sweetness_level}&body={package.body_level}&match=closest")
+
+        product_ids = [str(product.pk) for product in SearchService.get_search_queryset(query_params)]
+
+        self.assertIn(str(package.product.pk), product_ids)
+
+    def test_closest_mode_annotates_taste_rank(self):
+        """match=closest 검색 시 taste_rank 순위가 부여되는지 테스트"""
+        query_params = QueryDict("sweetness=3.0&acidity=2.5&match=closest")
+
+        queryset = SearchService.get_search_queryset(query_params).order_by("taste_rank")
+        ranks = [product.taste_rank for product in queryset]
+
+        self.assertGreater(len(ranks), 0)
+        self.assertEqual(ranks, sorted(ranks))
+
+
+class RecommendationServiceTest(BaseServiceTestCase):
+    """RecommendationService 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        from apps.users.models import PreferTasteProfile
+
+        self.profile = PreferTasteProfile.objects.create(user=self.user)
+
+    def _match_profile_to(self, drink):
+        for dimension in ["sweetness", "acidity", "body", "carbonation", "bitterness", "aroma"]:
+            setattr(self.profile, f"{dimension}_level", getattr(drink, f"{dimension}_level"))
+        self.profile.save()
+
+    def test_recommendations_cached_per_user(self):
+        """추천 목록이 사용자별로 캐시되는지 테스트"""
+        product_ids = RecommendationService.get_recommended_product_ids(self.user)
+
+        cached = cache.get(RecommendationService.get_cache_key(self.user.pk))
+        self.assertEqual(cached["product_ids"], product_ids)
+
+    def test_cache_invalidated_on_profile_update(self):
+        """취향 프로필 갱신 시 추천 목록이 다시 계산되는지 테스트"""
+        self._match_profile_to(self.individual_products[0].drink)
+        first = RecommendationService.get_recommended_product_ids(self.user)
+        self.assertEqual(first[0], str(self.individual_products[0].pk))
+
+        self._match_profile_to(self.individual_products[1].drink)
+        second = RecommendationService.get_recommended_product_ids(self.user)
+        self.assertEqual(second[0], str(self.individual_products[1].pk))
+
+    def test_ordered_products_removed_after_order(self):
+        """장바구니 주문 후 주문한 상품이 추천 목록에서 빠지는지 테스트"""
+        from datetime import date
+
+        from apps.cart.models import CartItem
+        from apps.orders.services import OrderService
+        from apps.stores.models import Store
+
+        product = self.individual_products[0]
+        self._match_profile_to(product.drink)
+        self.assertEqual(RecommendationService.get_recommended_product_ids(self.user)[0], str(product.pk))
+
+        store = Store.objects.create(name="Store 1", address="Address 1")
+        CartItem.objects.create(
+            user=self.user, product=product, quantity=1, pickup_store=store, pickup_date=date.today()
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            OrderService.create_order_from_cart(self.user)
+
+        self.assertNotIn(str(product.pk), RecommendationService.get_recommended_product_ids(self.user))
+
+    def test_includes_package_products(self):
+        """패키지 상품도 추천 대상에 포함되는지 테스트"""
+        product_ids = RecommendationService.get_recommended_product_ids(self.user)
+
+        self.assertIn(str(self.package_products[0].pk), product_ids)
+
+
+class SectionSnapshotServiceTest(BaseServiceTestCase):
+    """SectionSnapshotService 테스트"""
+
+    def test_snapshot_served_without_queries(self):
+        """스냅샷이 있으면 SQL 없이 응답하는지 테스트"""
+        SectionSnapshotService.build_snapshot("recommended")
+
+        with self.assertNumQueries(0):
+            products = SectionSnapshotService.get_products("recommended")
+
+        self.assertLessEqual(len(products), SectionSnapshotService.SECTION_LIMITS["recommended"])
+
+    def test_snapshot_invalidated_on_product_change(self):
+        """상품 변경 시 스냅샷이 갱신되는지 테스트"""
+        product = self.individual_products[0]
+        SectionSnapshotService.build_snapshot("monthly")
+
+        product.view_count = 10_000
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save()
+
+            # 커밋 전에는 이전 스냅샷을 그대로 응답 (재생성 없음)
+            with self.assertNumQueries(0):
+                products = SectionSnapshotService.get_products("monthly")
+            self.assertNotIn(10_000, [item["view_count"] for item in products])
+
+        products = SectionSnapshotService.get_products("monthly")
+        self.assertEqual(products[0]["id"], str(product.pk))
+        self.assertEqual(products[0]["view_count"], 10_000)
+
+    def test_snapshot_kept_on_counter_only_save(self):
+        """카운터만 저장하면 스냅샷을 무효화하지 않는지 테스트"""
+        product = self.individual_products[0]
+        generation = SectionSnapshotService.get_generation()
+
+        product.view_count += 1
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save(update_fields=["view_count"])
+
+        self.assertEqual(SectionSnapshotService.get_generation(), generation)
+
+    def test_snapshot_invalidated_on_package_item_change(self):
+        """패키지 구성 변경(alcohol_types는 bulk_update로 저장) 시 스냅샷이 무효화되는지 테스트"""
+        package = self.package_products[0].package
+        drink = Drink.objects.exclude(packages=package).first()
+        generation = SectionSnapshotService.get_generation()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PackageItem.objects.create(package=package, drink=drink)
+
+        self.assertNotEqual(SectionSnapshotService.get_generation(), generation)
+
+    def test_stale_snapshot_served_while_another_request_rebuilds(self):
+        """다른 요청이 재생성 락을 가진 동안에는 이전 스냅샷을 SQL 없이 응답하는지 테스트"""
+        previous = SectionSnapshotService.build_snapshot("recommended")
+        SectionSnapshotService.mark_stale()
+        cache.add(SectionSnapshotService.get_rebuild_lock_key("recommended"), 1)
+
+        with self.assertNumQueries(0):
+            snapshot = SectionSnapshotService.get_snapshot("recommended")
+        self.assertEqual(snapshot["built_at"], previous["built_at"])
+
+        # 락이 풀리면 다음 요청이 재생성
+        cache.delete(SectionSnapshotService.get_rebuild_lock_key("recommended"))
+        snapshot = SectionSnapshotService.get_snapshot("recommended")
+        self.assertEqual(snapshot["generation"], SectionSnapshotService.get_generation())
+        self.assertNotEqual(snapshot["built_at"], previous["built_at"])
+
+
+class SearchFacetServiceTest(BaseServiceTestCase):
+    """SearchFacetService 테스트"""
+
+    def test_facet_counts_match_filtered_queryset(self):
+        """패싯 집계가 실제 필터 결과 수와 일치하는지 테스트"""
+        facets = SearchFacetService.compute_facets(QueryDict(""))
+
+        active = Product.objects.filter(status="ACTIVE")
+        self.assertEqual(facets["total_count"], active.count())
+        makgeolli = next(facet for facet in facets["alcohol_types"] if facet["value"] == "MAKGEOLLI")
+        self.assertEqual(makgeolli["count"], active.filter(drink__alcohol_type="MAKGEOLLI").count())
+        self.assertEqual(sum(band["count"] for band in facets["price_bands"]), active.count())
+
+    def test_facets_single_aggregate_query(self):
+        """지역 목록 캐시 후 패싯 집계가 쿼리 한 번으로 끝나는지 테스트"""
+        SearchFacetService.get_regions()
+
+        with self.assertNumQueries(1):
+            SearchFacetService.compute_facets(QueryDict("premium=true&min_price=10000"))
+
+    def test_cache_key_normalized(self):
+        """파라미터 순서/표기가 달라도 같은 캐시 키를 사용하는지 테스트"""
+        first = SearchFacetService.get_cache_key(QueryDict("sweetness=3.0&premium=true&page=2"))
+        second = SearchFacetService.get_cache_key(QueryDict("premium=true&sweetness=3"))
+
+        self.assertEqual(first, second)
+
+    def test_facets_invalidated_on_product_change(self):
+        """상품 변경 시 패싯 캐시가 무효화되는지 테스트"""
+        before = SearchFacetService.get_facets(QueryDict("premium=true"))
+
+        product = self.all_products[0]
+        product.is_premium = not product.is_premium
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save()
+
+            # 커밋 전 집계는 이전 버전 캐시에서 응답 (새 버전으로 저장되지 않음)
+            self.assertEqual(SearchFacetService.get_facets(QueryDict("premium=true")), before)
+
+        after = SearchFacetService.get_facets(QueryDict("premium=true"))
+        self.assertNotEqual(before["total_count"], after["total_count"])
+
+
+class SearchTermServiceTest(TestCase):
+    """SearchTermService 테스트"""
+
+    def setUp(self):
+        # 다른 테스트/실행의 검색 기록과 섞이지 않도록 테스트 전용 키 사용
+        patcher = patch.object(SearchTermService, "KEY_PREFIX", f"test:search_terms:{uuid.uuid4().hex}")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._delete_keys)
+
+    def _delete_keys(self):
+        redis = SearchTermService._redis()
+        keys = list(redis.scan_iter(match=f"{SearchTermService.KEY_PREFIX}:*"))
+        if keys:
+            redis.delete(*keys)
+
+    def test_popular_terms_decay_with_bucket_age(self):
+        """오래된 버킷의 검색어일수록 낮은 가중치로 집계"""
+        now = time.time()
+        old = now - SearchTermService.BUCKET_SECONDS * 10
+
+        for _ in range(3):
+            SearchTermService.record("막걸리", now=old)
+        for _ in range(2):
+            SearchTermService.record("  달빛   약주 ", now=now)
+        SearchTermService.record("유자", now=now)
+
+        SearchTermService.rebuild(now)
+
+        # 3 * 0.8^10 < 1 이므로 최근 검색어가 앞섬, 검색어는 정규화되어 기록
+        self.assertEqual(SearchTermService.get_popular_terms(), ["달빛 약주", "유자", "막걸리"])
+
+    def test_popular_terms_window_and_default(self):
+        """집계 구간을 벗어난 기록은 제외되고, 기록이 없으면 기본 검색어 반환"""
+        now = time.time()
+        SearchTermService.record(
+            "막걸리", now=now - SearchTermService.BUCKET_SECONDS * SearchTermService.WINDOW_BUCKETS
+        )
+
+        SearchTermService.rebuild(now)
+
+        self.assertEqual(SearchTermService.get_popular_terms(), SearchTermService.DEFAULT_TERMS)
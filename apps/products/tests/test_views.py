@@ -1,10 +1,23 @@
 # apps/products/tests/test_views.py
 
+import json
+import time
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils.http import http_date
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from apps.products.models import Brewery, Drink, Product, ProductLike
+from apps.products.services import AutocompleteService, LikeService, ProductService
+from apps.products.views.pagination import KeysetSearchPagination
+
 from .test_helpers import TestDataCreator
 
 User = get_user_model()
@@ -14,6 +27,8 @@ class BaseAPITestCase(APITestCase):
     """API 테스트 기본 클래스"""
 
     def setUp(self):
+        # 이전 테스트에서 남은 Redis 캐시 정리 (캐시 무효화는 커밋 후 실행되므로 테스트 트랜잭션 안에서는 실행되지 않음)
+        cache.clear()
         self.test_data = TestDataCreator.create_full_dataset()
         self.breweries = self.test_data["breweries"]
         self.drinks = self.test_data["drinks"]
@@ -57,6 +72,21 @@ class BreweryAPITest(BaseAPITestCase):
         self.assertIn("address", data)
         self.assertIn("drink_count", data)
 
+    def test_brewery_list_query_count_constant(self):
+        """양조장 수와 무관하게 목록 조회 쿼리 수가 일정한지 테스트 (COUNT + 목록)"""
+        url = reverse("products:v1:breweries-list")
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        counts = {brewery["id"]: brewery["product_count"] for brewery in response.data["results"]}
+        brewery = self.breweries[0]
+        expected = Product.objects.filter(drink__brewery=brewery, status="ACTIVE").count()
+        self.assertEqual(counts[brewery.pk], expected)
+
+        Brewery.objects.bulk_create([Brewery(name=f"추가양조장{index}") for index in range(5)])
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
 
 class ProductSearchAPITest(BaseAPITestCase):
     """상품 검색 API 테스트"""
@@ -112,6 +142,15 @@ class ProductSearchAPITest(BaseAPITestCase):
             found = any("막걸리" in product["name"] for product in results)
             self.assertTrue(found)
 
+    def test_product_search_by_brewery_name(self):
+        """양조장 이름으로 검색 테스트"""
+        url = reverse("products:v1:products-search")
+        response = self.client.get(url, {"search": "한옥소주"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = [product["name"] for product in response.data["results"]]
+        self.assertIn("한옥증류소주", names)
+
     def test_product_search_ordering(self):
         """상품 정렬 테스트"""
         url = reverse("products:v1:products-search")
@@ -124,6 +163,89 @@ class ProductSearchAPITest(BaseAPITestCase):
         prices = [product["price"] for product in results]
         self.assertEqual(prices, sorted(prices))
 
+    def test_product_search_cursor_pagination(self):
+        """커서 페이지네이션 - 정렬 조건별로 중복/누락 없이 모든 상품을 순회하는지 테스트"""
+        url = reverse("products:v1:products-search")
+
+        for ordering in ["-created_at", "price", "-view_count", "like_count"]:
+            seen = []
+            response = self.client.get(
+                url, {"cursor": "", "ordering": ordering, "page_size": 3, "include_count": "true"}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            total = response.data["count"]
+
+            while True:
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                seen.extend(product["id"] for product in response.data["results"])
+                if not response.data["next"]:
+                    break
+                response = self.client.get(response.data["next"])
+
+            self.assertEqual(len(seen), total)
+            self.assertEqual(len(set(seen)), total)
+
+    def test_product_search_query_count_independent_of_page_size(self):
+        """목록 조회 쿼리 수가 페이지 크기와 무관한지 테스트 (상품별 이미지 조회 없음)"""
+        url = reverse("products:v1:products-search")
+        query_counts = []
+        for page_size in [2, 8]:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, {"page_size": page_size})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            query_counts.append(len(context.captured_queries))
+
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_product_search_result_cache(self):
+        """같은 검색 조건(순서/표기 무관)은 캐시된 결과 ID로 응답하고, 상품 변경 시 무효화"""
+        url = reverse("products:v1:products-search")
+        first = self.client.get(url + "?sweetness=4.2&ordering=price")
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertTrue(first.data["results"])
+
+        # 파라미터 순서/소수 표기/기본값이 달라도 같은 결과 - id__in 조회 한 번만 실행
+        with self.assertNumQueries(1):
+            second = self.client.get(url + "?ordering=price&page=1&sweetness=4.20")
+        self.assertEqual(second.data, first.data)
+
+        # 상품 변경 시 카탈로그 버전이 올라가 다시 조회
+        product = Product.objects.get(pk=first.data["results"][-1]["id"])
+        product.price = 1
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save()
+
+            # 커밋 전에는 버전이 그대로 (커밋 전 결과가 새 버전으로 캐시되지 않음)
+            with self.assertNumQueries(1):
+                self.client.get(url + "?sweetness=4.2&ordering=price")
+        with CaptureQueriesContext(connection) as context:
+            third = self.client.get(url + "?sweetness=4.2&ordering=price")
+        self.assertGreater(len(context.captured_queries), 1)
+        self.assertEqual(third.data["results"][0]["id"], str(product.pk))
+
+    def test_product_search_invalid_cursor(self):
+        """잘못된 커서 테스트"""
+        url = reverse("products:v1:products-search")
+        response = self.client.get(url, {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_product_search_forged_cursor(self):
+        """형식은 맞지만 값 타입이 정렬 필드와 다른 커서 테스트 (DB 오류 대신 404)"""
+        url = reverse("products:v1:products-search")
+        paginator = KeysetSearchPagination()
+
+        for ordering, position in [
+            ("-created_at", ["not-a-date", str(self.all_products[0].pk)]),
+            ("price", ["abc", str(self.all_products[0].pk)]),
+            ("price", [1000, "not-a-uuid"]),
+            ("price", [None, str(self.all_products[0].pk)]),
+            ("price", [{"a": 1}, str(self.all_products[0].pk)]),
+        ]:
+            cursor = paginator.encode_cursor(position)
+            response = self.client.get(url, {"cursor": cursor, "ordering": ordering})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, (ordering, position))
+
     def test_product_category_filters(self):
         """카테고리 필터 테스트"""
         url = reverse("products:v1:products-search")
@@ -156,6 +278,73 @@ class ProductSearchAPITest(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # 필터가 정상 작동하는지만 확인 (HTTP 200)
 
+    def test_product_taste_closest_match(self):
+        """맛 프로필 최근접 검색 테스트 - 정확히 일치하는 상품이 가장 먼저"""
+        url = reverse("products:v1:products-search")
+        drink = self.individual_products[0].drink
+
+        response = self.client.get(
+            url,
+            {
+                "sweetness": drink.sweetness_level,
+                "acidity": drink.acidity_level,
+                "match": "closest",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertGreater(len(results), 0)
+        self.assertEqual(results[0]["id"], str(self.individual_products[0].pk))
+
+
+class ProductSearchFacetAPITest(BaseAPITestCase):
+    """검색 패싯 API 테스트"""
+
+    def test_search_facets(self):
+        """패싯 집계 API 테스트"""
+        url = reverse("products:v1:products-search-facets")
+        response = self.client.get(url, {"search": "막걸리"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for key in ["total_count", "alcohol_types", "categories", "regions", "price_bands"]:
+            self.assertIn(key, response.data)
+
+        search_response = self.client.get(reverse("products:v1:products-search"), {"search": "막걸리"})
+        self.assertEqual(response.data["total_count"], search_response.data["count"])
+
+
+class PopularSearchTermAPITest(APITestCase):
+    """인기 검색어 API 테스트"""
+
+    def test_popular_search_terms(self):
+        url = reverse("products:v1:products-search-popular-terms")
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.data["terms"], list)
+        self.assertLessEqual(len(response.data["terms"]), 10)
+
+
+class AutocompleteAPITest(BaseAPITestCase):
+    """자동완성 API 테스트"""
+
+    def test_autocomplete_without_queries(self):
+        """색인이 준비된 후에는 DB 조회 없이 응답"""
+        AutocompleteService.rebuild()
+        url = reverse("products:v1:products-autocomplete")
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, {"q": "ㅁㄱㄹ", "limit": 5})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = [entry["name"] for entry in response.data["suggestions"]]
+        self.assertIn("우리쌀막걸리", names)
+        self.assertLessEqual(len(names), 5)
+
+        response = self.client.get(url, {"q": ""})
+        self.assertEqual(response.data["suggestions"], [])
+
 
 class ProductDetailAPITest(BaseAPITestCase):
     """상품 상세 조회 API 테스트"""
@@ -198,10 +387,122 @@ class ProductDetailAPITest(BaseAPITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        # 조회수가 증가했는지 확인
+        # 조회수가 증가했는지 확인 (Redis 누적분 DB 반영 후)
+        ProductService.VIEW_COUNTER.flush()
         product.refresh_from_db()
         self.assertEqual(product.view_count, initial_view_count + 1)
 
+    def test_product_detail_conditional_get(self):
+        """ETag가 같으면 상세 조회/직렬화 없이 304 응답, 상품/좋아요 변경 시 200 (로그인 사용자)"""
+        self.client.force_authenticate(user=TestDataCreator.create_user())
+        product = self.individual_products[0]
+        url = reverse("products:v1:products-detail", kwargs={"pk": product.pk})
+        response = self.client.get(url)
+        etag = response["ETag"]
+        # 좋아요 수/좋아요 여부는 수정 시각에 드러나지 않으므로 ETag로만 검증
+        self.assertNotIn("Last-Modified", response)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # 검증값은 상세 캐시에서 사용 (쿼리 없음)
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ProductLike.objects.create(
+                user=TestDataCreator.create_user(nickname="liker", email="liker@example.com"), product=product
+            )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        etag = response["ETag"]
+        drink = product.drink
+        drink.ingredients = "쌀, 누룩"
+        with self.captureOnCommitCallbacks(execute=True):
+            drink.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_product_detail_payload_cache(self):
+        """상세 직렬화 결과 캐시 적중 시 SQL 없이 응답, 카운터는 캐시 값에 반영, 연관 데이터 변경 시 재생성"""
+        user = TestDataCreator.create_user()
+        self.client.force_authenticate(user=user)
+        product = self.individual_products[0]
+        url = reverse("products:v1:products-detail", kwargs={"pk": product.pk})
+        response = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(url)
+        self.assertEqual(cached.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(cached.data), list(response.data))
+        self.assertEqual(cached.data["view_count"], response.data["view_count"] + 1)
+
+        # 좋아요 수는 본문을 다시 만들지 않고 캐시 값만 갱신 (커밋 후)
+        with self.captureOnCommitCallbacks(execute=True):
+            LikeService.toggle_product_like(user, str(product.pk))
+        with self.assertNumQueries(0):
+            cached = self.client.get(url)
+        self.assertEqual(cached.data["like_count"], response.data["like_count"] + 1)
+        self.assertTrue(cached.data["is_liked"])
+
+        # 술 변경 시 해당 술을 포함한 상품 캐시 삭제 (커밋 후 - 커밋 전에는 이전 캐시 응답)
+        drink = product.drink
+        drink.name = "새 이름 막걸리"
+        with self.captureOnCommitCallbacks(execute=True):
+            drink.save()
+            with self.assertNumQueries(0):
+                self.client.get(url)
+        response = self.client.get(url)
+        self.assertEqual(response.data["drink"]["name"], "새 이름 막걸리")
+
+    def test_product_detail_anonymous_response_cache(self):
+        """비로그인 상세 조회는 캐시된 응답을 SQL 없이 반환, 상품 변경 시 purge"""
+        product = self.individual_products[0]
+        url = reverse("products:v1:products-detail", kwargs={"pk": product.pk})
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("Authorization", response["Vary"])
+
+        pending_before = ProductService.VIEW_COUNTER.pending([product.pk]).get(str(product.pk), 0)
+        with self.assertNumQueries(0):
+            cached = self.client.get(url)
+        self.assertEqual(cached["X-Cache"], "HIT")
+        self.assertEqual(cached.json(), response.json())
+        # 캐시 적중 시에도 조회수 증가
+        self.assertEqual(ProductService.VIEW_COUNTER.pending([product.pk]).get(str(product.pk), 0), pending_before + 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            product.price += 1000
+            product.save()
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertNotEqual(response.json()["price"], cached.json()["price"])
+
+        # 로그인 사용자는 캐시를 거치지 않음
+        self.client.force_authenticate(user=TestDataCreator.create_user())
+        response = self.client.get(url)
+        self.assertNotIn("X-Cache", response)
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_catalog_write_survives_response_cache_outage(self):
+        """응답 캐시(Redis) 장애 시에도 상품 저장은 성공 (purge는 커밋 후 실행, 실패는 로그만 남김)"""
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        from core.utils.response_cache import ResponseCache
+
+        product = self.individual_products[0]
+        new_price = product.price + 1000
+        with patch.object(ResponseCache, "_redis", side_effect=RedisConnectionError):
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                product.price = new_price
+                product.save()
+        self.assertTrue(callbacks)
+
+        product.refresh_from_db()
+        self.assertEqual(product.price, new_price)
+
     def test_product_detail_not_found(self):
         """존재하지 않는 상품 조회 시 404 에러"""
         import uuid
@@ -213,6 +514,108 @@ class ProductDetailAPITest(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
+class ProductBulkUpdateAPITest(BaseAPITestCase):
+    """상품 일괄 변경 API 테스트"""
+
+    def test_bulk_update_by_brewery(self):
+        """관리자만 선택 조건으로 상품을 일괄 변경할 수 있는지 테스트"""
+        url = reverse("products:v1:products-manage-bulk")
+        brewery = self.breweries[0]
+        payload = {"selector": {"brewery_id": brewery.pk}, "changes": {"status": "OUT_OF_STOCK"}}
+
+        self.client.force_authenticate(user=TestDataCreator.create_user())
+        self.assertEqual(self.client.post(url, payload, format="json").status_code, status.HTTP_403_FORBIDDEN)
+
+        admin = TestDataCreator.create_user(nickname="testadmin", email="admin@example.com", role="ADMIN")
+        self.client.force_authenticate(user=admin)
+
+        # 선택 조건 없이 전체 상품을 변경하는 요청은 거부
+        response = self.client.post(url, {"selector": {}, "changes": {"status": "INACTIVE"}}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["updated"], Product.objects.filter(drink__brewery=brewery).count())
+        self.assertFalse(Product.objects.filter(drink__brewery=brewery, status="ACTIVE").exists())
+
+
+class ProductExportAPITest(BaseAPITestCase):
+    """상품 내보내기 API 테스트"""
+
+    def test_export_products_streaming(self):
+        """관리자만 상품 목록을 CSV/JSONL 파일로 스트리밍 받을 수 있는지 테스트"""
+        url = reverse("products:v1:products-manage-export")
+
+        self.client.force_authenticate(user=TestDataCreator.create_user())
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        admin = TestDataCreator.create_user(nickname="testadmin", email="admin@example.com", role="ADMIN")
+        self.client.force_authenticate(user=admin)
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment;", response["Content-Disposition"])
+        lines = b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+        self.assertTrue(lines[0].startswith("id,name,product_type,brewery"))
+        self.assertEqual(len(lines), Product.objects.count() + 1)
+
+        response = self.client.get(url, {"output": "jsonl", "status": "ACTIVE"})
+        records = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(len(records), Product.objects.filter(status="ACTIVE").count())
+        self.assertEqual({record["status"] for record in records}, {"ACTIVE"})
+
+        self.assertEqual(self.client.get(url, {"output": "xlsx"}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_csv_escapes_formulas(self):
+        """CSV 내보내기에서 수식으로 시작하는 셀 앞에 작은따옴표를 붙이는지 테스트 (JSONL은 원래 값)"""
+        product = self.individual_products[0]
+        Drink.objects.filter(pk=product.drink_id).update(name='=HYPERLINK("https://example.com")')
+        admin = TestDataCreator.create_user(nickname="testadmin", email="admin@example.com", role="ADMIN")
+        self.client.force_authenticate(user=admin)
+        url = reverse("products:v1:products-manage-export")
+
+        response = self.client.get(url)
+        content = b"".join(response.streaming_content).decode("utf-8-sig")
+        self.assertIn('"\'=HYPERLINK(""https://example.com"")"', content)
+
+        response = self.client.get(url, {"output": "jsonl"})
+        records = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertIn('=HYPERLINK("https://example.com")', {record["name"] for record in records})
+
+
+class CatalogImportAPITest(BaseAPITestCase):
+    """카탈로그 일괄 등록 API 테스트"""
+
+    def _upload(self, content, name="catalog.csv", **data):
+        url = reverse("products:v1:products-import")
+        upload = SimpleUploadedFile(name, content.encode("utf-8"), content_type="text/csv")
+        return self.client.post(url, {"file": upload, **data}, format="multipart")
+
+    def test_catalog_import_csv(self):
+        """관리자만 CSV 파일로 상품을 일괄 등록할 수 있는지 테스트"""
+        content = (
+            "type,name,brewery,ingredients,alcohol_type,abv,volume_ml,price,description,"
+            "description_image_url,images,drinks\n"
+            "individual,달빛막걸리,우리술양조장,쌀,MAKGEOLLI,7.0,750,12000,설명,"
+            "https://cdn.example.com/d.jpg,https://cdn.example.com/1.jpg,\n"
+            "package,달빛 세트,,,,,,30000,설명,https://cdn.example.com/d.jpg,https://cdn.example.com/2.jpg,"
+            "우리술양조장/달빛막걸리|우리술양조장/우리쌀막걸리\n"
+        )
+
+        self.client.force_authenticate(user=TestDataCreator.create_user())
+        self.assertEqual(self._upload(content).status_code, status.HTTP_403_FORBIDDEN)
+
+        admin = TestDataCreator.create_user(nickname="testadmin", email="admin@example.com", role="ADMIN")
+        self.client.force_authenticate(user=admin)
+        response = self._upload(content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"]["products"], 2)
+        self.assertEqual(response.data["errors"], [])
+        self.assertTrue(Product.objects.filter(package__name="달빛 세트").exists())
+
+
 class ProductLikeAPITest(BaseAPITestCase):
     """상품 좋아요 API 테스트"""
 
@@ -227,8 +630,9 @@ class ProductLikeAPITest(BaseAPITestCase):
 
         url = reverse("products:v1:products-toggle-like", kwargs={"pk": product.pk})
 
-        # 좋아요 추가
-        response = self.client.post(url)
+        # 좋아요 추가 (집합은 커밋 후 갱신)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(response.data["is_liked"])
         self.assertEqual(response.data["like_count"], 1)
@@ -239,6 +643,30 @@ class ProductLikeAPITest(BaseAPITestCase):
         self.assertFalse(response.data["is_liked"])
         self.assertEqual(response.data["like_count"], 0)
 
+    def test_is_liked_in_product_responses(self):
+        """검색/섹션/상세 응답에 현재 사용자의 좋아요 여부 포함"""
+        self.client.force_authenticate(user=self.user)
+        liked = self.individual_products[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse("products:v1:products-toggle-like", kwargs={"pk": liked.pk}))
+
+        response = self.client.get(reverse("products:v1:products-search"), {"page_size": 32})
+        flags = {product["id"]: product["is_liked"] for product in response.data["results"]}
+        self.assertTrue(flags.pop(str(liked.pk)))
+        self.assertFalse(any(flags.values()))
+
+        response = self.client.get(reverse("products:v1:products-recommended"))
+        for product in response.data["products"]:
+            self.assertEqual(product["is_liked"], product["id"] == str(liked.pk))
+
+        response = self.client.get(reverse("products:v1:products-detail", kwargs={"pk": liked.pk}))
+        self.assertTrue(response.data["is_liked"])
+
+        # 비로그인 사용자는 항상 False
+        self.client.force_authenticate(user=None)
+        response = self.client.get(reverse("products:v1:products-detail", kwargs={"pk": liked.pk}))
+        self.assertFalse(response.data["is_liked"])
+
     def test_product_like_toggle_unauthenticated(self):
         """비인증 사용자의 좋아요 시도 테스트"""
         product = self.individual_products[0]
@@ -264,6 +692,24 @@ class MainPageSectionAPITest(BaseAPITestCase):
         products = response.data["products"]
         self.assertLessEqual(len(products), 3)
 
+    def test_section_conditional_get(self):
+        """스냅샷이 그대로면 ETag 비교만으로 304 응답 (SQL 없음)"""
+        url = reverse("products:v1:products-monthly")
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # 상품 변경 시 스냅샷이 다시 생성되어 ETag 변경
+        product = self.individual_products[0]
+        product.price += 1000
+        with self.captureOnCommitCallbacks(execute=True):
+            product.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
     def test_popular_products_api(self):
         """인기 패키지 API 테스트"""
         url = reverse("products:v1:products-popular")
@@ -294,6 +740,42 @@ class MainPageSectionAPITest(BaseAPITestCase):
         self.assertIn("products", response.data)
         self.assertEqual(response.data["title"], "추천 패키지")
 
+    def test_personalized_recommendation_api(self):
+        """취향 맞춤 추천 API 테스트 - 취향과 가장 가까운 상품이 먼저"""
+        from apps.users.models import PreferTasteProfile
+
+        user = TestDataCreator.create_user()
+        drink = self.individual_products[0].drink
+        PreferTasteProfile.objects.create(
+            user=user,
+            **{
+                field: getattr(drink, field)
+                for field in [
+                    "sweetness_level",
+                    "acidity_level",
+                    "body_level",
+                    "carbonation_level",
+                    "bitterness_level",
+                    "aroma_level",
+                ]
+            },
+        )
+        self.client.force_authenticate(user=user)
+
+        url = reverse("products:v1:products-recommended-personalized")
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "취향 맞춤 추천")
+        self.assertEqual(response.data["products"][0]["id"], str(self.individual_products[0].pk))
+
+    def test_personalized_recommendation_unauthenticated(self):
+        """비인증 사용자의 취향 맞춤 추천 조회 테스트"""
+        url = reverse("products:v1:products-recommended-personalized")
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
 
 class PackagePageSectionAPITest(BaseAPITestCase):
     """패키지페이지 섹션 API 테스트"""
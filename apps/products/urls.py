@@ -3,11 +3,13 @@
 from django.urls import include, path
 
 from apps.products.views import (  # Brewery views; Drink views; Product views - 일반 사용자용; Product views - 메인페이지 섹션들; Product views - 패키지페이지 섹션들; Product views - 관리자용
+    AutocompleteView,
     AwardWinningProductsView,
     BreweryCreateView,
     BreweryDetailView,
     BreweryListView,
     BreweryManageView,
+    CatalogImportView,
     DrinkListView,
     DrinksForPackageView,
     FeaturedProductsView,
@@ -15,11 +17,16 @@ from apps.products.views import (  # Brewery views; Drink views; Product views -
     MakgeolliProductsView,
     MonthlyFeaturedDrinksView,
     PackageProductCreateView,
+    PersonalizedRecommendationView,
     PopularProductsView,
+    PopularSearchTermView,
+    ProductBulkUpdateView,
     ProductDetailView,
+    ProductExportView,
     ProductLikeToggleView,
     ProductManageListView,
     ProductManageView,
+    ProductSearchFacetView,
     ProductSearchView,
     RecommendedProductsView,
     RegionalProductsView,
@@ -45,6 +52,9 @@ v1_patterns = [
     # 상품 APIs - 일반 사용자용
     # ============================================================================
     path("products/search/", ProductSearchView.as_view(), name="products-search"),
+    path("products/search/facets/", ProductSearchFacetView.as_view(), name="products-search-facets"),
+    path("products/autocomplete/", AutocompleteView.as_view(), name="products-autocomplete"),
+    path("products/search/popular-terms/", PopularSearchTermView.as_view(), name="products-search-popular-terms"),
     path("products/<uuid:pk>/", ProductDetailView.as_view(), name="products-detail"),
     path("products/<uuid:pk>/like/", ProductLikeToggleView.as_view(), name="products-toggle-like"),
     # ============================================================================
@@ -53,6 +63,11 @@ v1_patterns = [
     path("products/monthly/", MonthlyFeaturedDrinksView.as_view(), name="products-monthly"),
     path("products/popular/", PopularProductsView.as_view(), name="products-popular"),
     path("products/recommended/", RecommendedProductsView.as_view(), name="products-recommended"),
+    path(
+        "products/recommended/me/",
+        PersonalizedRecommendationView.as_view(),
+        name="products-recommended-personalized",
+    ),
     # ============================================================================
     # 상품 APIs - 패키지페이지 섹션들
     # ============================================================================
@@ -64,9 +79,12 @@ v1_patterns = [
     # 상품 APIs - 관리자용
     # ============================================================================
     path("products/manage/", ProductManageListView.as_view(), name="products-manage-list"),
+    path("products/manage/bulk/", ProductBulkUpdateView.as_view(), name="products-manage-bulk"),
+    path("products/manage/export/", ProductExportView.as_view(), name="products-manage-export"),
     path("products/<uuid:pk>/manage/", ProductManageView.as_view(), name="products-manage"),
     path("products/individual/create/", IndividualProductCreateView.as_view(), name="products-individual-create"),
     path("products/package/create/", PackageProductCreateView.as_view(), name="products-package-create"),
+    path("products/import/", CatalogImportView.as_view(), name="products-import"),
 ]
 
 urlpatterns = [
@@ -12,18 +12,25 @@ from .drink import (
 
 # 새로운 product 패키지 구조에서 import
 from .product import (  # 일반 사용자용 API; 메인페이지 섹션들; 패키지페이지 섹션들; 관리자용 API (필요한 경우)
+    AutocompleteView,
     AwardWinningProductsView,
+    CatalogImportView,
     DrinksForPackageView,
     FeaturedProductsView,
     IndividualProductCreateView,
     MakgeolliProductsView,
     MonthlyFeaturedDrinksView,
     PackageProductCreateView,
+    PersonalizedRecommendationView,
     PopularProductsView,
+    PopularSearchTermView,
+    ProductBulkUpdateView,
     ProductDetailView,
+    ProductExportView,
     ProductLikeToggleView,
     ProductManageListView,
     ProductManageView,
+    ProductSearchFacetView,
     ProductSearchView,
     RecommendedProductsView,
     RegionalProductsView,
@@ -39,12 +46,16 @@ __all__ = [
     "DrinkListView",
     # Product - 일반 사용자용 API
     "ProductSearchView",
+    "ProductSearchFacetView",
+    "PopularSearchTermView",
+    "AutocompleteView",
     "ProductDetailView",
     "ProductLikeToggleView",
     # Product - 메인페이지 섹션들
     "MonthlyFeaturedDrinksView",
     "PopularProductsView",
     "RecommendedProductsView",
+    "PersonalizedRecommendationView",
     # Product - 패키지페이지 섹션들
     "FeaturedProductsView",
     "AwardWinningProductsView",
@@ -56,4 +67,7 @@ __all__ = [
     "DrinksForPackageView",
     "ProductManageView",
     "ProductManageListView",
+    "ProductBulkUpdateView",
+    "ProductExportView",
+    "CatalogImportView",
 ]
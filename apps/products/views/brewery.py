@@ -11,6 +11,7 @@ from rest_framework.permissions import IsAuthenticated
 
 from apps.products.models import Brewery
 from apps.products.serializers import BreweryListSerializer, BrewerySerializer
+from core.utils.response_cache import AnonymousResponseCacheMixin
 
 from .pagination import SearchPagination
 
@@ -32,15 +33,18 @@ class BreweryListView(ListAPIView):
         return super().list(request, *args, **kwargs)
 
     def get_queryset(self):
-        return Brewery.objects.filter(is_active=True).order_by("name")
+        return Brewery.objects.with_counts().filter(is_active=True).order_by("name")
 
 
-class BreweryDetailView(RetrieveAPIView):
+class BreweryDetailView(AnonymousResponseCacheMixin, RetrieveAPIView):
     """양조장 상세 조회"""
 
     serializer_class = BrewerySerializer
     lookup_field = "pk"
 
+    def get_surrogate_keys(self, request, *args, **kwargs):
+        return [f"brewery:{kwargs.get('pk')}", "catalog"]
+
     @extend_schema(
         summary="양조장 상세 조회",
         description="""
@@ -52,7 +56,7 @@ class BreweryDetailView(RetrieveAPIView):
         return super().retrieve(request, *args, **kwargs)
 
     def get_queryset(self):
-        return Brewery.objects.filter(is_active=True)
+        return Brewery.objects.with_counts().filter(is_active=True)
 
 
 class BreweryCreateView(CreateAPIView):
@@ -116,7 +120,7 @@ class BreweryManageView(RetrieveUpdateDestroyAPIView):
         return super().destroy(request, *args, **kwargs)
 
     def get_queryset(self):
-        return Brewery.objects.all()  # 관리자는 비활성 양조장도 조회 가능
+        return Brewery.objects.with_counts()  # 관리자는 비활성 양조장도 조회 가능
 
     def perform_destroy(self, instance):
         # 실제 삭제 대신 소프트 삭제
@@ -8,14 +8,14 @@ from rest_framework.generics import ListAPIView
 from apps.products.models import Drink
 from apps.products.serializers import DrinkListSerializer
 
-from .pagination import SearchPagination
+from .pagination import KeysetSearchPagination
 
 
 class DrinkListView(ListAPIView):
     """술 목록 조회 (관리자용)"""
 
     serializer_class = DrinkListSerializer
-    pagination_class = SearchPagination
+    pagination_class = KeysetSearchPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ["alcohol_type", "brewery"]
     search_fields = ["name", "brewery__name"]
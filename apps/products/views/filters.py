@@ -0,0 +1,33 @@
+# apps/products/views/filters.py
+
+from rest_framework import filters
+
+from ..services.search_index_service import SearchIndexService
+
+
+class ProductSearchFilter(filters.SearchFilter):
+    """상품 검색 필터 - search_document 트라이그램 인덱스 기반 (관련도 계산 포함)"""
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+        return SearchIndexService.apply_search(queryset, search_terms)
+
+
+class ProductOrderingFilter(filters.OrderingFilter):
+    """상품 정렬 필터 - 정렬 파라미터가 없으면 관련도순으로 정렬"""
+
+    # 기본 정렬보다 우선하는 순위 어노테이션 (어노테이션명, 정렬식) - 앞쪽이 우선
+    rank_orderings = [
+        ("taste_rank", "taste_rank"),
+        ("search_rank", "-search_rank"),
+    ]
+
+    def get_ordering(self, request, queryset, view):
+        params = request.query_params.get(self.ordering_param)
+        if not params:
+            for annotation, ordering in self.rank_orderings:
+                if annotation in queryset.query.annotations:
+                    return [ordering, *(self.get_default_ordering(view) or [])]
+        return super().get_ordering(request, queryset, view)
@@ -1,6 +1,20 @@
 # apps/products/views/pagination.py
 
+import base64
+import binascii
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Page
+from django.db.models import Field, Q
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class SearchPagination(PageNumberPagination):
@@ -9,3 +23,246 @@ class SearchPagination(PageNumberPagination):
     page_size = 16
     page_size_query_param = "page_size"
     max_page_size = 32
+
+
+class KeysetSearchPagination(SearchPagination):
+    """
+    검색/관리 목록용 페이지네이션 - cursor 파라미터 사용 시 키셋(커서) 방식
+
+    cursor 파라미터가 없으면 기존 페이지 번호 방식과 동일하게 동작합니다.
+    cursor 파라미터가 있으면(첫 페이지는 빈 값) 마지막 항목의 정렬 키 다음부터 조회하므로
+    OFFSET과 COUNT(*) 없이 깊이와 무관하게 일정한 비용으로 페이지를 가져옵니다.
+
+    - 정렬 기준은 쿼리셋의 order_by(OrderingFilter 결과 포함)를 그대로 사용하며, id를 보조 정렬로 추가합니다.
+    - 정렬 필드는 NULL이 없어야 합니다. (ordering_fields 및 관련도 어노테이션 모두 해당)
+    - 전체 개수는 include_count=true일 때만 계산합니다. (그 외에는 count=null)
+    """
+
+    cursor_query_param = "cursor"
+    include_count_query_param = "include_count"
+    invalid_cursor_message = "잘못된 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            self.keyset = False
+            return super().paginate_queryset(queryset, request, view)
+
+        self.keyset = True
+        self.request = request
+        page_size = self.get_page_size(request) or self.page_size
+
+        ordering = self.get_keyset_ordering(queryset)
+        queryset = queryset.order_by(*ordering)
+
+        self.count = None
+        if request.query_params.get(self.include_count_query_param) == "true":
+            self.count = queryset.count()
+
+        position = self.decode_cursor(request.query_params.get(self.cursor_query_param))
+        if position is not None:
+            position = self.parse_position(queryset, ordering, position)
+            queryset = queryset.filter(self.build_keyset_filter(ordering, position))
+
+        results = list(queryset[: page_size + 1])
+        self.has_next = len(results) > page_size
+        results = results[:page_size]
+
+        self.next_position = None
+        if self.has_next and results:
+            self.next_position = [self.get_value(results[-1], field.lstrip("-")) for field in ordering]
+        return results
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response(
+            {
+                "count": self.count,
+                "next": self.get_next_link(),
+                "previous": None,
+                "results": data,
+            }
+        )
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    # ------------------------------------------------------------------------
+    # 캐시용 상태 저장/복원 (검색 결과 캐시)
+    # ------------------------------------------------------------------------
+
+    def get_state(self) -> Dict[str, Any]:
+        """응답 생성에 필요한 페이지네이션 상태 (paginate_queryset 이후 호출)"""
+        if self.keyset:
+            return {"keyset": True, "count": self.count, "next_position": self.next_position}
+        return {
+            "keyset": False,
+            "count": self.page.paginator.count,
+            "number": self.page.number,
+            "page_size": self.page.paginator.per_page,
+        }
+
+    def restore_state(self, request, state: Dict[str, Any], object_list: List[Any]) -> List[Any]:
+        """
+        저장된 상태로 페이지네이션 복원 (쿼리 없이 get_paginated_response 사용 가능)
+
+        Args:
+            request: 현재 요청
+            state: get_state() 결과
+            object_list: 현재 페이지 항목들
+
+        Returns:
+            List: 현재 페이지 항목들
+        """
+        self.request = request
+        self.keyset = state["keyset"]
+        if self.keyset:
+            self.count = state["count"]
+            self.next_position = state["next_position"]
+        else:
+            paginator = self.django_paginator_class(object_list, state["page_size"])
+            # 전체 개수는 저장된 값 사용 (COUNT 쿼리 생략)
+            paginator.count = state["count"]
+            self.page = Page(object_list, state["number"], paginator)
+        return object_list
+
+    # ------------------------------------------------------------------------
+    # 키셋 정렬/필터
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def get_keyset_ordering(queryset) -> List[str]:
+        """쿼리셋 정렬 필드 목록 (id 보조 정렬 포함)"""
+        ordering = [
+            field for field in (queryset.query.order_by or queryset.model._meta.ordering) if isinstance(field, str)
+        ]
+        if not any(field.lstrip("-") in ("id", "pk") for field in ordering):
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append("-id" if descending else "id")
+        return ordering
+
+    @staticmethod
+    def get_ordering_field(queryset, name: str) -> Field:
+        """정렬 키의 필드 (어노테이션은 output_field, 관계 경로는 마지막 필드)"""
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        opts = queryset.model._meta
+        *path, last = name.split("__")
+        for part in path:
+            opts = opts.get_field(part).related_model._meta
+        return opts.pk if last == "pk" else opts.get_field(last)
+
+    def parse_position(self, queryset, ordering: List[str], position: List[Any]) -> List[Any]:
+        """
+        커서 위치 값을 정렬 필드 타입으로 변환
+
+        조작된 커서 값이 필터 조건에서 DB 오류(500)를 일으키지 않도록 미리 검증합니다.
+
+        Args:
+            queryset: 정렬이 적용된 쿼리셋
+            ordering: 정렬 필드 목록
+            position: 디코딩된 커서 위치 값
+
+        Returns:
+            List: 변환된 위치 값
+
+        Raises:
+            NotFound: 값 개수나 타입이 정렬 필드와 맞지 않을 때
+        """
+        if len(position) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        values = []
+        for field_name, value in zip(ordering, position):
+            field = self.get_ordering_field(queryset, field_name.lstrip("-"))
+            # 정렬 필드는 NULL이 없으므로 None/목록/객체는 모두 잘못된 값
+            if value is None or isinstance(value, (list, dict)):
+                raise NotFound(self.invalid_cursor_message)
+            try:
+                values.append(field.to_python(value))
+            except (ValidationError, ValueError, TypeError):
+                raise NotFound(self.invalid_cursor_message)
+        return values
+
+    @staticmethod
+    def build_keyset_filter(ordering: List[str], position: List[Any]) -> Q:
+        """
+        마지막 항목 이후 조건 생성
+
+        (a, b, id) 정렬에서 a > x OR (a = x AND b > y) OR (a = x AND b = y AND id > z) 형태이며,
+        내림차순 필드는 부등호 방향이 반대가 됩니다.
+        """
+        condition = Q()
+        for index, field in enumerate(ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            term = Q(**{f"{name}__{lookup}": position[index]})
+            for previous_field, previous_value in zip(ordering[:index], position[:index]):
+                term &= Q(**{previous_field.lstrip("-"): previous_value})
+            condition |= term
+        return condition
+
+    @staticmethod
+    def get_value(obj, field: str) -> Any:
+        if field == "pk":
+            field = "id"
+        # .values() 조회 결과(dict 행)
+        if isinstance(obj, dict):
+            return obj[field]
+        for part in field.split("__"):
+            obj = getattr(obj, part)
+        return obj
+
+    # ------------------------------------------------------------------------
+    # 커서 인코딩
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _to_json(value: Any) -> Any:
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            return value.isoformat()
+        if isinstance(value, (Decimal, uuid.UUID)):
+            return str(value)
+        return value
+
+    def encode_cursor(self, position: List[Any]) -> str:
+        payload = json.dumps([self._to_json(value) for value in position], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, encoded: Optional[str]) -> Optional[List[Any]]:
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            position = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.extend(
+            [
+                {
+                    "name": self.cursor_query_param,
+                    "required": False,
+                    "in": "query",
+                    "description": "키셋 페이지네이션 커서 (첫 페이지는 빈 값, 이후 next 링크 사용)",
+                    "schema": {"type": "string"},
+                },
+                {
+                    "name": self.include_count_query_param,
+                    "required": False,
+                    "in": "query",
+                    "description": "키셋 페이지네이션 시 전체 개수 포함 여부 (true)",
+                    "schema": {"type": "boolean"},
+                },
+            ]
+        )
+        return parameters
@@ -6,18 +6,24 @@ Product 관련 뷰들
 
 # 관리자용 API
 from .admin import (
+    CatalogImportView,
     DrinksForPackageView,
     IndividualProductCreateView,
     PackageProductCreateView,
+    ProductBulkUpdateView,
+    ProductExportView,
     ProductManageListView,
     ProductManageView,
 )
 
 # 일반 사용자용 API
 from .public import (
+    AutocompleteView,
     BaseProductListView,
+    PopularSearchTermView,
     ProductDetailView,
     ProductLikeToggleView,
+    ProductSearchFacetView,
     ProductSearchView,
 )
 
@@ -28,6 +34,7 @@ from .sections import (
     FeaturedProductsView,
     MakgeolliProductsView,
     MonthlyFeaturedDrinksView,
+    PersonalizedRecommendationView,
     PopularProductsView,
     RecommendedProductsView,
     RegionalProductsView,
@@ -37,6 +44,9 @@ __all__ = [
     # Public
     "BaseProductListView",
     "ProductSearchView",
+    "ProductSearchFacetView",
+    "PopularSearchTermView",
+    "AutocompleteView",
     "ProductDetailView",
     "ProductLikeToggleView",
     # Sections
@@ -44,6 +54,7 @@ __all__ = [
     "MonthlyFeaturedDrinksView",
     "PopularProductsView",
     "RecommendedProductsView",
+    "PersonalizedRecommendationView",
     "FeaturedProductsView",
     "AwardWinningProductsView",
     "MakgeolliProductsView",
@@ -54,4 +65,7 @@ __all__ = [
     "DrinksForPackageView",
     "ProductManageView",
     "ProductManageListView",
+    "ProductBulkUpdateView",
+    "ProductExportView",
+    "CatalogImportView",
 ]
@@ -1,25 +1,42 @@
 # apps/products/views/product/admin.py
 
+import codecs
+
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
-from rest_framework import filters
+from rest_framework import status
 from rest_framework.generics import (
     CreateAPIView,
     ListAPIView,
     RetrieveUpdateDestroyAPIView,
 )
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from apps.products.models import Drink, Product
 from apps.products.serializers.drink import DrinkForPackageSerializer
+from apps.products.serializers.product.bulk_import import (
+    CatalogImportRequestSerializer,
+)
+from apps.products.serializers.product.bulk_update import ProductBulkUpdateSerializer
 from apps.products.serializers.product.create import (
     IndividualProductCreateSerializer,
     PackageProductCreateSerializer,
 )
 from apps.products.serializers.product.detail import ProductDetailSerializer
+from apps.products.serializers.product.export import ProductExportQuerySerializer
 from apps.products.serializers.product.list import ProductListSerializer
+from core.utils.streaming_export import streaming_export_response
 
-from ..pagination import SearchPagination
+from ...services import (
+    CatalogImportService,
+    ProductBulkUpdateService,
+    ProductExportService,
+)
+from ..filters import ProductOrderingFilter, ProductSearchFilter
+from ..pagination import KeysetSearchPagination
 
 # ============================================================================
 # 관리자용 제품 관리 API
@@ -64,7 +81,7 @@ class DrinksForPackageView(ListAPIView):
     """패키지 생성용 술 목록 조회 (관리자용)"""
 
     serializer_class = DrinkForPackageSerializer
-    pagination_class = SearchPagination
+    pagination_class = KeysetSearchPagination
     permission_classes = [IsAuthenticated]
 
     @extend_schema(
@@ -81,8 +98,7 @@ class DrinksForPackageView(ListAPIView):
         """상품이 있는 술들만 반환"""
         return (
             Drink.objects.filter(product__isnull=False, product__status="ACTIVE")
-            .select_related("brewery")
-            .prefetch_related("product__images")
+            .select_related("brewery", "product")
             .order_by("name")
         )
 
@@ -150,10 +166,9 @@ class ProductManageListView(ListAPIView):
     """제품 목록 관리 (관리자용)"""
 
     serializer_class = ProductListSerializer
-    pagination_class = SearchPagination
+    pagination_class = KeysetSearchPagination
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ["drink__name", "package__name", "description"]
+    filter_backends = [DjangoFilterBackend, ProductSearchFilter, ProductOrderingFilter]
     ordering_fields = ["price", "created_at", "view_count", "status"]
     ordering = ["-created_at"]
 
@@ -169,7 +184,7 @@ class ProductManageListView(ListAPIView):
 
     def get_queryset(self):
         """관리자는 모든 상태의 제품 조회 가능"""
-        queryset = Product.objects.select_related("drink__brewery", "package").prefetch_related("images")
+        queryset = Product.objects.select_related("drink__brewery", "package")
 
         # 상태 필터링
         status_filter = self.request.query_params.get("status")
@@ -177,3 +192,86 @@ class ProductManageListView(ListAPIView):
             queryset = queryset.filter(status=status_filter)
 
         return queryset
+
+
+class ProductBulkUpdateView(APIView):
+    """상품 일괄 변경 (관리자용)"""
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="상품 일괄 변경",
+        description="""
+        선택 조건(ID 목록/양조장/주종/특성/상태)에 맞는 상품들의 상태/가격/할인/특성을 한 번에 변경합니다. (관리자용)
+        예: 양조장 전체 품절 처리, 주종별 가격 10% 인하
+        """,
+        request=ProductBulkUpdateSerializer,
+        tags=["관리자 - 제품 관리"],
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = ProductBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = ProductBulkUpdateService.apply(
+            serializer.validated_data["selector"], serializer.validated_data["changes"]
+        )
+        return Response(result)
+
+
+class ProductExportView(APIView):
+    """상품 목록 내보내기 (관리자용)"""
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="상품 목록 내보내기",
+        description="""
+        전체 상품을 CSV/JSONL 파일로 스트리밍합니다. (관리자용)
+        페이지 단위 조회 없이 한 번의 요청으로 받을 수 있으며, 서버 메모리 사용량은 상품 수와 무관합니다.
+        """,
+        parameters=[ProductExportQuerySerializer],
+        responses={(200, "text/csv"): bytes, (200, "application/x-ndjson"): bytes},
+        tags=["관리자 - 제품 관리"],
+    )
+    def get(self, request, *args, **kwargs):
+        serializer = ProductExportQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        rows = ProductExportService.iter_rows(status=serializer.validated_data.get("status"))
+        return streaming_export_response(
+            "products", ProductExportService.COLUMNS, rows, serializer.validated_data["output"]
+        )
+
+
+class CatalogImportView(APIView):
+    """카탈로그 일괄 등록 (관리자용)"""
+
+    permission_classes = [IsAdminUser]
+    parser_classes = [MultiPartParser]
+
+    @extend_schema(
+        summary="카탈로그 일괄 등록",
+        description="""
+        CSV 또는 JSONL 파일로 양조장/술/패키지/상품/이미지를 일괄 등록합니다. (관리자용)
+        오류가 있는 행은 건너뛰고 행 번호별 오류를 함께 반환합니다.
+        """,
+        request=CatalogImportRequestSerializer,
+        tags=["관리자 - 제품 관리"],
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = CatalogImportRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        upload = serializer.validated_data["file"]
+        file_format = serializer.validated_data.get("format") or CatalogImportService.detect_format(upload.name)
+        if file_format is None:
+            return Response(
+                {"format": ["파일 형식을 알 수 없습니다. csv 또는 jsonl을 지정해주세요."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 업로드 파일을 한 줄씩 디코딩하며 처리 (전체를 메모리에 올리지 않음)
+        result = CatalogImportService.import_file(
+            codecs.iterdecode(upload, "utf-8-sig"), file_format, dry_run=serializer.validated_data["dry_run"]
+        )
+        created = any(result["created"].values())
+        return Response(result, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
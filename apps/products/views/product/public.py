@@ -3,19 +3,36 @@
 from typing import Optional, Type
 
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
-from rest_framework import filters, status
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
 from rest_framework.generics import ListAPIView, RetrieveAPIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.products.serializers.product.detail import ProductDetailSerializer
+from apps.products.serializers.product.fast import ProductCardFastSerializer
 from apps.products.serializers.product.list import ProductListSerializer
-
-from ...services import ProductService, SearchService
+from core.utils.conditional_get import (
+    get_not_modified_response,
+    make_etag,
+    set_conditional_headers,
+)
+from core.utils.response_cache import AnonymousResponseCacheMixin
+
+from ...services import (
+    AutocompleteService,
+    CatalogVersionService,
+    ProductDetailCacheService,
+    ProductService,
+    SearchFacetService,
+    SearchResultCacheService,
+    SearchService,
+    SearchTermService,
+)
 from ...services.like_service import LikeService
-from ..pagination import SearchPagination
+from ..filters import ProductOrderingFilter, ProductSearchFilter
+from ..pagination import KeysetSearchPagination, SearchPagination
 
 # ============================================================================
 # 기본 클래스들
@@ -45,9 +62,8 @@ class BaseProductListView(ListAPIView):
 class ProductSearchView(BaseProductListView):
     """제품 검색 및 필터링"""
 
-    pagination_class = SearchPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ["drink__name", "package__name", "description"]
+    pagination_class = KeysetSearchPagination
+    filter_backends = [DjangoFilterBackend, ProductSearchFilter, ProductOrderingFilter]
     ordering_fields = ["price", "created_at", "view_count", "like_count"]
     ordering = ["-created_at"]
 
@@ -61,16 +77,104 @@ class ProductSearchView(BaseProductListView):
     def get(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
+    def list(self, request, *args, **kwargs):
+        # 인기 검색어 집계용 기록 (다음 페이지 조회는 제외)
+        if request.query_params.get("search") and not (
+            request.query_params.get("cursor") or request.query_params.get("page", "1") != "1"
+        ):
+            SearchTermService.record(request.query_params["search"])
+
+        paginator = self.paginator
+        cache_key = SearchResultCacheService.get_cache_key(request.query_params, paginator.get_page_size(request))
+        cached = SearchResultCacheService.get(cache_key)
+
+        if cached is not None:
+            # 같은 검색 조건/페이지의 결과 ID 순서를 재사용 (행은 id__in 쿼리 한 번으로 조회)
+            page = paginator.restore_state(
+                request, cached["pagination"], SearchResultCacheService.hydrate(cached["ids"])
+            )
+        else:
+            # 상품 카드는 .values() 행에서 바로 직렬화 (ProductListSerializer와 동일한 응답)
+            rows = ProductCardFastSerializer.project(self.filter_queryset(self.get_queryset()))
+            page = self.paginate_queryset(rows)
+            SearchResultCacheService.set(cache_key, page, paginator.get_state())
+
+        products = LikeService.attach_like_state(ProductCardFastSerializer.serialize_rows(page), request.user)
+        return self.get_paginated_response(products)
+
     def get_queryset(self):
         return SearchService.get_search_queryset(self.request.query_params)
 
 
-class ProductDetailView(RetrieveAPIView):
+class ProductSearchFacetView(APIView):
+    """검색 사이드바 패싯 집계"""
+
+    @extend_schema(
+        summary="검색 패싯 집계",
+        description="""
+        현재 검색 조건(검색어, 맛 프로필, 카테고리, 주종, 가격)에 해당하는 상품 수를
+        주종별/카테고리별/지역별/가격대별로 반환합니다.
+        """,
+        tags=["제품"],
+    )
+    def get(self, request, *args, **kwargs):
+        return Response(SearchFacetService.get_facets(request.query_params))
+
+
+class PopularSearchTermView(APIView):
+    """인기 검색어"""
+
+    @extend_schema(
+        summary="인기 검색어",
+        description="""
+        최근 24시간 검색 기록을 시간대별 가중치(최근일수록 높음)로 합산한 인기 검색어 10개를 반환합니다.
+        """,
+        tags=["제품"],
+    )
+    def get(self, request, *args, **kwargs):
+        return Response({"terms": SearchService.get_popular_search_terms()})
+
+
+class AutocompleteView(APIView):
+    """검색창 자동완성"""
+
+    # 메모리 색인만 사용하도록 인증(사용자 조회) 생략
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        summary="검색어 자동완성",
+        description="""
+        술/패키지/양조장 이름 중 입력값으로 시작하는(이름 중간 포함) 항목을 반환합니다.
+        입력 중인 음절("막거")과 초성("ㅁㄱㄹ") 입력을 지원합니다.
+        """,
+        parameters=[
+            OpenApiParameter("q", str, description="입력 중인 검색어"),
+            OpenApiParameter("limit", int, description="최대 개수 (기본 10, 최대 20)"),
+        ],
+        tags=["제품"],
+    )
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = int(request.query_params.get("limit", AutocompleteService.DEFAULT_LIMIT))
+        except ValueError:
+            limit = AutocompleteService.DEFAULT_LIMIT
+        return Response({"suggestions": AutocompleteService.suggest(request.query_params.get("q", ""), limit)})
+
+
+class ProductDetailView(AnonymousResponseCacheMixin, RetrieveAPIView):
     """제품 상세 조회"""
 
     serializer_class = ProductDetailSerializer
     lookup_field = "pk"
 
+    def get_surrogate_keys(self, request, *args, **kwargs):
+        return [f"product:{kwargs.get('pk')}", "catalog"]
+
+    def on_response_cache_hit(self, request, *args, **kwargs):
+        # 캐시된 응답을 내려줘도 조회수는 증가
+        ProductService.increment_view_count(kwargs.get("pk"))
+
     @extend_schema(
         summary="제품 상세 조회",
         description="""
@@ -81,10 +185,40 @@ class ProductDetailView(RetrieveAPIView):
     def get(self, request, *args, **kwargs):
 
         product_id = kwargs.get("pk")
-        product = ProductService.get_product_detail(product_id)
 
-        serializer = self.get_serializer(product)
-        return Response(serializer.data)
+        # 직렬화 결과 캐시 적중 시 검증값도 캐시에서 사용 (SQL 없음)
+        cached = ProductDetailCacheService.get(product_id)
+        if cached is not None:
+            data, cached_updated_at = cached
+            validators = (cached_updated_at, data["like_count"])
+        else:
+            # 상세 조회/직렬화 전에 검증값만 조회 (카탈로그 버전: 술/이미지 등 연관 데이터 변경 반영)
+            validators = ProductService.get_detail_validators(product_id)
+
+        # 조회수는 검증값에서 제외 - 304 응답 시에도 조회수는 증가하지만 클라이언트 값은 이전 값 유지
+        # 좋아요 수/좋아요 여부/카탈로그 버전은 수정 시각에 드러나지 않으므로 Last-Modified 없이 ETag로만 검증
+        etag, is_liked = None, False
+        if validators is not None:
+            updated_at, like_count = validators
+            is_liked = bool(LikeService.get_liked_product_ids(request.user, [product_id]))
+            etag = make_etag(
+                product_id, CatalogVersionService.get_version(), updated_at.isoformat(), like_count, is_liked
+            )
+            not_modified = get_not_modified_response(request, etag, vary_on_auth=True)
+            if not_modified is not None:
+                ProductService.increment_view_count(product_id)
+                return not_modified
+
+        if cached is None:
+            # 조회 전 세대 값 - 조회 중 상품이 변경(무효화)되면 옛 데이터를 저장하지 않음
+            generation = ProductDetailCacheService.get_generation(product_id)
+            product = ProductService.load_product_detail(product_id)
+            data = self.get_serializer(product).data
+            ProductDetailCacheService.set(product, data, generation)
+            is_liked = data["is_liked"]
+
+        data = ProductService.record_detail_view(product_id, {**data, "is_liked": is_liked})
+        return set_conditional_headers(Response(data), etag, vary_on_auth=True)
 
 
 class ProductLikeToggleView(APIView):
@@ -1,7 +1,21 @@
+import datetime
+
 from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from apps.products.services import ProductService
+from apps.products.services import (
+    LikeService,
+    ProductService,
+    RecommendationService,
+    SectionSnapshotService,
+)
+from core.utils.conditional_get import (
+    get_not_modified_response,
+    make_etag,
+    set_conditional_headers,
+)
+from core.utils.response_cache import AnonymousResponseCacheMixin
 
 from .public import BaseProductListView
 
@@ -10,16 +24,43 @@ from .public import BaseProductListView
 # ============================================================================
 
 
-class BaseSectionView(BaseProductListView):
+class BaseSectionView(AnonymousResponseCacheMixin, BaseProductListView):
     """섹션 뷰 기본 클래스 - 제목과 함께 응답"""
 
     section_title = ""
 
+    # 지정 시 SectionSnapshotService 스냅샷에서 응답 (캐시 적중 시 SQL 없음)
+    section_type = ""
+
+    def get_surrogate_keys(self, request, *args, **kwargs):
+        return ["catalog", f"section:{self.section_type or self.__class__.__name__}"]
+
     def list(self, request, *args, **kwargs):
+        if self.section_type:
+            snapshot = SectionSnapshotService.get_snapshot(self.section_type)
+            products = snapshot["products"]
+            liked_product_ids = LikeService.get_liked_product_ids(request.user, [product["id"] for product in products])
+
+            # 스냅샷 생성 시각 + 사용자 좋아요 상태가 같으면 직렬화/응답 생성 없이 304
+            etag = make_etag(self.section_type, snapshot["built_at"], *sorted(liked_product_ids))
+            last_modified = datetime.datetime.fromtimestamp(snapshot["built_at"], tz=datetime.timezone.utc)
+            not_modified = get_not_modified_response(request, etag, last_modified, vary_on_auth=True)
+            if not_modified is not None:
+                return not_modified
+
+            # 스냅샷은 사용자와 무관하므로 좋아요 여부는 응답 시 설정
+            products = LikeService.attach_like_state(products, request.user, liked_product_ids)
+            response = Response({"title": self.section_title, "products": products})
+            return set_conditional_headers(response, etag, last_modified, vary_on_auth=True)
+
         queryset = self.get_queryset()
         serializer = self.get_serializer(queryset, many=True)
         return Response({"title": self.section_title, "products": serializer.data})
 
+    def get_queryset(self):
+        limit = SectionSnapshotService.SECTION_LIMITS.get(self.section_type, 8)
+        return ProductService.get_section_products(self.section_type, limit=limit)
+
 
 # ============================================================================
 # 메인페이지 섹션 뷰들
@@ -30,6 +71,7 @@ class MonthlyFeaturedDrinksView(BaseSectionView):
     """이달의 전통주 (TOP 3)"""
 
     section_title = "이달의 전통주"
+    section_type = "monthly"
 
     @extend_schema(
         summary="이달의 전통주",
@@ -39,14 +81,12 @@ class MonthlyFeaturedDrinksView(BaseSectionView):
     def get(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-    def get_queryset(self):
-        return ProductService.get_section_products("monthly", limit=3)
-
 
 class PopularProductsView(BaseSectionView):
     """인기 패키지"""
 
     section_title = "인기 패키지"
+    section_type = "popular"
 
     @extend_schema(
         summary="인기 패키지",
@@ -56,14 +96,12 @@ class PopularProductsView(BaseSectionView):
     def get(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-    def get_queryset(self):
-        return ProductService.get_section_products("popular", limit=8)
-
 
 class RecommendedProductsView(BaseSectionView):
     """추천 전통주"""
 
     section_title = "추천 전통주"
+    section_type = "recommended"
 
     @extend_schema(
         summary="추천 전통주",
@@ -73,8 +111,23 @@ class RecommendedProductsView(BaseSectionView):
     def get(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
+
+class PersonalizedRecommendationView(BaseSectionView):
+    """취향 맞춤 추천"""
+
+    section_title = "취향 맞춤 추천"
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="취향 맞춤 추천",
+        description="로그인 사용자의 취향 프로필과 맛이 가까운 술/패키지 8개를 반환합니다. (이미 주문한 상품 제외, 메인페이지용)",
+        tags=["메인페이지"],
+    )
+    def get(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     def get_queryset(self):
-        return ProductService.get_section_products("recommended", limit=8)
+        return RecommendationService.get_recommended_products(self.request.user, limit=8)
 
 
 # ============================================================================
@@ -86,6 +139,7 @@ class FeaturedProductsView(BaseSectionView):
     """추천 패키지"""
 
     section_title = "추천 패키지"
+    section_type = "featured"
 
     @extend_schema(
         summary="추천 패키지",
@@ -95,14 +149,12 @@ class FeaturedProductsView(BaseSectionView):
     def get(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-    def get_queryset(self):
-        return ProductService.get_section_products("featured", limit=4)
-
 
 class AwardWinningProductsView(BaseSectionView):
     """수상작 패키지"""
 
     section_title = "주류 대상 수상 5종 패키지"
+    section_type = "award_winning"
 
     @extend_schema(
         summary="수상작 패키지",
@@ -112,14 +164,12 @@ class AwardWinningProductsView(BaseSectionView):
     def get(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-    def get_queryset(self):
-        return ProductService.get_section_products("award_winning", limit=4)
-
 
 class MakgeolliProductsView(BaseSectionView):
     """막걸리 패키지"""
 
     section_title = "막걸리 패키지"
+    section_type = "makgeolli"
 
     @extend_schema(
         summary="막걸리 패키지",
@@ -129,14 +179,12 @@ class MakgeolliProductsView(BaseSectionView):
     def get(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-    def get_queryset(self):
-        return ProductService.get_section_products("makgeolli", limit=4)
-
 
 class RegionalProductsView(BaseSectionView):
     """지역 특산주 패키지"""
 
     section_title = "지역 특산주 패키지"
+    section_type = "regional"
 
     @extend_schema(
         summary="지역 특산주 패키지",
@@ -145,6 +193,3 @@ class RegionalProductsView(BaseSectionView):
     )
     def get(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
-
-    def get_queryset(self):
-        return ProductService.get_section_products("regional", limit=4)
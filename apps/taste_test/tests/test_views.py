@@ -247,6 +247,20 @@ class TasteTestAPITest(APITestCase):
         # AllowAny 권한이므로 익명 사용자도 접근 가능
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_static_data_conditional_get(self):
+        """고정 데이터 조회 시 ETag가 같으면 304 응답"""
+        for name in ["taste_test:v1:questions", "taste_test:v1:types"]:
+            url = reverse(name)
+            response = self.client.get(url)
+            etag = response["ETag"]
+
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response["ETag"], etag)
+
+            response = self.client.get(url, HTTP_IF_NONE_MATCH='"stale"')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
 
 class TasteTestViewFlowTest(APITestCase):
     """뷰 플로우 통합 테스트 - 새로운 컨트롤러 패턴"""
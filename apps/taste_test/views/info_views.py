@@ -2,20 +2,38 @@
 정보 조회 관련 뷰 - 단계별 처리 과정 명시
 """
 
+from typing import Optional
+
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.utils.conditional_get import (
+    get_not_modified_response,
+    make_content_etag,
+    set_conditional_headers,
+)
+from core.utils.response_cache import AnonymousResponseCacheMixin
+
 from ..services.controller_support import ControllerService
 
 
-class TasteTypesView(APIView):
+class TasteTypesView(AnonymousResponseCacheMixin, APIView):
     """취향 유형 목록 조회"""
 
     permission_classes = [AllowAny]
 
+    # 고정 데이터이므로 프로세스당 한 번만 계산
+    _etag: Optional[str] = None
+
+    # 코드에 정의된 고정 데이터 - 배포 후 이전 응답이 남지 않도록 1시간만 보관
+    response_cache_timeout = 60 * 60
+
+    def get_surrogate_keys(self, request, *args, **kwargs):
+        return ["taste_test"]
+
     @extend_schema(
         summary="취향 유형 목록",
         description="9가지 취향 유형의 상세 정보를 조회합니다",
@@ -23,8 +41,15 @@ class TasteTypesView(APIView):
     )
     def get(self, request):
         """취향 유형 목록 조회"""
-        # 1. 서비스에서 취향 유형 데이터 조회 (이미지 URL 포함 처리)
+        # 1. 클라이언트가 최신 데이터를 가지고 있으면 304 반환
+        if TasteTypesView._etag is None:
+            TasteTypesView._etag = make_content_etag(ControllerService.get_taste_types_data())
+        not_modified = get_not_modified_response(request, TasteTypesView._etag)
+        if not_modified is not None:
+            return not_modified
+
+        # 2. 서비스에서 취향 유형 데이터 조회 (이미지 URL 포함 처리)
         taste_types_data = ControllerService.get_taste_types_data()
 
-        # 2. 응답 반환
-        return Response(taste_types_data, status=status.HTTP_200_OK)
+        # 3. 응답 반환
+        return set_conditional_headers(Response(taste_types_data, status=status.HTTP_200_OK), TasteTypesView._etag)
@@ -2,12 +2,21 @@
 취향 테스트 관련 뷰 - 단계별 처리 과정 명시
 """
 
+from typing import Optional
+
 from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.utils.conditional_get import (
+    get_not_modified_response,
+    make_content_etag,
+    set_conditional_headers,
+)
+from core.utils.response_cache import AnonymousResponseCacheMixin
+
 from ..models import PreferenceTestResult
 from ..serializers import (
     TasteTestAnswersSerializer,
@@ -16,11 +25,20 @@ from ..serializers import (
 from ..services.controller_support import ControllerService
 
 
-class TasteTestQuestionsView(APIView):
+class TasteTestQuestionsView(AnonymousResponseCacheMixin, APIView):
     """취향 테스트 질문 목록 조회"""
 
     permission_classes = [AllowAny]
 
+    # 고정 데이터이므로 프로세스당 한 번만 계산
+    _etag: Optional[str] = None
+
+    # 코드에 정의된 고정 데이터 - 배포 후 이전 응답이 남지 않도록 1시간만 보관
+    response_cache_timeout = 60 * 60
+
+    def get_surrogate_keys(self, request, *args, **kwargs):
+        return ["taste_test"]
+
     @extend_schema(
         summary="테스트 질문 목록",
         description="취향 테스트용 6개 질문을 반환합니다",
@@ -28,11 +46,18 @@ class TasteTestQuestionsView(APIView):
     )
     def get(self, request):
         """질문 목록 조회"""
-        # 1. 서비스에서 질문 데이터 조회
+        # 1. 클라이언트가 최신 데이터를 가지고 있으면 304 반환
+        if TasteTestQuestionsView._etag is None:
+            TasteTestQuestionsView._etag = make_content_etag(ControllerService.get_test_questions())
+        not_modified = get_not_modified_response(request, TasteTestQuestionsView._etag)
+        if not_modified is not None:
+            return not_modified
+
+        # 2. 서비스에서 질문 데이터 조회
         questions = ControllerService.get_test_questions()
 
-        # 2. 응답 반환
-        return Response(questions, status=status.HTTP_200_OK)
+        # 3. 응답 반환
+        return set_conditional_headers(Response(questions, status=status.HTTP_200_OK), TasteTestQuestionsView._etag)
 
 
 class TasteTestSubmitView(APIView):
@@ -26,6 +26,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 CUSTOM_APPS = [
@@ -117,6 +118,9 @@ CACHES = {
     }
 }
 
+# 카탈로그 스냅샷 파일 경로 (같은 서버의 워커들이 mmap으로 공유 - tmpfs 경로 권장)
+CATALOG_SNAPSHOT_DIR = os.getenv("CATALOG_SNAPSHOT_DIR", str(BASE_DIR / "var" / "catalog_snapshot"))
+
 # OAuth State 설정
 OAUTH_STATE_EXPIRE_SECONDS = 300  # 5분
 
@@ -14,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.prod")
 
 application = get_wsgi_application()
+
+# 워커 시작 시 자동완성 색인을 백그라운드에서 미리 생성 (요청 처리 중 DB 전체 조회 방지)
+from apps.products.services.autocomplete_service import (  # noqa: E402
+    AutocompleteService,
+)
+
+AutocompleteService.rebuild_in_background()
@@ -0,0 +1,94 @@
+# core/utils/conditional_get.py
+
+import datetime
+import hashlib
+import json
+from typing import Any, Optional
+
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    검증값 조각들로 ETag 생성 (따옴표 포함)
+
+    Args:
+        parts: ETag에 반영할 값들 (버전, 수정 시각, 사용자별 상태 등)
+
+    Returns:
+        str: 강한 ETag (예: "3f2a...")
+    """
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def make_content_etag(data: Any) -> str:
+    """
+    고정 데이터(상수 응답)의 내용 해시로 ETag 생성
+
+    Args:
+        data: JSON 직렬화 가능한 응답 데이터
+
+    Returns:
+        str: 강한 ETag
+    """
+    return make_etag(json.dumps(data, ensure_ascii=False, sort_keys=True, default=str))
+
+
+def get_not_modified_response(
+    request: HttpRequest,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime.datetime] = None,
+    vary_on_auth: bool = False,
+) -> Optional[HttpResponseBase]:
+    """
+    조건부 요청(If-None-Match/If-Modified-Since) 검사
+
+    클라이언트가 가진 응답이 최신이면 304 응답을 반환하므로,
+    뷰는 ORM 조회/직렬화 전에 이 함수를 호출하고 결과가 있으면 그대로 반환합니다.
+
+    Args:
+        request: 현재 요청
+        etag: 현재 응답의 ETag
+        last_modified: 현재 응답의 최종 수정 시각
+        vary_on_auth: 사용자별 상태(좋아요 여부 등)가 포함된 응답이면 True
+
+    Returns:
+        Optional[HttpResponse]: 304 응답 (최신이 아니면 None)
+    """
+    if request.method not in ("GET", "HEAD"):
+        return None
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_conditional_headers(response, etag, last_modified, vary_on_auth)
+    return response
+
+
+def set_conditional_headers(
+    response: HttpResponseBase,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime.datetime] = None,
+    vary_on_auth: bool = False,
+) -> HttpResponseBase:
+    """
+    응답에 ETag/Last-Modified 헤더 설정
+
+    Args:
+        response: 응답 객체
+        etag: ETag
+        last_modified: 최종 수정 시각
+        vary_on_auth: 사용자별 상태(좋아요 여부 등)가 포함된 응답이면 True
+
+    Returns:
+        HttpResponse: 헤더가 설정된 응답
+    """
+    if etag:
+        response.headers["ETag"] = etag
+    if last_modified:
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+    if vary_on_auth:
+        patch_vary_headers(response, ["Authorization"])
+    return response
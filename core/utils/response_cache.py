@@ -0,0 +1,242 @@
+# core/utils/response_cache.py
+
+import hashlib
+import logging
+from functools import partial
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    비로그인 GET 응답 캐시 (렌더링된 바이트를 Redis에 저장)
+
+    각 응답은 서로게이트 키(예: "product:<uuid>", "section:popular", "catalog")로 태그되며,
+    모델 변경 시그널에서 purge_on_commit(키)를 호출하면 커밋 후 해당 키가 붙은 응답이 모두 삭제됩니다.
+
+    - 응답: {KEY_PREFIX}:entry:<요청 해시> 해시 (status/content_type/etag/content)
+    - 태그: {KEY_PREFIX}:tag:<서로게이트 키> 집합 (응답 키 목록)
+    """
+
+    KEY_PREFIX = "response_cache"
+
+    # 응답에 함께 저장/복원할 헤더
+    STORED_HEADERS = ["ETag", "Last-Modified"]
+
+    @staticmethod
+    def _redis():
+        return get_redis_connection("default")
+
+    @staticmethod
+    def _tag_key(surrogate_key: str) -> str:
+        return f"{ResponseCache.KEY_PREFIX}:tag:{surrogate_key}"
+
+    @staticmethod
+    def get_entry_key(request: HttpRequest) -> str:
+        """
+        요청 캐시 키 (경로 + 정렬된 쿼리 파라미터)
+
+        Args:
+            request: 현재 요청
+
+        Returns:
+            str: 응답 캐시 키
+        """
+        query = "&".join(f"{key}={value}" for key, value in sorted(request.GET.items()))
+        digest = hashlib.sha1(f"{request.path}?{query}".encode()).hexdigest()
+        return f"{ResponseCache.KEY_PREFIX}:entry:{digest}"
+
+    @staticmethod
+    def is_cacheable_request(request: HttpRequest) -> bool:
+        """
+        캐시 대상 요청 여부 (인증 정보가 없는 JSON GET 요청)
+
+        Args:
+            request: 현재 요청 (DRF 인증 전 Django 요청)
+
+        Returns:
+            bool: 캐시 대상이면 True
+        """
+        return (
+            request.method == "GET"
+            and "HTTP_AUTHORIZATION" not in request.META
+            and settings.SESSION_COOKIE_NAME not in request.COOKIES
+            # 테스트 클라이언트의 force_authenticate 요청
+            and getattr(request, "_force_auth_user", None) is None
+            # 브라우저블 API(HTML) 응답은 캐시하지 않음
+            and "text/html" not in request.META.get("HTTP_ACCEPT", "")
+        )
+
+    @staticmethod
+    def get(request: HttpRequest) -> Optional[HttpResponse]:
+        """
+        캐시된 응답 조회 (If-None-Match가 일치하면 304)
+
+        Args:
+            request: 현재 요청
+
+        Returns:
+            Optional[HttpResponse]: 캐시된 응답 (없으면 None)
+        """
+        try:
+            entry = ResponseCache._redis().hgetall(ResponseCache.get_entry_key(request))
+        except RedisError:
+            logger.warning("응답 캐시 조회 실패", exc_info=True)
+            return None
+        if not entry:
+            return None
+
+        response = HttpResponse(
+            entry[b"content"], status=int(entry[b"status"]), content_type=entry[b"content_type"].decode()
+        )
+        for header in ResponseCache.STORED_HEADERS:
+            value = entry.get(header.lower().encode())
+            if value:
+                response.headers[header] = value.decode()
+        response.headers["X-Cache"] = "HIT"
+        return get_conditional_response(request, etag=response.headers.get("ETag"), response=response)
+
+    @staticmethod
+    def set(request: HttpRequest, response, surrogate_keys: Iterable[str], timeout: int) -> None:
+        """
+        렌더링된 응답 저장 및 서로게이트 키 태그
+
+        Args:
+            request: 현재 요청
+            response: 렌더링된 200 응답
+            surrogate_keys: 응답에 붙일 서로게이트 키 목록
+            timeout: 보관 시간 (초)
+        """
+        entry_key = ResponseCache.get_entry_key(request)
+        mapping = {
+            "status": response.status_code,
+            "content_type": response.headers.get("Content-Type", "application/json"),
+            "content": response.content,
+        }
+        for header in ResponseCache.STORED_HEADERS:
+            if header in response.headers:
+                mapping[header.lower()] = response.headers[header]
+
+        try:
+            pipeline = ResponseCache._redis().pipeline()
+            pipeline.delete(entry_key)
+            pipeline.hset(entry_key, mapping=mapping)
+            pipeline.expire(entry_key, timeout)
+            for surrogate_key in surrogate_keys:
+                tag_key = ResponseCache._tag_key(surrogate_key)
+                pipeline.sadd(tag_key, entry_key)
+                # 태그 집합은 응답보다 오래 유지 (만료된 응답 키는 purge 시 무시됨)
+                pipeline.expire(tag_key, timeout * 2)
+            pipeline.execute()
+        except RedisError:
+            logger.warning("응답 캐시 저장 실패", exc_info=True)
+
+    @staticmethod
+    def purge(*surrogate_keys: str) -> int:
+        """
+        서로게이트 키가 붙은 응답 모두 삭제
+
+        Args:
+            surrogate_keys: 삭제할 서로게이트 키들
+
+        Returns:
+            int: 삭제된 응답 수
+        """
+        if not surrogate_keys:
+            return 0
+        tag_keys = [ResponseCache._tag_key(surrogate_key) for surrogate_key in surrogate_keys]
+        try:
+            redis = ResponseCache._redis()
+            entry_keys = redis.sunion(tag_keys)
+            pipeline = redis.pipeline()
+            if entry_keys:
+                pipeline.delete(*entry_keys)
+            pipeline.delete(*tag_keys)
+            deleted = pipeline.execute()
+        except RedisError:
+            logger.warning("응답 캐시 삭제 실패", exc_info=True)
+            return 0
+        return deleted[0] if entry_keys else 0
+
+    @staticmethod
+    def purge_on_commit(*surrogate_keys: str) -> None:
+        """
+        커밋 후 서로게이트 키 purge (커밋 전 데이터가 다시 캐시되지 않도록 모델 변경 시그널에서 사용)
+
+        Args:
+            surrogate_keys: 삭제할 서로게이트 키들
+        """
+        transaction.on_commit(partial(ResponseCache.purge, *surrogate_keys))
+
+
+class AnonymousResponseCacheMixin:
+    """
+    비로그인 GET 응답 캐시 뷰 믹스인 (APIView 앞에 위치)
+
+    캐시 적중 시 인증/권한/ORM/직렬화/렌더링 없이 저장된 바이트를 응답합니다.
+    하위 클래스는 get_surrogate_keys()에서 응답이 의존하는 데이터의 서로게이트 키를 반환합니다.
+    """
+
+    # 응답 보관 시간 (초) - nginx/브라우저 캐시의 max-age로도 사용
+    response_cache_timeout = 60
+
+    def get_surrogate_keys(self, request, *args, **kwargs) -> List[str]:
+        """응답에 붙일 서로게이트 키 목록"""
+        return []
+
+    def is_response_cacheable(self, request, *args, **kwargs) -> bool:
+        """뷰별 추가 캐시 조건 (ViewSet의 특정 액션만 캐시하는 경우 등)"""
+        return True
+
+    def on_response_cache_hit(self, request, *args, **kwargs) -> None:
+        """캐시 적중 시 처리 (조회수 증가 등 응답과 무관한 부수 효과)"""
+
+    def dispatch(self, request, *args, **kwargs):
+        cacheable = ResponseCache.is_cacheable_request(request) and self.is_response_cacheable(request, *args, **kwargs)
+        if cacheable:
+            cached = ResponseCache.get(request)
+            if cached is not None:
+                self.on_response_cache_hit(request, *args, **kwargs)
+                return self._patch_cache_headers(cached, public=True)
+
+        response = super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+
+        # 인증 헤더 없이 인증된 요청(다른 인증 방식)의 응답은 저장하지 않음
+        user = getattr(getattr(self, "request", None), "user", None)
+        if user is not None and user.is_authenticated:
+            cacheable = False
+
+        if cacheable and response.status_code == 200:
+            if hasattr(response, "render"):
+                response.render()
+            ResponseCache.set(
+                request,
+                response,
+                self.get_surrogate_keys(request, *args, **kwargs),
+                self.response_cache_timeout,
+            )
+            response.headers["X-Cache"] = "MISS"
+        if request.method != "GET":
+            return response
+        return self._patch_cache_headers(response, public=cacheable and response.status_code == 200)
+
+    def _patch_cache_headers(self, response, public: bool):
+        # 인증 정보에 따라 응답이 달라지므로 공유 캐시는 Authorization/Cookie별로 구분
+        patch_vary_headers(response, ["Authorization", "Cookie"])
+        if public:
+            patch_cache_control(response, public=True, max_age=self.response_cache_timeout)
+        else:
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
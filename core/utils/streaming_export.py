@@ -0,0 +1,107 @@
+# core/utils/streaming_export.py
+
+import csv
+import datetime
+import json
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, List, Sequence
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+# 서버 측 커서에서 한 번에 가져올 행 수 (.iterator(chunk_size=...))
+EXPORT_CHUNK_SIZE = 2000
+
+# 엑셀에서 UTF-8 CSV의 한글이 깨지지 않도록 붙이는 BOM
+UTF8_BOM = "\ufeff"
+
+# CSV 셀 안의 목록 값 구분자 (카탈로그 일괄 등록 CSV와 동일)
+CSV_LIST_SEPARATOR = "|"
+
+# 스프레드시트가 수식으로 해석하는 셀 시작 문자 (CSV 수식 주입 방지 - 앞에 작은따옴표를 붙여 문자열로 표시)
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson; charset=utf-8",
+}
+
+
+class _Echo:
+    """csv.writer가 쓴 줄을 그대로 반환하는 의사 버퍼 (줄 단위 스트리밍용)"""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _format_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return timezone.localtime(value).isoformat() if timezone.is_aware(value) else value.isoformat()
+    if isinstance(value, (datetime.date, Decimal)):
+        return str(value)
+    return value
+
+
+def _format_csv_cell(value: Any) -> Any:
+    if isinstance(value, list):
+        value = CSV_LIST_SEPARATOR.join(map(str, value))
+    elif not isinstance(value, str):
+        # 숫자/날짜 값(음수 포함)은 그대로
+        return _format_value(value)
+    if value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def iter_export_lines(columns: Sequence[str], rows: Iterable[Sequence[Any]], file_format: str) -> Iterator[str]:
+    """
+    행을 CSV/JSONL 줄로 변환 (한 줄씩 생성 - 전체 결과를 메모리에 올리지 않음)
+
+    CSV는 스프레드시트에서 열리므로 수식으로 시작하는 문자열 셀 앞에 작은따옴표를 붙입니다.
+
+    Args:
+        columns: 컬럼명 목록 (CSV 헤더 / JSONL 키)
+        rows: 행 값 튜플 (values_list(...).iterator() 등)
+        file_format: "csv" 또는 "jsonl"
+
+    Returns:
+        Iterator[str]: 출력 줄
+    """
+    if file_format == "csv":
+        writer = csv.writer(_Echo())
+        yield UTF8_BOM + writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow([_format_csv_cell(value) for value in row])
+        return
+
+    for row in rows:
+        record = {column: _format_value(value) for column, value in zip(columns, row)}
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def streaming_export_response(
+    filename: str, columns: List[str], rows: Iterable[Sequence[Any]], file_format: str
+) -> StreamingHttpResponse:
+    """
+    내보내기 파일 스트리밍 응답
+
+    Args:
+        filename: 파일명 (확장자/시각 제외, 예: "orders")
+        columns: 컬럼명 목록
+        rows: 행 값 튜플 (지연 평가되는 iterator)
+        file_format: "csv" 또는 "jsonl"
+
+    Returns:
+        StreamingHttpResponse: 첨부 파일 응답
+    """
+    response = StreamingHttpResponse(
+        iter_export_lines(columns, rows, file_format), content_type=CONTENT_TYPES[file_format]
+    )
+    timestamp = timezone.localtime().strftime("%Y%m%d-%H%M%S")
+    response["Content-Disposition"] = f'attachment; filename="{filename}-{timestamp}.{file_format}"'
+    response["Cache-Control"] = "no-store"
+    # nginx가 응답 전체를 버퍼링하지 않고 바로 전달하도록
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,274 @@
+# core/utils/write_behind_counter.py
+
+import logging
+import uuid
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from django.db import connection, transaction
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# pending 해시를 반영별 flushing 키로 옮기고 반영 중인 키 목록에 등록 (KEYS: pending, flushing, 목록)
+_CLAIM_PENDING = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('RENAME', KEYS[1], KEYS[2])
+redis.call('SADD', KEYS[3], KEYS[2])
+return 1
+"""
+
+# 반영 잠금을 가진 경우에만 flushing 키 삭제 (KEYS: 잠금, flushing, 목록 / ARGV: 잠금 토큰)
+_FINISH_FLUSHING = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[2])
+redis.call('SREM', KEYS[3], KEYS[2])
+return 1
+"""
+
+# 잠금 토큰이 같을 때만 잠금 해제
+_RELEASE_LOCK = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# PK별 증가분 합계 (pending 해시 + 반영 중인 모든 flushing 키)
+_SUM_PENDING = """
+local flushing_keys = redis.call('SMEMBERS', KEYS[2])
+local result = {}
+for index, pk in ipairs(ARGV) do
+    local total = tonumber(redis.call('HGET', KEYS[1], pk) or 0)
+    for _, key in ipairs(flushing_keys) do
+        total = total + tonumber(redis.call('HGET', key, pk) or 0)
+    end
+    result[index] = total
+end
+return result
+"""
+
+
+class FlushLockLost(Exception):
+    """반영 도중 잠금을 잃음 (다른 반영이 같은 증가분을 처리하므로 이번 반영은 롤백)"""
+
+
+class WriteBehindCounter:
+    """
+    쓰기 지연(write-behind) 카운터
+
+    조회수처럼 자주 증가하는 카운터를 요청마다 UPDATE 하지 않고 Redis 해시에 누적(HINCRBY)한 뒤,
+    주기적으로 UPDATE ... FROM (VALUES ...) 한 번에 모아서 DB에 반영합니다.
+
+    - 반영 전 증가분은 pending()/overlay()로 조회 값에 더해서 보여줍니다.
+    - 반영은 flush()로 수행합니다. (manage.py flush_view_counters - 운영에서는 counter-flusher 컨테이너가 주기 실행)
+    - 반영은 잠금을 가진 한 곳에서만 수행하며, 같은 증가분이 두 번 반영되지 않습니다.
+    - Redis 장애 시 증가는 DB에 바로 반영하고, 조회 시 증가분은 0으로 봅니다.
+    """
+
+    # 등록된 카운터들 (flush_view_counters 명령어에서 일괄 반영)
+    registry: Dict[str, "WriteBehindCounter"] = {}
+
+    KEY_PREFIX = "counters"
+
+    # 반영 잠금 유지 시간 (초) - 반영이 이보다 오래 걸리면 잠금을 잃고 롤백
+    FLUSH_LOCK_TIMEOUT = 60
+
+    # UPDATE 한 번에 반영할 행 수
+    FLUSH_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        name: str,
+        model,
+        field: str,
+        extra_assignments: Optional[List[str]] = None,
+        on_flush: Optional[Callable[[Dict[str, int]], None]] = None,
+    ):
+        """
+        Args:
+            name: 카운터 이름 (Redis 키 구분용)
+            model: 카운터 컬럼이 있는 모델
+            field: 증가시킬 필드명
+            extra_assignments: 반영 시 함께 실행할 SET 구문 (예: ["last_viewed_at = NOW()"])
+            on_flush: DB 반영 직후 PK(문자열)별 반영량으로 호출할 함수 (카운터 값을 들고 있는 캐시 갱신용)
+        """
+        self.name = name
+        self.model = model
+        self.field = field
+        self.extra_assignments = extra_assignments or []
+        self.on_flush = on_flush
+
+        self.pending_key = f"{self.KEY_PREFIX}:{name}:pending"
+        # 반영 중인 flushing 키 목록 (반영마다 flushing:<토큰> 키 사용)
+        self.flushing_set_key = f"{self.KEY_PREFIX}:{name}:flushing"
+        self.flush_lock_key = f"{self.KEY_PREFIX}:{name}:flush_lock"
+
+        WriteBehindCounter.registry[name] = self
+
+    @staticmethod
+    def _redis():
+        return get_redis_connection("default")
+
+    # ------------------------------------------------------------------------
+    # 증가 / 조회
+    # ------------------------------------------------------------------------
+
+    def increment(self, pk: Any, amount: int = 1) -> None:
+        """
+        카운터 증가 (Redis에만 기록, DB 반영은 flush()에서 일괄 처리)
+
+        Redis 장애 시에는 이 행만 바로 UPDATE 합니다.
+
+        Args:
+            pk: 대상 객체 PK
+            amount: 증가량
+        """
+        try:
+            self._redis().hincrby(self.pending_key, str(pk), amount)
+        except RedisError:
+            logger.warning("카운터 누적 실패, DB에 바로 반영: %s", self.name, exc_info=True)
+            self._apply([(str(pk), amount)])
+            if self.on_flush is not None:
+                transaction.on_commit(partial(self.on_flush, {str(pk): amount}), robust=True)
+
+    def pending(self, pks: Iterable[Any]) -> Dict[str, int]:
+        """
+        아직 DB에 반영되지 않은 증가분 조회
+
+        Args:
+            pks: 대상 객체 PK 목록
+
+        Returns:
+            Dict[str, int]: PK(문자열)별 증가분 (증가분이 없는 PK는 제외)
+        """
+        keys = [str(pk) for pk in pks]
+        if not keys:
+            return {}
+
+        try:
+            redis = self._redis()
+            totals = redis.register_script(_SUM_PENDING)(keys=[self.pending_key, self.flushing_set_key], args=keys)
+        except RedisError:
+            # 증가분을 알 수 없으면 DB 값 그대로 응답
+            logger.warning("카운터 증가분 조회 실패: %s", self.name, exc_info=True)
+            return {}
+        return {key: int(total) for key, total in zip(keys, totals) if int(total)}
+
+    def overlay(self, instance) -> None:
+        """
+        객체의 카운터 값에 반영 대기 중인 증가분을 더함 (메모리상 값만 변경)
+
+        Args:
+            instance: 대상 모델 객체
+        """
+        delta = self.pending([instance.pk]).get(str(instance.pk), 0)
+        if delta:
+            setattr(instance, self.field, getattr(instance, self.field) + delta)
+
+    # ------------------------------------------------------------------------
+    # DB 반영
+    # ------------------------------------------------------------------------
+
+    def flush(self) -> int:
+        """
+        누적된 증가분을 DB에 일괄 반영
+
+        반영 잠금(토큰)을 가진 경우에만 수행합니다. pending 해시를 반영별 flushing 키로 옮긴(RENAME) 뒤
+        반영하므로, 반영 중 들어오는 증가분은 새 pending 해시에 쌓입니다.
+        이전 반영이 중단되어 남은 flushing 키가 있으면 그것부터 처리합니다.
+
+        Returns:
+            int: 반영된 객체 수
+        """
+        redis = self._redis()
+        token = uuid.uuid4().hex
+        if not redis.set(self.flush_lock_key, token, nx=True, ex=self.FLUSH_LOCK_TIMEOUT):
+            # 다른 곳에서 반영 중
+            return 0
+
+        try:
+            flushing_keys = sorted(key.decode() for key in redis.smembers(self.flushing_set_key))
+            flushing_key = f"{self.flushing_set_key}:{token}"
+            claimed = redis.register_script(_CLAIM_PENDING)(
+                keys=[self.pending_key, flushing_key, self.flushing_set_key]
+            )
+            if claimed:
+                flushing_keys.append(flushing_key)
+            return sum(self._flush_key(redis, key, token) for key in flushing_keys)
+        finally:
+            redis.register_script(_RELEASE_LOCK)(keys=[self.flush_lock_key], args=[token])
+
+    def _flush_key(self, redis, flushing_key: str, token: str) -> int:
+        """
+        flushing 키 하나를 DB에 반영
+
+        DB 커밋 직전에 (잠금을 가진 경우에만) flushing 키를 삭제합니다.
+        삭제 전에 중단되면 DB도 롤백되어 다음 반영에서 다시 처리하고, 삭제 후에는 다시 처리되지 않습니다.
+
+        Returns:
+            int: 반영된 객체 수 (실패 시 0 - flushing 키는 남아서 다음 반영에서 재시도)
+        """
+        deltas = {key.decode(): int(value) for key, value in redis.hgetall(flushing_key).items() if int(value)}
+        finish = redis.register_script(_FINISH_FLUSHING)
+        finished = False
+
+        try:
+            with transaction.atomic():
+                items = list(deltas.items())
+                for start in range(0, len(items), self.FLUSH_BATCH_SIZE):
+                    self._apply(items[start : start + self.FLUSH_BATCH_SIZE])
+                if not finish(keys=[self.flush_lock_key, flushing_key, self.flushing_set_key], args=[token]):
+                    raise FlushLockLost(flushing_key)
+                finished = True
+        except Exception:
+            logger.exception("카운터 반영 실패: %s", self.name)
+            if finished:
+                # flushing 키 삭제 후 커밋 실패 - 증가분을 pending 해시로 되돌림
+                pipeline = redis.pipeline()
+                for key, delta in deltas.items():
+                    pipeline.hincrby(self.pending_key, key, delta)
+                pipeline.execute()
+            return 0
+
+        if self.on_flush is not None:
+            try:
+                self.on_flush(deltas)
+            except Exception:
+                logger.exception("카운터 반영 후처리 실패: %s", self.name)
+
+        return len(deltas)
+
+    def _apply(self, items: List[tuple]) -> None:
+        """UPDATE ... FROM (VALUES ...) 한 번으로 증가분 반영"""
+        meta = self.model._meta
+        table = connection.ops.quote_name(meta.db_table)
+        pk_column = connection.ops.quote_name(meta.pk.column)
+        column = connection.ops.quote_name(meta.get_field(self.field).column)
+        pk_type = meta.pk.db_type(connection)
+
+        values_sql = ", ".join([f"(%s::{pk_type}, %s::integer)"] * len(items))
+        assignments = ", ".join([f"{column} = {table}.{column} + v.delta", *self.extra_assignments])
+        params = [value for item in items for value in item]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET {assignments} FROM (VALUES {values_sql}) AS v(pk, delta) "
+                f"WHERE {table}.{pk_column} = v.pk",
+                params,
+            )
+
+    @classmethod
+    def flush_all(cls) -> Dict[str, int]:
+        """
+        등록된 모든 카운터 반영
+
+        Returns:
+            Dict[str, int]: 카운터별 반영된 객체 수
+        """
+        return {name: counter.flush() for name, counter in cls.registry.items()}